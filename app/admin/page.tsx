@@ -13,9 +13,9 @@ import { Label } from "@/components/ui/label"
 import { Badge } from "@/components/ui/badge"
 import { Separator } from "@/components/ui/separator"
 import { Alert, AlertDescription } from "@/components/ui/alert"
-import { Shield, Settings, DollarSign, Clock, Wallet, AlertTriangle, Loader2 } from "lucide-react"
+import { Shield, Settings, DollarSign, Clock, Wallet, AlertTriangle, Loader2, Zap } from "lucide-react"
 import { getStats } from "@/lib/genlayer"
-import { updateMinStake, updatePlatformFee, updateTreasury, updateEvidencePeriodBlocks, updateAppealPeriodBlocks, withdrawFees } from "@/lib/admin-actions"
+import { updateMinStake, updatePlatformFee, updateTreasury, updateEvidencePeriodBlocks, updateAppealPeriodBlocks, updateFastTrackMaxStake, updateFastTrackUncontested, withdrawFees } from "@/lib/admin-actions"
 import { toast } from "sonner"
 
 export default function AdminPage() {
@@ -29,6 +29,7 @@ export default function AdminPage() {
   const [treasury, setTreasury] = useState("")
   const [evidencePeriod, setEvidencePeriod] = useState("")
   const [appealPeriod, setAppealPeriod] = useState("")
+  const [fastTrackMaxStake, setFastTrackMaxStake] = useState("")
   const [withdrawAmount, setWithdrawAmount] = useState("")
   
   const [updating, setUpdating] = useState(false)
@@ -48,6 +49,7 @@ export default function AdminPage() {
         setTreasury(result.stats.treasury)
         setEvidencePeriod(result.stats.evidence_period_blocks.toString())
         setAppealPeriod(result.stats.appeal_period_blocks.toString())
+        setFastTrackMaxStake(result.stats.fast_track_max_stake.toString())
       }
     } catch (error) {
       console.error('Failed to load stats:', error)
@@ -131,6 +133,35 @@ export default function AdminPage() {
     setUpdating(false)
   }
 
+  async function handleUpdateFastTrackMaxStake() {
+    setUpdating(true)
+    toast.loading("Updating fast-track stake limit...", { id: "update" })
+    
+    const result = await updateFastTrackMaxStake(parseInt(fastTrackMaxStake))
+    if (result.success) {
+      toast.success("Fast-track stake limit updated", { id: "update" })
+      await loadStats()
+    } else {
+      toast.error("Failed to update", { id: "update", description: result.error })
+    }
+    setUpdating(false)
+  }
+
+  async function handleToggleFastTrackUncontested() {
+    const enabled = !stats?.fast_track_uncontested
+    setUpdating(true)
+    toast.loading(`${enabled ? "Enabling" : "Disabling"} uncontested fast track...`, { id: "update" })
+    
+    const result = await updateFastTrackUncontested(enabled)
+    if (result.success) {
+      toast.success(`Uncontested fast track ${enabled ? "enabled" : "disabled"}`, { id: "update" })
+      await loadStats()
+    } else {
+      toast.error("Failed to update", { id: "update", description: result.error })
+    }
+    setUpdating(false)
+  }
+
   async function handleWithdrawFees() {
     if (!withdrawAmount || parseFloat(withdrawAmount) <= 0) {
       toast.error("Enter valid withdrawal amount")
@@ -224,6 +255,13 @@ export default function AdminPage() {
               <Label className="text-xs text-muted-foreground">Appeal Period</Label>
               <p className="text-2xl font-bold">{stats?.appeal_period_blocks || 0} blocks</p>
             </div>
+            <div className="space-y-1">
+              <Label className="text-xs text-muted-foreground">Fast Track</Label>
+              <p className="text-2xl font-bold">
+                {stats?.fast_track_max_stake ? `≤ ${stats.fast_track_max_stake} tokens` : "Off"}
+                {stats?.fast_track_uncontested ? " + uncontested" : ""}
+              </p>
+            </div>
             <div className="space-y-1">
               <Label className="text-xs text-muted-foreground">Treasury Address</Label>
               <p className="text-sm font-mono">{stats?.treasury ? `${stats.treasury.slice(0, 6)}...${stats.treasury.slice(-4)}` : 'N/A'}</p>
@@ -368,6 +406,63 @@ export default function AdminPage() {
             </Button>
           </CardContent>
         </Card>
+
+        {/* Fast Track */}
+        <Card className="md:col-span-2">
+          <CardHeader>
+            <CardTitle className="text-base flex items-center gap-2">
+              <Zap className="h-4 w-4" />
+              Fast Track
+            </CardTitle>
+            <CardDescription>
+              Fast-tracked disputes skip web fetches and get a shorter opinion; appealed disputes always get the full review
+            </CardDescription>
+          </CardHeader>
+          <CardContent className="grid gap-4 md:grid-cols-2">
+            <div className="space-y-4">
+              <div className="space-y-2">
+                <Label htmlFor="fastTrackMaxStake">Max Stake (tokens, 0 = off)</Label>
+                <Input
+                  id="fastTrackMaxStake"
+                  type="number"
+                  value={fastTrackMaxStake}
+                  onChange={(e) => setFastTrackMaxStake(e.target.value)}
+                  placeholder="0"
+                  disabled={updating}
+                  min="0"
+                  max="1000"
+                />
+              </div>
+              <Button 
+                onClick={handleUpdateFastTrackMaxStake} 
+                disabled={updating || !fastTrackMaxStake}
+                className="w-full"
+              >
+                {updating && <Loader2 className="h-4 w-4 mr-2 animate-spin" />}
+                Update Fast-Track Stake Limit
+              </Button>
+            </div>
+            <div className="space-y-4">
+              <div className="space-y-2">
+                <Label>Uncontested Disputes</Label>
+                <p className="text-sm text-muted-foreground">
+                  {stats?.fast_track_uncontested
+                    ? "Enabled: disputes the defendant submitted no evidence for take the fast track"
+                    : "Disabled: uncontested disputes get the full review"}
+                </p>
+              </div>
+              <Button 
+                onClick={handleToggleFastTrackUncontested} 
+                disabled={updating || !stats}
+                className="w-full"
+                variant="outline"
+              >
+                {updating && <Loader2 className="h-4 w-4 mr-2 animate-spin" />}
+                {stats?.fast_track_uncontested ? "Disable" : "Enable"} Uncontested Fast Track
+              </Button>
+            </div>
+          </CardContent>
+        </Card>
       </div>
 
       {/* Treasury Management */}
@@ -0,0 +1 @@
+"""Offline benchmarks for contracts/JusticeOracle.py on the genlayer_local runtime"""
@@ -0,0 +1,183 @@
+#!/usr/bin/env python3
+"""
+Justice Oracle - Contract Scaling Benchmarks
+Measures read and write paths at growing state sizes on the local runtime
+
+Usage:
+    python3 -m benchmarks.contract_scaling --sizes 1000 10000 100000
+    python3 -m benchmarks.contract_scaling --compare before.json after.json
+"""
+
+import argparse
+import json
+import random
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+from genlayer_local import Runtime, ScriptedLLM, StaticWeb, load_contract
+
+ADMIN = "0x" + "11" * 20
+PLAINTIFF = "0x" + "aa" * 20
+DEFENDANT = "0x" + "bb" * 20
+CASE_DESCRIPTION = (
+    "Contractor delivered the agreed website three weeks late with broken mobile "
+    "navigation, missing admin panel and no payment integration."
+)
+EVIDENCE_URLS = ["https://example.com/contract", "https://example.com/qa-report"]
+EVIDENCE_CONTENT = "QA report lists twelve critical defects found on delivery. " * 8
+
+RESULTS_DIR = Path(__file__).resolve().parent / "results"
+
+
+class Bench:
+    """Populated contract plus a timer that records per-call runtime counters"""
+
+    def __init__(self, size: int, seed: int):
+        self.size = size
+        self.rng = random.Random(seed)
+        self.module = load_contract()
+        self.runtime = Runtime(llm=ScriptedLLM(), web=StaticWeb())
+        self.oracle = self.runtime.deploy(self.module.JusticeOracle, sender=ADMIN)
+        self.admin = self.runtime.bind(self.oracle, ADMIN)
+        self.plaintiff = self.runtime.bind(self.oracle, PLAINTIFF)
+        # Keep every dispute open for evidence while the state is being built
+        self.admin.update_evidence_period_blocks(min(10_000_000, 4 * size + 1000))
+        self.admin.update_appeal_period_blocks(1)
+
+    def populate(self) -> float:
+        started = time.perf_counter()
+        for _ in range(self.size):
+            self.plaintiff.file_dispute(DEFENDANT, CASE_DESCRIPTION, EVIDENCE_URLS, value=10)
+        for i in range(self.size):
+            self.plaintiff.submit_evidence(self.rng.randrange(self.size), "qa_report", EVIDENCE_CONTENT)
+        return time.perf_counter() - started
+
+    def advance_clock(self) -> None:
+        """Jump past every evidence deadline (the contract counts time in write calls)"""
+        self.oracle.genesis_block = self.oracle.genesis_block + int(self.oracle.evidence_period_blocks) + 1
+
+    def measure(self, calls) -> dict:
+        wall, per_call = [], []
+        for call in calls:
+            self.runtime.stats.reset()
+            started = time.perf_counter()
+            call()
+            wall.append((time.perf_counter() - started) * 1000)
+            per_call.append(self.runtime.stats.as_dict())
+        count = len(wall)
+        summary = {
+            "calls": count,
+            "wall_ms_mean": statistics.fmean(wall),
+            "wall_ms_p50": statistics.median(wall),
+            "wall_ms_max": max(wall),
+        }
+        for key in ("storage_reads", "storage_writes", "prompts", "prompt_chars", "renders",
+                    "consensus_rounds", "consensus_rejections"):
+            summary[f"{key}_per_call"] = sum(stats[key] for stats in per_call) / count
+        return summary
+
+
+def run_size(size: int, samples: int, seed: int) -> dict:
+    bench = Bench(size, seed)
+    populate_s = bench.populate()
+    rng = bench.rng
+    plaintiff = bench.plaintiff
+
+    def pick() -> int:
+        return rng.randrange(size)
+
+    results = {
+        "populate_s": populate_s,
+        "file_dispute": bench.measure(
+            [lambda: plaintiff.file_dispute(DEFENDANT, CASE_DESCRIPTION, EVIDENCE_URLS, value=10)] * samples
+        ),
+        "submit_evidence": bench.measure(
+            [lambda: plaintiff.submit_evidence(pick(), "qa_report", EVIDENCE_CONTENT)] * samples
+        ),
+        "get_dispute_evidence": bench.measure([lambda: plaintiff.get_dispute_evidence(pick())] * samples),
+        "get_disputes_paginated": bench.measure(
+            [lambda: plaintiff.get_disputes_paginated(pick(), 50)] * samples
+        ),
+        "get_all_disputes": bench.measure([plaintiff.get_all_disputes] * max(1, samples // 10)),
+        "get_stats": bench.measure([plaintiff.get_stats] * samples),
+    }
+
+    bench.advance_clock()
+    pending = rng.sample(range(size), min(samples, size))
+    results["resolve_dispute"] = bench.measure(
+        [lambda dispute_id=dispute_id: plaintiff.resolve_dispute(dispute_id) for dispute_id in pending]
+    )
+    return results
+
+
+def _git_revision() -> str:
+    try:
+        return subprocess.check_output(["git", "rev-parse", "--short", "HEAD"], text=True).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+
+def compare(before_path: str, after_path: str) -> None:
+    with open(before_path) as f:
+        before = json.load(f)["results"]
+    with open(after_path) as f:
+        after = json.load(f)["results"]
+
+    print(f"{'size':>8}  {'method':<24}{'metric':<26}{'before':>14}{'after':>14}{'change':>10}")
+    for size in sorted(set(before) & set(after), key=int):
+        for method in sorted(set(before[size]) & set(after[size])):
+            if not isinstance(before[size][method], dict):
+                continue
+            for metric in ("wall_ms_mean", "storage_reads_per_call", "prompt_chars_per_call",
+                           "consensus_rounds_per_call", "consensus_rejections_per_call"):
+                old = before[size][method].get(metric, 0)
+                new = after[size][method].get(metric, 0)
+                change = f"{(new - old) / old * 100:+.1f}%" if old else "-"
+                print(f"{size:>8}  {method:<24}{metric:<26}{old:>14.2f}{new:>14.2f}{change:>10}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark JusticeOracle on the local runtime")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 10000, 100000],
+                        help="number of disputes and evidence items to populate")
+    parser.add_argument("--samples", type=int, default=20, help="measured calls per method")
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument("--out", help="result file (default: benchmarks/results/scaling-<rev>.json)")
+    parser.add_argument("--compare", nargs=2, metavar=("BEFORE", "AFTER"), help="diff two result files")
+    args = parser.parse_args()
+
+    if args.compare:
+        compare(*args.compare)
+        return
+
+    revision = _git_revision()
+    report = {
+        "meta": {
+            "revision": revision,
+            "python": sys.version.split()[0],
+            "samples": args.samples,
+            "seed": args.seed,
+        },
+        "results": {},
+    }
+    for size in args.sizes:
+        print(f"📊 Benchmarking {size:,} disputes / {size:,} evidence items...")
+        report["results"][str(size)] = run_size(size, args.samples, args.seed)
+        for method, summary in report["results"][str(size)].items():
+            if isinstance(summary, dict):
+                print(f"   {method:<24}{summary['wall_ms_mean']:>10.3f} ms"
+                      f"{summary['storage_reads_per_call']:>12.0f} reads"
+                      f"{summary['prompt_chars_per_call']:>10.0f} prompt chars")
+
+    out = Path(args.out) if args.out else RESULTS_DIR / f"scaling-{revision}.json"
+    out.parent.mkdir(parents=True, exist_ok=True)
+    with open(out, "w") as f:
+        json.dump(report, f, indent=2)
+    print(f"✅ Results saved: {out}")
+
+
+if __name__ == "__main__":
+    main()
@@ -16,12 +16,14 @@ import { Skeleton } from "@/components/ui/skeleton"
 import { Tabs, TabsContent, TabsList, TabsTrigger } from "@/components/ui/tabs"
 import { Progress } from "@/components/ui/progress"
 import { FileText, User, Scale, Brain, TrendingUp, ExternalLink, AlertTriangle, CheckCircle2, Clock, Loader2 } from "lucide-react"
-import { getDispute, getDisputeEvidence, appealVerdict, resolveDispute, finalizeVerdict } from "@/lib/genlayer"
+import { getDispute, getDisputeEvidencePage, appealVerdict, resolveDispute, finalizeVerdict } from "@/lib/genlayer"
 import { toast } from "sonner"
 import { SubmitEvidenceForm } from "./submit-evidence-form"
 import { Textarea } from "@/components/ui/textarea"
 import { ConfirmationDialog } from "./confirmation-dialog"
 
+const EVIDENCE_PAGE_SIZE = 20
+
 interface DisputeDetailsDialogProps {
   disputeId: number | null
   open: boolean
@@ -54,7 +56,7 @@ export function DisputeDetailsDialog({ disputeId, open, onClose, onUpdate }: Dis
     try {
       const [disputeResult, evidenceResult] = await Promise.all([
         getDispute(disputeId),
-        getDisputeEvidence(disputeId)
+        getDisputeEvidencePage(disputeId, 0, EVIDENCE_PAGE_SIZE)
       ])
       
       if (disputeResult.success) {
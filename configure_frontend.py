@@ -7,36 +7,80 @@ Usage: python3 configure_frontend.py <contract_address>
 import sys
 from pathlib import Path
 
-if len(sys.argv) != 2:
-    print("Usage: python3 configure_frontend.py <contract_address>")
-    print("Example: python3 configure_frontend.py 0x742d35Cc6634C0532925a3b844Bc9e7595f0bEb")
-    sys.exit(1)
+DEFAULT_RPC = "https://studio.genlayer.com/api"
+DEFAULT_NETWORK = "testnet"
 
-contract_address = sys.argv[1]
 
-if not contract_address.startswith("0x"):
-    print("❌ Invalid address format. Should start with 0x")
-    sys.exit(1)
+def frontend_env_file() -> Path:
+    """`.env.local` of the Next.js app (a frontend/ checkout if present, else this directory)"""
+    frontend_dir = Path("frontend")
+    return (frontend_dir if frontend_dir.is_dir() else Path(".")) / ".env.local"
 
-print("⚙️  Configuring frontend...")
 
-frontend_dir = Path("frontend")
-env_file = frontend_dir / ".env.local"
+def read_env(env_file: Path) -> dict:
+    values = {}
+    if env_file.exists():
+        for line in env_file.read_text().splitlines():
+            key, sep, value = line.partition("=")
+            if sep and not key.lstrip().startswith("#"):
+                values[key.strip()] = value.strip()
+    return values
 
-env_content = f"""# Justice Oracle Configuration
-# Contract deployed to GenLayer testnet
 
-NEXT_PUBLIC_GENLAYER_RPC=https://studio.genlayer.com/api
+def write_frontend_env(contract_address: str, rpc: str = DEFAULT_RPC, network: str = DEFAULT_NETWORK,
+                       env_file: Path = None) -> bool:
+    """
+    Point the frontend at a contract; returns False when it already was
+    Other variables in an existing .env.local are kept.
+    """
+    env_file = env_file or frontend_env_file()
+    wanted = {
+        "NEXT_PUBLIC_GENLAYER_RPC": rpc,
+        "NEXT_PUBLIC_CONTRACT_ADDRESS": contract_address,
+        "NEXT_PUBLIC_NETWORK": network,
+    }
+    current = read_env(env_file)
+    if all(current.get(key) == value for key, value in wanted.items()):
+        return False
+
+    # Keep any other variables the developer added
+    extra = [f"{key}={value}" for key, value in current.items() if key not in wanted]
+    env_content = f"""# Justice Oracle Configuration
+# Contract deployed to GenLayer {network}
+
+NEXT_PUBLIC_GENLAYER_RPC={rpc}
 NEXT_PUBLIC_CONTRACT_ADDRESS={contract_address}
-NEXT_PUBLIC_NETWORK=testnet
+NEXT_PUBLIC_NETWORK={network}
 """
+    if extra:
+        env_content += "\n" + "\n".join(extra) + "\n"
+
+    with open(env_file, "w") as f:
+        f.write(env_content)
+    return True
+
+
+if __name__ == "__main__":
+    if len(sys.argv) != 2:
+        print("Usage: python3 configure_frontend.py <contract_address>")
+        print("Example: python3 configure_frontend.py 0x742d35Cc6634C0532925a3b844Bc9e7595f0bEb0")
+        sys.exit(1)
+
+    contract_address = sys.argv[1]
+
+    if not contract_address.startswith("0x"):
+        print("❌ Invalid address format. Should start with 0x")
+        sys.exit(1)
 
-with open(env_file, "w") as f:
-    f.write(env_content)
+    print("⚙️  Configuring frontend...")
 
-print(f"✅ Frontend configured!")
-print(f"   Contract: {contract_address}")
-print(f"   Config: {env_file}")
-print()
-print("Next steps:")
-print("  cd frontend && npm run dev")
+    env_file = frontend_env_file()
+    if write_frontend_env(contract_address, env_file=env_file):
+        print(f"✅ Frontend configured!")
+    else:
+        print(f"✅ Frontend already configured - no changes")
+    print(f"   Contract: {contract_address}")
+    print(f"   Config: {env_file}")
+    print()
+    print("Next steps:")
+    print("  npm run dev")
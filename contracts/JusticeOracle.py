@@ -2,8 +2,12 @@
 
 from genlayer import *
 from dataclasses import dataclass
+import hashlib
 import json
 
+EVIDENCE_PREVIEW_CHARS = 280  # Characters of content returned by paginated evidence listings
+MAX_LEADER_REPAIRS = 2  # Follow-up prompts the leader may spend fixing a verdict before consensus
+
 @allow_storage
 @dataclass
 class Dispute:
@@ -23,6 +27,8 @@ class Dispute:
     resolved_at: u256  # Timestamp
     evidence_deadline: u256  # Timestamp
     appeal_deadline: u256  # Timestamp
+    resolution_track: str  # "" until resolved, then "full" or "fast"; cleared again by an appeal
+    appealed: bool  # Set by an appeal; appealed disputes always get the full review
 
 @allow_storage
 @dataclass
@@ -35,6 +41,62 @@ class Evidence:
     credibility_score: u8
     submitted_at: u256  # Timestamp
 
+class _UnitOfWork:
+    """
+    Per-call storage session
+    Reads are memoized for the duration of a call; dirty records and metric
+    counters are written back once on commit. Scalar fields (counters,
+    settings, the block clock) and dispute_evidence appends are single-slot
+    writes with nothing to batch, so they go to storage directly.
+    """
+    
+    def __init__(self, contract, method: str):
+        self._contract = contract
+        self._method = method
+        self._disputes = {}
+        self._evidence = {}
+        self._dirty_disputes = set()
+        self._dirty_evidence = set()
+        self._counters = {}
+    
+    def dispute(self, dispute_id: u256):
+        key = int(dispute_id)
+        if key not in self._disputes:
+            self._disputes[key] = self._contract.disputes.get(u256(key))
+        return self._disputes[key]
+    
+    def evidence(self, evidence_id: u256):
+        key = int(evidence_id)
+        if key not in self._evidence:
+            self._evidence[key] = self._contract.evidence.get(u256(key))
+        return self._evidence[key]
+    
+    def put_dispute(self, dispute: Dispute) -> None:
+        key = int(dispute.dispute_id)
+        self._disputes[key] = dispute
+        self._dirty_disputes.add(key)
+    
+    def put_evidence(self, evidence: Evidence) -> None:
+        key = int(evidence.evidence_id)
+        self._evidence[key] = evidence
+        self._dirty_evidence.add(key)
+    
+    def count(self, counter: str, amount: int = 1) -> None:
+        """Accumulate a hot-path metric for the current method"""
+        self._counters[counter] = self._counters.get(counter, 0) + amount
+    
+    def commit(self) -> None:
+        """Write dirty records and metric counters back to storage (once per key)"""
+        for key in sorted(self._dirty_disputes):
+            self._contract.disputes[u256(key)] = self._disputes[key]
+        for key in sorted(self._dirty_evidence):
+            self._contract.evidence[u256(key)] = self._evidence[key]
+        self.count("calls")
+        self._contract._bump_metrics(self._method, self._counters)
+        self._dirty_disputes.clear()
+        self._dirty_evidence.clear()
+        self._counters.clear()
+
 class JusticeOracle(gl.Contract):
     disputes: TreeMap[u256, Dispute]
     evidence: TreeMap[u256, Evidence]
@@ -48,6 +110,10 @@ class JusticeOracle(gl.Contract):
     evidence_period_blocks: u256  # Blocks for evidence gathering (~7 days at 12s/block)
     appeal_period_blocks: u256  # Blocks for appeals (~3 days at 12s/block)
     genesis_block: u256  # Starting block for time tracking
+    metrics: TreeMap[str, str]  # Hot-path counters per method, serialized as a JSON object
+    dispute_evidence: TreeMap[u256, DynArray[u256]]  # Evidence ids per dispute, in submission order
+    fast_track_max_stake: u256  # Disputes staking at most this take the fast track (0 = off)
+    fast_track_uncontested: bool  # Fast-track disputes the defendant submitted no evidence for
     
     def __init__(self, treasury_address: str = ""):
         self.dispute_counter = u256(0)
@@ -66,6 +132,8 @@ class JusticeOracle(gl.Contract):
         self.evidence_period_blocks = u256(50400)  # ~7 days at 12s/block
         self.appeal_period_blocks = u256(21600)  # ~3 days at 12s/block
         self.genesis_block = u256(0)  # Will be set on first use
+        self.fast_track_max_stake = u256(0)  # Fast track disabled by default
+        self.fast_track_uncontested = False
     
     def _serialize_urls(self, evidence_urls: list) -> str:
         """Convert list to pipe-delimited string for storage"""
@@ -77,6 +145,24 @@ class JusticeOracle(gl.Contract):
             return []
         return serialized.split("|||")
     
+    def _evidence_ids(self, dispute_id: u256):
+        """Evidence ids submitted for a dispute, in submission order (slice it to read a page)"""
+        evidence_ids = self.dispute_evidence.get(dispute_id)
+        if evidence_ids is None:
+            return []
+        return evidence_ids
+    
+    def _index_evidence(self, dispute_id: u256, evidence_id: u256) -> None:
+        """Append an evidence id to its dispute's index"""
+        self.dispute_evidence.get_or_insert_default(dispute_id).append(evidence_id)
+    
+    def _bump_metrics(self, method: str, counters: dict) -> None:
+        """Add to a method's hot-path counters (one storage write per call)"""
+        totals = json.loads(self.metrics.get(method, "{}"))
+        for counter, amount in counters.items():
+            totals[counter] = totals.get(counter, 0) + amount
+        self.metrics[method] = json.dumps(totals, sort_keys=True)
+    
     def _get_current_time(self) -> u256:
         """Get current block-based time tracking"""
         # Initialize genesis block on first call
@@ -115,6 +201,8 @@ class JusticeOracle(gl.Contract):
         if gl.message.value < self.min_stake:
             raise Exception(f"Minimum stake is {int(self.min_stake)} tokens")
         
+        uow = _UnitOfWork(self, "file_dispute")
+        
         dispute_id = self.dispute_counter
         self.dispute_counter = self.dispute_counter + u256(1)
         
@@ -139,10 +227,13 @@ class JusticeOracle(gl.Contract):
             created_at=current_time,
             resolved_at=u256(0),
             evidence_deadline=evidence_deadline,
-            appeal_deadline=u256(0)
+            appeal_deadline=u256(0),
+            resolution_track="",
+            appealed=False
         )
         
-        self.disputes[dispute_id] = dispute
+        uow.put_dispute(dispute)
+        uow.commit()
         
         return dispute_id
     
@@ -155,7 +246,8 @@ class JusticeOracle(gl.Contract):
     ) -> u256:
         """Submit additional evidence for a dispute"""
         
-        dispute = self.disputes.get(dispute_id)
+        uow = _UnitOfWork(self, "submit_evidence")
+        dispute = uow.dispute(dispute_id)
         if not dispute:
             raise Exception("Dispute not found")
         
@@ -177,7 +269,7 @@ class JusticeOracle(gl.Contract):
         if len(content) > 10000:
             raise Exception("Evidence content too long (max 10000 characters)")
         
-        credibility = self._verify_evidence_credibility(content, evidence_type, dispute.case_description)
+        credibility = self._verify_evidence_credibility(uow, content, evidence_type, dispute.case_description)
         
         evidence_id = self.evidence_counter
         self.evidence_counter = self.evidence_counter + u256(1)
@@ -192,7 +284,9 @@ class JusticeOracle(gl.Contract):
             submitted_at=current_time
         )
         
-        self.evidence[evidence_id] = evidence
+        uow.put_evidence(evidence)
+        self._index_evidence(dispute_id, evidence_id)
+        uow.commit()
         return evidence_id
     
     @gl.public.write
@@ -202,7 +296,8 @@ class JusticeOracle(gl.Contract):
         Uses custom validator to ensure high-quality judicial reasoning
         """
         
-        dispute = self.disputes.get(dispute_id)
+        uow = _UnitOfWork(self, "resolve_dispute")
+        dispute = uow.dispute(dispute_id)
         if not dispute:
             raise Exception("Dispute not found")
         
@@ -214,9 +309,14 @@ class JusticeOracle(gl.Contract):
         if current_time < dispute.evidence_deadline:
             raise Exception("Evidence gathering period not yet complete")
         
-        all_evidence = self._gather_comprehensive_evidence(dispute_id)
+        # Small or uncontested disputes skip web fetches and get a shorter opinion
+        fast_track = self._fast_track_eligible(uow, dispute)
+        if fast_track:
+            uow.count("fast_track")
+        
+        all_evidence = self._gather_comprehensive_evidence(uow, dispute_id, fetch_web=not fast_track)
         
-        verdict_data = self._ai_judicial_analysis(dispute, all_evidence)
+        verdict_data = self._ai_judicial_analysis(uow, dispute, all_evidence, fast_track)
         
         current_time = self._get_current_time()
         appeal_deadline = current_time + self.appeal_period_blocks
@@ -229,15 +329,18 @@ class JusticeOracle(gl.Contract):
         dispute.status = "resolved_pending_appeal"
         dispute.resolved_at = current_time
         dispute.appeal_deadline = appeal_deadline
+        dispute.resolution_track = "fast" if fast_track else "full"
         
-        self.disputes[dispute_id] = dispute
+        uow.put_dispute(dispute)
+        uow.commit()
         
         return verdict_data
 
     @gl.public.write
     def finalize_verdict(self, dispute_id: u256) -> None:
         """Finalize a verdict after appeal window closes and distribute funds"""
-        dispute = self.disputes.get(dispute_id)
+        uow = _UnitOfWork(self, "finalize_verdict")
+        dispute = uow.dispute(dispute_id)
         if not dispute:
             raise Exception("Dispute not found")
         
@@ -249,16 +352,36 @@ class JusticeOracle(gl.Contract):
             raise Exception("Appeal window still open")
         
         # Distribute funds based on verdict
-        self._distribute_funds(dispute_id)
+        self._distribute_funds(uow, dispute_id)
         
         # Mark as fully resolved
         dispute.status = "resolved"
-        self.disputes[dispute_id] = dispute
+        uow.put_dispute(dispute)
+        uow.commit()
+    
+    def _fast_track_eligible(self, uow: _UnitOfWork, dispute: Dispute) -> bool:
+        """Whether a dispute qualifies for the admin-configured fast track"""
+        
+        # Appealed verdicts always get the full review
+        if dispute.appealed:
+            return False
+        
+        if self.fast_track_max_stake > u256(0) and dispute.stake_amount <= self.fast_track_max_stake:
+            return True
+        
+        if self.fast_track_uncontested:
+            for evidence_id in self._evidence_ids(dispute.dispute_id):
+                evidence = uow.evidence(evidence_id)
+                if evidence and evidence.submitted_by == dispute.defendant:
+                    return False
+            return True
+        
+        return False
     
-    def _gather_comprehensive_evidence(self, dispute_id: u256) -> dict:
+    def _gather_comprehensive_evidence(self, uow: _UnitOfWork, dispute_id: u256, fetch_web: bool = True) -> dict:
         """Fetch evidence from multiple sources including web scraping"""
         
-        dispute = self.disputes.get(dispute_id)
+        dispute = uow.dispute(dispute_id)
         evidence_collection = {
             "web_evidence": [],
             "submitted_evidence": []
@@ -269,11 +392,13 @@ class JusticeOracle(gl.Contract):
         
         # Gather web evidence with resource limits
         url_count = 0
-        for url in evidence_urls:
+        for url in evidence_urls if fetch_web else []:
             if url_count >= int(self.max_evidence_urls):
                 break
             try:
+                uow.count("web_renders")
                 web_data = gl.nondet.web.render(url, mode="text")
+                uow.count("web_bytes", len(web_data))
                 evidence_collection["web_evidence"].append({
                     "url": url,
                     "content": web_data[:1500]  # Limit content size
@@ -286,9 +411,11 @@ class JusticeOracle(gl.Contract):
                 })
         
         # Gather submitted evidence
-        for i in range(int(self.evidence_counter)):
-            evidence = self.evidence.get(u256(i))
-            if evidence and evidence.dispute_id == dispute_id:
+        for evidence_id in self._evidence_ids(dispute_id):
+            evidence = uow.evidence(evidence_id)
+            uow.count("evidence_scanned")
+            if evidence:
+                uow.count("evidence_returned")
                 evidence_collection["submitted_evidence"].append({
                     "type": evidence.evidence_type,
                     "content": evidence.content[:2000],  # Limit content size
@@ -298,13 +425,17 @@ class JusticeOracle(gl.Contract):
         
         return evidence_collection
     
-    def _ai_judicial_analysis(self, dispute: Dispute, evidence: dict) -> dict:
+    def _ai_judicial_analysis(self, uow: _UnitOfWork, dispute: Dispute, evidence: dict, fast_track: bool = False) -> dict:
         """
         Multi-LLM consensus with custom validator for judicial quality
         This showcases GenLayer's unique capability for subjective decision-making
         """
         
-        def leader_fn():
+        if fast_track:
+            prompt = self._fast_track_prompt(dispute, evidence)
+            reasoning_words = (50, 600)  # Asked for 80-150; longer opinions still pass as on the full track
+        else:
+            reasoning_words = (250, 600)  # Asked for 300-500
             prompt = f"""You are a decentralized arbitration AI analyzing a dispute fairly and objectively.
 
 CASE DESCRIPTION:
@@ -342,10 +473,35 @@ CRITICAL REQUIREMENTS:
 6. Include at least 3 key factors
 
 Return ONLY valid JSON, no markdown, no code blocks."""
-            
+        
+        uow.count("llm_prompts")
+        uow.count("llm_prompt_chars", len(prompt))
+        
+        def leader_fn():
             result = gl.nondet.exec_prompt(prompt, response_format="json")
-            cleaned = str(result).replace("```json", "").replace("```", "").strip()
-            return cleaned
+            verdict_data = self._parse_llm_json(result)
+            
+            # Run the validators' checks locally and repair before proposing,
+            # so fixable output does not cost a consensus round
+            repairs = []
+            for _ in range(MAX_LEADER_REPAIRS):
+                failures = self._judicial_quality_failures(verdict_data, *reasoning_words)
+                if not failures:
+                    break
+                if failures == ["json"]:
+                    repairs.append({"fields": failures, "prompt_chars": len(prompt)})
+                    verdict_data = self._parse_llm_json(gl.nondet.exec_prompt(prompt, response_format="json"))
+                    continue
+                repair_prompt = self._repair_prompt(verdict_data, failures, fast_track)
+                repairs.append({"fields": failures, "prompt_chars": len(repair_prompt)})
+                patch = self._parse_llm_json(gl.nondet.exec_prompt(repair_prompt, response_format="json"))
+                if isinstance(patch, dict):
+                    verdict_data.update({field: patch[field] for field in failures if field in patch})
+            
+            if not isinstance(verdict_data, dict):
+                return str(result)
+            verdict_data["leader_repairs"] = repairs
+            return json.dumps(verdict_data)
         
         def validator_fn(leader_result):
             """Custom validator ensures high-quality judicial reasoning"""
@@ -355,60 +511,144 @@ Return ONLY valid JSON, no markdown, no code blocks."""
             
             try:
                 verdict_data = json.loads(leader_result.calldata)
-                
-                required_fields = [
-                    "verdict", "confidence", "reasoning",
-                    "key_factors", "evidence_weight", "recommended_distribution"
-                ]
-                if not all(field in verdict_data for field in required_fields):
-                    return False
-                
-                valid_verdicts = ["plaintiff_wins", "defendant_wins", "split_ruling", "insufficient_evidence"]
-                if verdict_data["verdict"] not in valid_verdicts:
-                    return False
-                
-                confidence = int(verdict_data["confidence"])
-                if not (0 <= confidence <= 100):
-                    return False
-                
-                word_count = len(verdict_data["reasoning"].split())
-                if word_count < 250 or word_count > 600:
-                    return False
-                
-                if len(verdict_data["key_factors"]) < 2:
-                    return False
-                
-                dist = verdict_data["recommended_distribution"]
-                plaintiff_pct = int(dist["plaintiff_percent"])
-                defendant_pct = int(dist["defendant_percent"])
-                
-                if not (0 <= plaintiff_pct <= 100 and 0 <= defendant_pct <= 100):
-                    return False
-                
-                if plaintiff_pct + defendant_pct != 100:
-                    return False
-                
-                ev_weight = verdict_data["evidence_weight"]
-                p_strength = int(ev_weight["plaintiff_evidence_strength"])
-                d_strength = int(ev_weight["defendant_evidence_strength"])
-                
-                if not (0 <= p_strength <= 10 and 0 <= d_strength <= 10):
-                    return False
-                
-                reasoning_lower = verdict_data["reasoning"].lower()
-                bias_keywords = ["obviously", "clearly wrong", "stupid", "idiot", "moron"]
-                if any(keyword in reasoning_lower for keyword in bias_keywords):
-                    return False
-                
-                return True
-                
-            except (json.JSONDecodeError, ValueError, KeyError, TypeError) as e:
+            except (json.JSONDecodeError, ValueError, TypeError) as e:
                 return False
+            
+            return not self._judicial_quality_failures(verdict_data, *reasoning_words)
         
         result_json = gl.vm.run_nondet(leader_fn, validator_fn)
-        return json.loads(result_json)
+        analysis = json.loads(result_json)
+        
+        # Repairs the leader made (and the prompt sizes it reported) are agreed state, unlike rejected rounds
+        repairs = analysis.pop("leader_repairs", [])
+        for repair in repairs if isinstance(repairs, list) else []:
+            if not isinstance(repair, dict):
+                continue
+            uow.count("leader_repairs")
+            uow.count("llm_prompts")
+            if isinstance(repair.get("prompt_chars"), int):
+                uow.count("llm_prompt_chars", repair["prompt_chars"])
+            fields = repair.get("fields")
+            for field in fields if isinstance(fields, list) else []:
+                uow.count(f"leader_repairs.{field}")
+        return analysis
     
-    def _verify_evidence_credibility(self, content: str, evidence_type: str, case_context: str) -> u8:
+    def _parse_llm_json(self, raw):
+        """Parse an LLM JSON reply, tolerating markdown fences; None if unparseable"""
+        cleaned = str(raw).replace("```json", "").replace("```", "").strip()
+        try:
+            return json.loads(cleaned)
+        except (json.JSONDecodeError, ValueError) as e:
+            return None
+    
+    def _fast_track_prompt(self, dispute: Dispute, evidence: dict) -> str:
+        """Shorter judicial prompt for fast-track disputes (submitted evidence only)"""
+        
+        submitted = [
+            {"type": item["type"], "content": item["content"][:500], "submitted_by": item["submitted_by"]}
+            for item in evidence.get("submitted_evidence", [])
+        ]
+        
+        return f"""You are an arbitration AI issuing a brief, impartial ruling on a small or uncontested dispute.
+
+CASE DESCRIPTION:
+{dispute.case_description}
+
+SUBMITTED EVIDENCE: {json.dumps(submitted)}
+
+RETURN STRICT JSON:
+{{"verdict": "plaintiff_wins" | "defendant_wins" | "split_ruling" | "insufficient_evidence", "confidence": <integer 0-100>, "reasoning": "<concise 80-150 word explanation>", "key_factors": ["factor1", "factor2"], "evidence_weight": {{"plaintiff_evidence_strength": <integer 0-10>, "defendant_evidence_strength": <integer 0-10>}}, "recommended_distribution": {{"plaintiff_percent": <integer 0-100>, "defendant_percent": <integer 0-100>}}}}
+
+Percentages must sum to 100. Return ONLY valid JSON, no markdown, no code blocks."""
+    
+    def _judicial_quality_failures(self, verdict_data, min_words: int = 250, max_words: int = 600) -> list:
+        """
+        Judicial-quality checks shared by the leader and validators
+        Returns the names of failing fields ("json" if the reply is not an object);
+        an empty list means the verdict is acceptable
+        """
+        
+        if not isinstance(verdict_data, dict):
+            return ["json"]
+        
+        required_fields = [
+            "verdict", "confidence", "reasoning",
+            "key_factors", "evidence_weight", "recommended_distribution"
+        ]
+        failures = [field for field in required_fields if field not in verdict_data]
+        if failures:
+            return failures
+        
+        valid_verdicts = ["plaintiff_wins", "defendant_wins", "split_ruling", "insufficient_evidence"]
+        if verdict_data["verdict"] not in valid_verdicts:
+            failures.append("verdict")
+        
+        try:
+            confidence = int(verdict_data["confidence"])
+            if not (0 <= confidence <= 100):
+                failures.append("confidence")
+        except (ValueError, TypeError) as e:
+            failures.append("confidence")
+        
+        reasoning = verdict_data["reasoning"]
+        if not isinstance(reasoning, str):
+            failures.append("reasoning")
+        else:
+            word_count = len(reasoning.split())
+            reasoning_lower = reasoning.lower()
+            bias_keywords = ["obviously", "clearly wrong", "stupid", "idiot", "moron"]
+            if word_count < min_words or word_count > max_words or any(keyword in reasoning_lower for keyword in bias_keywords):
+                failures.append("reasoning")
+        
+        if not isinstance(verdict_data["key_factors"], list) or len(verdict_data["key_factors"]) < 2:
+            failures.append("key_factors")
+        
+        try:
+            ev_weight = verdict_data["evidence_weight"]
+            p_strength = int(ev_weight["plaintiff_evidence_strength"])
+            d_strength = int(ev_weight["defendant_evidence_strength"])
+            if not (0 <= p_strength <= 10 and 0 <= d_strength <= 10):
+                failures.append("evidence_weight")
+        except (ValueError, KeyError, TypeError) as e:
+            failures.append("evidence_weight")
+        
+        try:
+            dist = verdict_data["recommended_distribution"]
+            plaintiff_pct = int(dist["plaintiff_percent"])
+            defendant_pct = int(dist["defendant_percent"])
+            if not (0 <= plaintiff_pct <= 100 and 0 <= defendant_pct <= 100) or plaintiff_pct + defendant_pct != 100:
+                failures.append("recommended_distribution")
+        except (ValueError, KeyError, TypeError) as e:
+            failures.append("recommended_distribution")
+        
+        return failures
+    
+    def _repair_prompt(self, verdict_data: dict, failures: list, fast_track: bool = False) -> str:
+        """Follow-up prompt asking the LLM to fix only the failing fields"""
+        
+        reasoning_length = "80-150" if fast_track else "300-500"
+        min_key_factors = 2 if fast_track else 3
+        field_rules = {
+            "verdict": 'one of "plaintiff_wins", "defendant_wins", "split_ruling", "insufficient_evidence"',
+            "confidence": "an integer from 0 to 100",
+            "reasoning": f"an impartial {reasoning_length} word explanation citing specific evidence, "
+                         "without inflammatory words such as \"obviously\" or \"clearly wrong\"",
+            "key_factors": f"a list of at least {min_key_factors} key factors",
+            "evidence_weight": '{"plaintiff_evidence_strength": <integer 0-10>, "defendant_evidence_strength": <integer 0-10>}',
+            "recommended_distribution": '{"plaintiff_percent": <integer 0-100>, "defendant_percent": <integer 0-100>} summing to 100'
+        }
+        rules = "\n".join(f"- {field}: {field_rules[field]}" for field in failures)
+        
+        return f"""Your arbitration verdict failed validation. Fix ONLY these fields:
+{rules}
+
+CURRENT VERDICT:
+{json.dumps(verdict_data, indent=2)}
+
+Keep the corrected fields consistent with the rest of the verdict.
+Return ONLY a JSON object containing the corrected fields, no markdown, no code blocks."""
+    
+    def _verify_evidence_credibility(self, uow: _UnitOfWork, content: str, evidence_type: str, case_context: str) -> u8:
         """AI verifies evidence credibility score 0-100"""
         
         prompt = f"""Rate the credibility of this evidence on a scale of 0-100:
@@ -426,6 +666,8 @@ Consider:
 
 Return ONLY an integer between 0 and 100, nothing else."""
         
+        uow.count("llm_prompts")
+        uow.count("llm_prompt_chars", len(prompt))
         result = gl.nondet.exec_prompt(prompt)
         
         try:
@@ -434,10 +676,10 @@ Return ONLY an integer between 0 and 100, nothing else."""
         except:
             return u8(50)
     
-    def _distribute_funds(self, dispute_id: u256) -> None:
+    def _distribute_funds(self, uow: _UnitOfWork, dispute_id: u256) -> None:
         """Distribute staked funds based on verdict"""
         
-        dispute = self.disputes.get(dispute_id)
+        dispute = uow.dispute(dispute_id)
         if not dispute:
             return
         
@@ -466,7 +708,8 @@ Return ONLY an integer between 0 and 100, nothing else."""
     def appeal_verdict(self, dispute_id: u256, appeal_reason: str) -> None:
         """Appeal a resolved verdict within the appeal window"""
         
-        dispute = self.disputes.get(dispute_id)
+        uow = _UnitOfWork(self, "appeal_verdict")
+        dispute = uow.dispute(dispute_id)
         if not dispute:
             raise Exception("Dispute not found")
         
@@ -494,8 +737,11 @@ Return ONLY an integer between 0 and 100, nothing else."""
         # Reset deadlines for a new round
         dispute.evidence_deadline = current_time + self.evidence_period_blocks
         dispute.appeal_deadline = u256(0)
+        dispute.resolution_track = ""
+        dispute.appealed = True
         
-        self.disputes[dispute_id] = dispute
+        uow.put_dispute(dispute)
+        uow.commit()
     
     @gl.public.view
     def get_dispute(self, dispute_id: u256) -> dict:
@@ -505,6 +751,11 @@ Return ONLY an integer between 0 and 100, nothing else."""
         if not dispute:
             return {}
         
+        return self._dispute_record(dispute)
+    
+    def _dispute_record(self, dispute: Dispute) -> dict:
+        """Full JSON form of a stored dispute"""
+        
         return {
             "dispute_id": int(dispute.dispute_id),
             "plaintiff": dispute.plaintiff.as_hex,
@@ -523,7 +774,9 @@ Return ONLY an integer between 0 and 100, nothing else."""
             "created_at": int(dispute.created_at),
             "resolved_at": int(dispute.resolved_at),
             "evidence_deadline": int(dispute.evidence_deadline),
-            "appeal_deadline": int(dispute.appeal_deadline)
+            "appeal_deadline": int(dispute.appeal_deadline),
+            "resolution_track": dispute.resolution_track,
+            "appealed": dispute.appealed
         }
     
     @gl.public.view
@@ -532,9 +785,9 @@ Return ONLY an integer between 0 and 100, nothing else."""
         
         evidence_list = []
         
-        for i in range(int(self.evidence_counter)):
-            evidence = self.evidence.get(u256(i))
-            if evidence and evidence.dispute_id == dispute_id:
+        for evidence_id in self._evidence_ids(dispute_id):
+            evidence = self.evidence.get(evidence_id)
+            if evidence:
                 evidence_list.append({
                     "evidence_id": int(evidence.evidence_id),
                     "submitted_by": evidence.submitted_by.as_hex,
@@ -545,6 +798,61 @@ Return ONLY an integer between 0 and 100, nothing else."""
         
         return evidence_list
     
+    @gl.public.view
+    def get_dispute_evidence_page(self, dispute_id: u256, offset: u256, limit: u256) -> dict:
+        """
+        Get a page of a dispute's evidence with content previews
+        Each item carries the first EVIDENCE_PREVIEW_CHARS characters, the full
+        content length and its sha256; fetch the full text with get_evidence.
+        """
+        
+        if limit > u256(100):
+            limit = u256(100)  # Max 100 per page
+        
+        evidence_ids = self._evidence_ids(dispute_id)
+        evidence_list = []
+        
+        for evidence_id in evidence_ids[int(offset):int(offset) + int(limit)]:
+            evidence = self.evidence.get(evidence_id)
+            if evidence:
+                evidence_list.append({
+                    "evidence_id": int(evidence.evidence_id),
+                    "submitted_by": evidence.submitted_by.as_hex,
+                    "type": evidence.evidence_type,
+                    "preview": evidence.content[:EVIDENCE_PREVIEW_CHARS],
+                    "content_length": len(evidence.content),
+                    "content_digest": hashlib.sha256(evidence.content.encode()).hexdigest(),
+                    "credibility": int(evidence.credibility_score),
+                    "submitted_at": int(evidence.submitted_at)
+                })
+        
+        return {
+            "evidence": evidence_list,
+            "total": len(evidence_ids),
+            "offset": int(offset),
+            "limit": int(limit)
+        }
+    
+    @gl.public.view
+    def get_evidence(self, evidence_id: u256) -> dict:
+        """Get one evidence item with its full content"""
+        
+        evidence = self.evidence.get(evidence_id)
+        if not evidence:
+            return {}
+        
+        return {
+            "evidence_id": int(evidence.evidence_id),
+            "dispute_id": int(evidence.dispute_id),
+            "submitted_by": evidence.submitted_by.as_hex,
+            "type": evidence.evidence_type,
+            "content": evidence.content,
+            "content_length": len(evidence.content),
+            "content_digest": hashlib.sha256(evidence.content.encode()).hexdigest(),
+            "credibility": int(evidence.credibility_score),
+            "submitted_at": int(evidence.submitted_at)
+        }
+    
     @gl.public.view
     def get_all_disputes(self) -> list:
         """Get all disputes in the system"""
@@ -575,7 +883,24 @@ Return ONLY an integer between 0 and 100, nothing else."""
             "platform_fee_percent": int(self.platform_fee),
             "treasury": self.treasury.as_hex,
             "evidence_period_blocks": int(self.evidence_period_blocks),
-            "appeal_period_blocks": int(self.appeal_period_blocks)
+            "appeal_period_blocks": int(self.appeal_period_blocks),
+            "fast_track_max_stake": int(self.fast_track_max_stake),
+            "fast_track_uncontested": self.fast_track_uncontested
+        }
+    
+    @gl.public.view
+    def get_metrics(self) -> dict:
+        """
+        Get hot-path counters for write methods, keyed "<method>.<counter>"
+        Counters: calls, llm_prompts, llm_prompt_chars, web_renders, web_bytes,
+        evidence_scanned, evidence_returned, leader_repairs[.<field>]
+        (views cannot persist counters; rejected consensus rounds leave no state)
+        """
+        
+        return {
+            f"{method}.{counter}": amount
+            for method, serialized in self.metrics.items()
+            for counter, amount in json.loads(serialized).items()
         }
     
     @gl.public.view
@@ -610,6 +935,54 @@ Return ONLY an integer between 0 and 100, nothing else."""
             "limit": int(limit)
         }
     
+    @gl.public.view
+    def export_state(self, dispute_cursor: u256, evidence_cursor: u256, limit: u256) -> dict:
+        """
+        Export full dispute and evidence records in bounded chunks
+        Walks disputes from dispute_cursor, then evidence from evidence_cursor;
+        pass the returned cursors back until "done" is true. Each record is read
+        once, so a full export costs O(disputes + evidence).
+        """
+        
+        if limit < u256(1):
+            raise Exception("Limit must be at least 1")  # A zero limit would never advance the cursors
+        if limit > u256(100):
+            limit = u256(100)  # Max 100 records per chunk
+        
+        remaining = int(limit)
+        disputes_list = []
+        evidence_list = []
+        
+        while remaining > 0 and dispute_cursor < self.dispute_counter:
+            dispute = self.disputes.get(dispute_cursor)
+            if dispute:
+                disputes_list.append(self._dispute_record(dispute))
+            dispute_cursor = dispute_cursor + u256(1)
+            remaining -= 1
+        
+        while remaining > 0 and evidence_cursor < self.evidence_counter:
+            evidence = self.evidence.get(evidence_cursor)
+            if evidence:
+                evidence_list.append({
+                    "evidence_id": int(evidence.evidence_id),
+                    "dispute_id": int(evidence.dispute_id),
+                    "submitted_by": evidence.submitted_by.as_hex,
+                    "type": evidence.evidence_type,
+                    "content": evidence.content,
+                    "credibility": int(evidence.credibility_score),
+                    "submitted_at": int(evidence.submitted_at)
+                })
+            evidence_cursor = evidence_cursor + u256(1)
+            remaining -= 1
+        
+        return {
+            "disputes": disputes_list,
+            "evidence": evidence_list,
+            "next_dispute_cursor": int(dispute_cursor),
+            "next_evidence_cursor": int(evidence_cursor),
+            "done": dispute_cursor >= self.dispute_counter and evidence_cursor >= self.evidence_counter
+        }
+    
     # Admin functions
     @gl.public.write
     def update_min_stake(self, new_min_stake: u256) -> None:
@@ -621,6 +994,7 @@ Return ONLY an integer between 0 and 100, nothing else."""
             raise Exception("Min stake must be between 1 and 1000 tokens")
         
         self.min_stake = new_min_stake
+        _UnitOfWork(self, "update_min_stake").commit()
     
     @gl.public.write
     def update_platform_fee(self, new_fee: u256) -> None:
@@ -632,6 +1006,7 @@ Return ONLY an integer between 0 and 100, nothing else."""
             raise Exception("Platform fee cannot exceed 10%")
         
         self.platform_fee = new_fee
+        _UnitOfWork(self, "update_platform_fee").commit()
     
     @gl.public.write
     def update_treasury(self, new_treasury: str) -> None:
@@ -640,6 +1015,7 @@ Return ONLY an integer between 0 and 100, nothing else."""
             raise Exception("Only admin can call this")
         
         self.treasury = Address(new_treasury)
+        _UnitOfWork(self, "update_treasury").commit()
     
     @gl.public.write
     def transfer_admin(self, new_admin: str) -> None:
@@ -648,6 +1024,7 @@ Return ONLY an integer between 0 and 100, nothing else."""
             raise Exception("Only admin can call this")
         
         self.admin = Address(new_admin)
+        _UnitOfWork(self, "transfer_admin").commit()
     
     @gl.public.write
     def withdraw_fees(self, amount: u256) -> None:
@@ -660,6 +1037,7 @@ Return ONLY an integer between 0 and 100, nothing else."""
         
         # Transfer to treasury
         gl.transfer(self.treasury, amount)
+        _UnitOfWork(self, "withdraw_fees").commit()
 
     @gl.public.write
     def update_evidence_period_blocks(self, new_blocks: u256) -> None:
@@ -669,6 +1047,7 @@ Return ONLY an integer between 0 and 100, nothing else."""
         if new_blocks < u256(1) or new_blocks > u256(10000000):
             raise Exception("Evidence period must be between 1 and 10,000,000 blocks")
         self.evidence_period_blocks = new_blocks
+        _UnitOfWork(self, "update_evidence_period_blocks").commit()
 
     @gl.public.write
     def update_appeal_period_blocks(self, new_blocks: u256) -> None:
@@ -678,3 +1057,32 @@ Return ONLY an integer between 0 and 100, nothing else."""
         if new_blocks < u256(1) or new_blocks > u256(10000000):
             raise Exception("Appeal period must be between 1 and 10,000,000 blocks")
         self.appeal_period_blocks = new_blocks
+        _UnitOfWork(self, "update_appeal_period_blocks").commit()
+
+    @gl.public.write
+    def update_fast_track_max_stake(self, new_max_stake: u256) -> None:
+        """Admin: Fast-track disputes staking at most this amount (0-1000 tokens, 0 disables)"""
+        if gl.message.sender_address != self.admin:
+            raise Exception("Only admin can call this")
+        
+        if new_max_stake > u256(1000):
+            raise Exception("Fast-track max stake must be between 0 and 1000 tokens")
+        
+        self.fast_track_max_stake = new_max_stake
+        _UnitOfWork(self, "update_fast_track_max_stake").commit()
+    
+    @gl.public.write
+    def update_fast_track_uncontested(self, enabled: bool) -> None:
+        """Admin: Fast-track disputes the defendant submitted no evidence for"""
+        if gl.message.sender_address != self.admin:
+            raise Exception("Only admin can call this")
+        self.fast_track_uncontested = bool(enabled)
+        _UnitOfWork(self, "update_fast_track_uncontested").commit()
+    
+    @gl.public.write
+    def reset_metrics(self) -> None:
+        """Admin: Clear all hot-path metric counters"""
+        if gl.message.sender_address != self.admin:
+            raise Exception("Only admin can call this")
+        for key in list(self.metrics.keys()):
+            del self.metrics[key]
@@ -2,102 +2,159 @@
 """
 Justice Oracle - Production Terminal Deployment
 Deploy directly from your terminal to GenLayer testnet
+
+Deploys are content-addressed: the hash of the contract source, constructor
+arguments, network and RPC endpoint is recorded in deployment_info.json, and
+an unchanged contract reuses the recorded address without uploading again,
+provided a get_stats read shows it still exists (a reset node forgets it).
+Use --force to redeploy anyway.
 """
 
+import argparse
+import asyncio
+import hashlib
 import json
-import requests
 import os
 from pathlib import Path
 
+from configure_frontend import frontend_env_file, write_frontend_env
+from justice_client import DEFAULT_RPC, ReceiptTimeout, RpcClient, RpcError
+
 # Configuration
-GENLAYER_RPC = "https://studio.genlayer.com/api"
+GENLAYER_RPC = os.environ.get("GENLAYER_RPC", DEFAULT_RPC)
 NETWORK = "testnet"
+CONTRACT_PATH = Path("contracts/JusticeOracle.py")
+DEPLOYMENT_INFO = Path("deployment_info.json")
+SUBMIT_TIMEOUT = 120.0  # floor for the deploy request itself; uploads to testnet can be slow
+
+
+def deployment_key(contract_code: str, constructor_args: list, network: str, rpc: str) -> str:
+    """Content hash identifying a deployment"""
+    digest = hashlib.sha256()
+    digest.update(contract_code.encode())
+    digest.update(json.dumps({"args": constructor_args, "network": network, "rpc": rpc}, sort_keys=True).encode())
+    return digest.hexdigest()
+
+
+def load_deployment_info() -> dict:
+    if not DEPLOYMENT_INFO.exists():
+        return {}
+    try:
+        with open(DEPLOYMENT_INFO) as f:
+            return json.load(f)
+    except json.JSONDecodeError:
+        return {}
+
+
+def _receipt_address(receipt: dict) -> str:
+    data = receipt.get("data") or {}
+    return receipt.get("contract_address") or data.get("contract_address") or receipt.get("to_address")
+
+
+async def contract_exists(address: str) -> bool:
+    """Cheap get_stats read confirming a recorded address still hosts the contract"""
+    async with RpcClient(GENLAYER_RPC, timeout=30) as rpc:
+        try:
+            stats = await rpc.read_contract(address, "get_stats", [])
+        except RpcError:
+            return False
+    return isinstance(stats, dict) and "total_disputes" in stats
+
+
+async def deploy(contract_code: str, constructor_args: list, timeout: float) -> str:
+    """Submit the contract and, when a transaction hash comes back, poll (with backoff) for its address"""
+    async with RpcClient(GENLAYER_RPC, timeout=max(SUBMIT_TIMEOUT, timeout)) as rpc:
+        submitted = await rpc.deploy_contract(contract_code, network=NETWORK, args=constructor_args)
+        if isinstance(submitted, dict) and submitted.get("address"):
+            return submitted["address"]
+        tx_hash = submitted["hash"] if isinstance(submitted, dict) else submitted
+        print(f"   Transaction: {tx_hash}")
+        receipt = await rpc.wait_for_receipt(tx_hash, timeout=timeout)
+        address = _receipt_address(receipt)
+        if not address:
+            raise RpcError("Deployment receipt has no contract address", data=receipt)
+        return address
+
+
+parser = argparse.ArgumentParser(description="Deploy JusticeOracle to GenLayer")
+parser.add_argument("--treasury", default="", help="treasury address constructor argument")
+parser.add_argument("--force", action="store_true", help="redeploy even if the contract is unchanged")
+parser.add_argument("--timeout", type=float, default=300.0, help="seconds to wait for the deploy receipt")
+args = parser.parse_args()
 
 print("🚀 Justice Oracle - Terminal Deployment")
 print("=" * 60)
 print()
 
 # Read contract
-contract_path = Path("contracts/JusticeOracle.py")
-if not contract_path.exists():
+if not CONTRACT_PATH.exists():
     print("❌ Error: contracts/JusticeOracle.py not found")
     exit(1)
 
-with open(contract_path) as f:
+with open(CONTRACT_PATH) as f:
     contract_code = f.read()
 
+constructor_args = [args.treasury] if args.treasury else []
+key = deployment_key(contract_code, constructor_args, NETWORK, GENLAYER_RPC)
+
 print("✅ Contract loaded")
 print(f"   Lines: {len(contract_code.splitlines())}")
 print(f"   Size: {len(contract_code)} bytes")
-print()
-
-# Deploy contract
-print("📤 Deploying to GenLayer testnet...")
-print("   (This may take 30-60 seconds)")
+print(f"   Hash: {key[:16]}")
 print()
 
 try:
-    # Prepare deployment payload
-    payload = {
-        "jsonrpc": "2.0",
-        "method": "deploy_contract",
-        "params": {
-            "code": contract_code,
+    previous = load_deployment_info()
+    reuse = previous.get("deployment_key") == key and previous.get("contract_address") and not args.force
+    if reuse and not asyncio.run(contract_exists(previous["contract_address"])):
+        print(f"⚠️  No contract answers at {previous['contract_address']} any more - deploying again")
+        print()
+        reuse = False
+
+    if reuse:
+        contract_address = previous["contract_address"]
+        print("♻️  Contract unchanged since last deploy - reusing it")
+        print(f"📍 Address: {contract_address}")
+        print()
+    else:
+        # Deploy contract
+        print("📤 Deploying to GenLayer testnet...")
+        print("   (Polling for the receipt; this may take 30-60 seconds)")
+        print()
+
+        contract_address = asyncio.run(deploy(contract_code, constructor_args, args.timeout))
+
+        print("✅ Contract deployed successfully!")
+        print(f"📍 Address: {contract_address}")
+        print()
+
+        # Save deployment info
+        deployment_info = {
+            "contract_address": contract_address,
             "network": NETWORK,
-        },
-        "id": 1
-    }
-    
-    # Send deployment request
-    response = requests.post(GENLAYER_RPC, json=payload, timeout=120)
-    result = response.json()
-    
-    if "error" in result:
-        print(f"❌ Deployment failed: {result['error']['message']}")
-        exit(1)
-    
-    contract_address = result["result"]["address"]
-    
-    print("✅ Contract deployed successfully!")
-    print(f"📍 Address: {contract_address}")
-    print()
-    
-    # Update frontend .env.local
+            "rpc": GENLAYER_RPC,
+            "deployment_key": key,
+            "constructor_args": constructor_args,
+            "min_stake": 10,
+            "platform_fee": 1
+        }
+
+        with open(DEPLOYMENT_INFO, "w") as f:
+            json.dump(deployment_info, f, indent=2)
+
+        print(f"✅ Deployment info saved: {DEPLOYMENT_INFO}")
+        print()
+
+    # Update frontend .env.local only when it points elsewhere
     print("⚙️  Configuring frontend...")
-    
-    frontend_dir = Path("frontend")
-    env_file = frontend_dir / ".env.local"
-    
-    env_content = f"""# Auto-generated by deploy_local.py
-# GenLayer testnet configuration
-
-NEXT_PUBLIC_GENLAYER_RPC={GENLAYER_RPC}
-NEXT_PUBLIC_CONTRACT_ADDRESS={contract_address}
-NEXT_PUBLIC_NETWORK={NETWORK}
-"""
-    
-    with open(env_file, "w") as f:
-        f.write(env_content)
-    
-    print("✅ Frontend configured")
+    env_file = frontend_env_file()
+    if write_frontend_env(contract_address, GENLAYER_RPC, NETWORK, env_file):
+        print("✅ Frontend configured")
+    else:
+        print("✅ Frontend already points at this contract - left unchanged")
     print(f"   Config: {env_file}")
     print()
-    
-    # Save deployment info
-    deployment_info = {
-        "contract_address": contract_address,
-        "network": NETWORK,
-        "rpc": GENLAYER_RPC,
-        "min_stake": 10,
-        "platform_fee": 1
-    }
-    
-    with open("deployment_info.json", "w") as f:
-        json.dump(deployment_info, f, indent=2)
-    
-    print("✅ Deployment info saved: deployment_info.json")
-    print()
-    
+
     # Print summary
     print("🎉 Deployment Complete!")
     print("=" * 60)
@@ -112,14 +169,17 @@ NEXT_PUBLIC_NETWORK={NETWORK}
     print("   • Platform fee:     1% of stake")
     print()
     print("📝 Next steps:")
-    print("   1. cd frontend")
-    print("   2. npm run dev")
-    print("   3. Open http://localhost:3000")
+    print("   1. npm run dev")
+    print("   2. Open http://localhost:3000")
     print()
     print("✅ System ready for production use!")
     print()
 
-except requests.exceptions.Timeout:
+except RpcError as e:
+    print(f"❌ Deployment failed: {e}")
+    exit(1)
+
+except (ReceiptTimeout, asyncio.TimeoutError):
     print("❌ Deployment timed out. Please try again or use GenLayer Studio.")
     print("   URL: https://studio.genlayer.com/")
     exit(1)
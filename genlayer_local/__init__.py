@@ -0,0 +1,37 @@
+"""
+Local in-process stand-in for the GenLayer runtime
+
+Runs contracts/JusticeOracle.py offline, without GenLayer Studio:
+
+    from genlayer_local import Runtime, load_contract
+
+    module = load_contract()
+    rt = Runtime()
+    oracle = rt.deploy(module.JusticeOracle, sender=ADMIN)
+    plaintiff = rt.bind(oracle, sender=ALICE)
+    dispute_id = plaintiff.file_dispute(BOB, description, [], value=10)
+"""
+
+from .backends import ScriptedLLM, StaticWeb, default_verdict
+from .recording import Cassette, FixtureMiss, RecordedError
+from .runtime import ConsensusRejected, ContractHandle, Runtime, RuntimeStats, load_contract
+from .types import Address, DynArray, TreeMap, u8, u256
+
+__all__ = [
+    "Address",
+    "Cassette",
+    "ConsensusRejected",
+    "ContractHandle",
+    "DynArray",
+    "FixtureMiss",
+    "RecordedError",
+    "Runtime",
+    "RuntimeStats",
+    "ScriptedLLM",
+    "StaticWeb",
+    "TreeMap",
+    "default_verdict",
+    "load_contract",
+    "u8",
+    "u256",
+]
@@ -0,0 +1,78 @@
+"""
+Pluggable fake LLM and web backends for the local runtime
+
+A backend is any callable: LLM backends take (prompt, response_format) and
+web backends take (url, mode), both returning text.
+"""
+
+import json
+
+
+def default_verdict(verdict: str = "plaintiff_wins", plaintiff_percent: int = 70, confidence: int = 80) -> dict:
+    """Verdict payload that passes the contract's judicial-quality validator"""
+    sentence = (
+        "The submitted evidence was weighed against the case description and "
+        "the obligations each party accepted under their agreement. "
+    )
+    reasoning = (sentence * 20).strip()  # ~300 words
+    return {
+        "verdict": verdict,
+        "confidence": confidence,
+        "reasoning": reasoning,
+        "key_factors": ["agreed deliverables", "delivery timeline", "documented defects"],
+        "evidence_weight": {
+            "plaintiff_evidence_strength": 7,
+            "defendant_evidence_strength": 4,
+        },
+        "recommended_distribution": {
+            "plaintiff_percent": plaintiff_percent,
+            "defendant_percent": 100 - plaintiff_percent,
+        },
+    }
+
+
+class ScriptedLLM:
+    """
+    Deterministic LLM stand-in
+    Rules are (substring, response) pairs checked in order; a response may be a
+    string or a callable taking the prompt. Unmatched prompts fall back to a
+    valid verdict for JSON requests and a fixed credibility score otherwise.
+    """
+
+    def __init__(self, rules: list = None, verdict: dict = None, credibility: int = 75):
+        self.rules = list(rules or [])
+        self.verdict = verdict or default_verdict()
+        self.credibility = credibility
+        self.calls = 0
+
+    def add_rule(self, needle: str, response) -> None:
+        self.rules.append((needle, response))
+
+    def __call__(self, prompt: str, response_format: str = "text") -> str:
+        self.calls += 1
+        for needle, response in self.rules:
+            if needle in prompt:
+                return response(prompt) if callable(response) else response
+        if response_format == "json":
+            return json.dumps(self.verdict)
+        return str(self.credibility)
+
+
+class StaticWeb:
+    """
+    Web stand-in serving fixed pages
+    Unknown URLs get `default` text, or raise when `default` is None
+    """
+
+    def __init__(self, pages: dict = None, default: str = "Archived page content unavailable offline."):
+        self.pages = dict(pages or {})
+        self.default = default
+        self.calls = 0
+
+    def __call__(self, url: str, mode: str = "text") -> str:
+        self.calls += 1
+        if url in self.pages:
+            return self.pages[url]
+        if self.default is None:
+            raise Exception(f"No page stubbed for {url}")
+        return self.default
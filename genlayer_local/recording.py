@@ -0,0 +1,109 @@
+"""
+Record/replay fixtures for LLM and web calls
+
+A Cassette wraps the runtime's LLM and web backends. Responses are keyed by a
+SHA-256 digest of the request (prompt or URL plus its format/mode) and stored
+in a JSON fixture file, so replayed runs are fast and deterministic. Upstream
+failures (e.g. a URL that does not render) are recorded too and raised again
+with the same message on replay.
+
+    cassette = Cassette("fixtures/seed_demo_data.json", mode="replay")
+    rt = Runtime(llm=cassette.llm(), web=cassette.web())
+    ...
+    print(cassette.summary())
+"""
+
+import hashlib
+import json
+from pathlib import Path
+
+MODES = ("record", "replay", "auto")
+
+
+class FixtureMiss(Exception):
+    """Raised in replay mode when no recorded response matches a request"""
+
+
+class RecordedError(Exception):
+    """Replay of an upstream call that failed while recording"""
+
+
+def request_digest(kind: str, qualifier: str, payload: str) -> str:
+    return hashlib.sha256(f"{kind}\n{qualifier}\n{payload}".encode()).hexdigest()
+
+
+class Cassette:
+    """
+    Fixture-backed response store
+    record: always call upstream and save; replay: serve fixtures only;
+    auto: serve fixtures, falling back to upstream (and recording) on a miss
+    """
+
+    def __init__(self, path, mode: str = "replay"):
+        if mode not in MODES:
+            raise ValueError(f"Mode must be one of {', '.join(MODES)}")
+        self.path = Path(path)
+        self.mode = mode
+        self.hits = 0
+        self.misses = 0
+        self.recorded = 0
+        self.entries = {"llm": {}, "web": {}}
+        if mode != "record" and self.path.exists():
+            with open(self.path) as f:
+                self.entries.update(json.load(f))
+
+    def llm(self, upstream=None):
+        def exec_prompt(prompt: str, response_format: str = "text") -> str:
+            return self._lookup("llm", response_format, prompt, upstream)
+        return exec_prompt
+
+    def web(self, upstream=None):
+        def render(url: str, mode: str = "text") -> str:
+            return self._lookup("web", mode, url, upstream)
+        return render
+
+    def _lookup(self, kind: str, qualifier: str, payload: str, upstream) -> str:
+        key = request_digest(kind, qualifier, payload)
+        if self.mode != "record":
+            entry = self.entries[kind].get(key)
+            if entry is not None:
+                self.hits += 1
+                if "error" in entry:
+                    raise RecordedError(entry["error"])
+                return entry["response"]
+            self.misses += 1
+            if self.mode == "replay" or upstream is None:
+                raise FixtureMiss(f"No recorded {kind} response for {payload[:80]!r}")
+
+        if upstream is None:
+            raise FixtureMiss(f"Recording {kind} calls needs an upstream backend")
+        entry = {"request": payload[:200], _qualifier_field(kind): qualifier}
+        try:
+            response = upstream(payload, qualifier)
+        except Exception as e:
+            self.entries[kind][key] = {**entry, "error": str(e)}
+            self.recorded += 1
+            raise
+        self.entries[kind][key] = {**entry, "response": response}
+        self.recorded += 1
+        return response
+
+    def save(self) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.path, "w") as f:
+            json.dump(self.entries, f, indent=2, sort_keys=True)
+            f.write("\n")
+
+    def summary(self) -> dict:
+        lookups = self.hits + self.misses
+        return {
+            "mode": self.mode,
+            "hits": self.hits,
+            "misses": self.misses,
+            "recorded": self.recorded,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+        }
+
+
+def _qualifier_field(kind: str) -> str:
+    return "response_format" if kind == "llm" else "mode"
@@ -0,0 +1,263 @@
+"""
+In-process execution of GenLayer contracts
+
+The Runtime plays the node: it deploys contract classes, sets `gl.message`
+for each call, routes nondeterministic calls to fake backends and runs the
+leader/validator pair of `gl.vm.run_nondet` locally. Like a node, it rolls
+back storage, balance and transfers when a write call raises.
+"""
+
+import sys
+import types
+from pathlib import Path
+
+from .backends import ScriptedLLM, StaticWeb
+from .recording import FixtureMiss
+from .types import MISSING, Address, StorageStats, new_storage
+
+_active = None
+
+DEFAULT_CONTRACT_PATH = Path(__file__).resolve().parent.parent / "contracts" / "JusticeOracle.py"
+
+
+class ConsensusRejected(Exception):
+    """Raised when validators reject every leader result of run_nondet"""
+
+
+def active_runtime() -> "Runtime":
+    if _active is None:
+        raise RuntimeError("No GenLayer call in progress; use Runtime.deploy() or Runtime.call()")
+    return _active
+
+
+def _as_address(value) -> Address:
+    return value if isinstance(value, Address) else Address(value)
+
+
+class Message:
+    """Per-call transaction context exposed as `gl.message`"""
+
+    def __init__(self, sender_address: Address, value: int = 0, contract_address: Address = None):
+        self.sender_address = sender_address
+        self.value = value
+        self.contract_address = contract_address
+
+
+class RuntimeStats:
+    """Counters for storage, LLM, web and consensus activity"""
+
+    def __init__(self):
+        self.storage = StorageStats()
+        self.reset()
+
+    def reset(self) -> None:
+        self.storage.reads = 0
+        self.storage.writes = 0
+        self.prompts = 0
+        self.prompt_chars = 0
+        self.renders = 0
+        self.render_bytes = 0
+        self.consensus_rounds = 0
+        self.consensus_rejections = 0
+        self.transfers = 0
+
+    def as_dict(self) -> dict:
+        return {
+            "storage_reads": self.storage.reads,
+            "storage_writes": self.storage.writes,
+            "prompts": self.prompts,
+            "prompt_chars": self.prompt_chars,
+            "renders": self.renders,
+            "render_bytes": self.render_bytes,
+            "consensus_rounds": self.consensus_rounds,
+            "consensus_rejections": self.consensus_rejections,
+            "transfers": self.transfers,
+        }
+
+
+class Runtime:
+    """Local GenLayer node stand-in with pluggable LLM and web backends"""
+
+    def __init__(self, llm=None, web=None, max_consensus_rounds: int = 3):
+        self.llm = llm if llm is not None else ScriptedLLM()
+        self.web = web if web is not None else StaticWeb()
+        self.max_consensus_rounds = max_consensus_rounds
+        self.stats = RuntimeStats()
+        self.message = None
+        self.transfers = []
+        self._next_contract = 1
+
+    def _enter(self, message: Message):
+        global _active
+        previous = (_active, self.message)
+        _active = self
+        self.message = message
+        return previous
+
+    def _exit(self, previous) -> None:
+        global _active
+        _active, self.message = previous
+
+    def deploy(self, contract_cls, *args, sender, value: int = 0, **kwargs):
+        """Instantiate a contract class as if deployed by `sender`"""
+        address = Address(self._next_contract.to_bytes(20, "big"))
+        self._next_contract += 1
+        previous = self._enter(Message(_as_address(sender), value, address))
+        try:
+            contract = contract_cls.__new__(contract_cls)
+            contract._gl_address = address
+            contract._gl_balance = value
+            contract._gl_stats = self.stats.storage
+            scalars = set()
+            for name, annotation in _storage_annotations(contract_cls):
+                storage = new_storage(annotation, self.stats.storage)
+                if storage is not None:
+                    setattr(contract, name, storage)
+                else:
+                    scalars.add(name)
+            contract_cls._gl_fields = frozenset(scalars)
+            contract.__init__(*args, **kwargs)
+        finally:
+            self._exit(previous)
+        return contract
+
+    def call(self, contract, method: str, *args, sender, value: int = 0, **kwargs):
+        """Invoke a public contract method as `sender`, attaching `value` tokens"""
+        fn = getattr(type(contract), method, None)
+        kind = getattr(fn, "__gl_public__", None)
+        if kind is None:
+            raise AttributeError(f"{type(contract).__name__}.{method} is not a public method")
+        if value and kind != "payable":
+            raise Exception(f"{method} is not payable")
+        previous = self._enter(Message(_as_address(sender), value, contract._gl_address))
+        if kind == "view":
+            try:
+                return fn(contract, *args, **kwargs)
+            finally:
+                self._exit(previous)
+
+        maps = self._begin(contract)
+        balance = contract._gl_balance
+        transfers = len(self.transfers)
+        try:
+            contract._gl_balance += value
+            result = fn(contract, *args, **kwargs)
+        except BaseException:
+            self._rollback(contract, maps)
+            contract._gl_balance = balance
+            del self.transfers[transfers:]
+            raise
+        else:
+            for storage_map in maps:
+                storage_map.commit()
+            contract._gl_journal = None
+            return result
+        finally:
+            self._exit(previous)
+
+    @staticmethod
+    def _begin(contract) -> list:
+        """Open storage journals for a write call"""
+        maps = [
+            object.__getattribute__(contract, name)
+            for name, _ in _storage_annotations(type(contract)) if name not in type(contract)._gl_fields
+        ]
+        for storage_map in maps:
+            storage_map.begin()
+        contract._gl_journal = {}
+        return maps
+
+    @staticmethod
+    def _rollback(contract, maps: list) -> None:
+        for storage_map in maps:
+            storage_map.rollback()
+        journal = contract._gl_journal or {}
+        contract._gl_journal = None
+        for name, value in journal.items():
+            if value is MISSING:
+                contract.__dict__.pop(name, None)
+            else:
+                object.__setattr__(contract, name, value)
+
+    def bind(self, contract, sender) -> "ContractHandle":
+        """Handle whose attribute calls go through `call` as `sender`"""
+        return ContractHandle(self, contract, sender)
+
+    # Hooks behind the `gl` namespace
+
+    def exec_prompt(self, prompt: str, response_format: str = "text") -> str:
+        self.stats.prompts += 1
+        self.stats.prompt_chars += len(prompt)
+        return self.llm(prompt, response_format)
+
+    def render(self, url: str, mode: str = "text") -> str:
+        self.stats.renders += 1
+        page = self.web(url, mode)
+        self.stats.render_bytes += len(page)
+        return page
+
+    def transfer(self, to, amount) -> None:
+        self.stats.transfers += 1
+        self.transfers.append((_as_address(to), int(amount)))
+
+    def run_nondet(self, leader_fn, validator_fn):
+        from .sdk import Return, UserError
+
+        for _ in range(self.max_consensus_rounds):
+            self.stats.consensus_rounds += 1
+            try:
+                outcome = Return(leader_fn())
+            except FixtureMiss:
+                # A missing fixture is a harness problem, not a leader failure
+                raise
+            except Exception as e:
+                outcome = UserError(str(e))
+            if validator_fn(outcome):
+                if isinstance(outcome, UserError):
+                    raise Exception(outcome.message)
+                return outcome.calldata
+            self.stats.consensus_rejections += 1
+        raise ConsensusRejected(f"Validators rejected {self.max_consensus_rounds} leader results")
+
+
+class ContractHandle:
+    """Bound view of a deployed contract: `handle.file_dispute(..., value=10)`"""
+
+    def __init__(self, runtime: Runtime, contract, sender):
+        self._runtime = runtime
+        self._contract = contract
+        self.sender = sender
+
+    def __getattr__(self, method: str):
+        def invoke(*args, value: int = 0, **kwargs):
+            return self._runtime.call(self._contract, method, *args, sender=self.sender, value=value, **kwargs)
+        invoke.__name__ = method
+        return invoke
+
+
+def _storage_annotations(contract_cls):
+    for klass in reversed(contract_cls.__mro__):
+        yield from getattr(klass, "__annotations__", {}).items()
+
+
+def load_contract(path=DEFAULT_CONTRACT_PATH, source: str = None) -> types.ModuleType:
+    """Execute contract source (read from `path` unless given) against the local `genlayer` stand-in"""
+    from . import sdk
+
+    path = Path(path)
+    if source is None:
+        source = path.read_text()
+    module_name = f"genlayer_local.contracts.{path.stem}"
+    module = types.ModuleType(module_name)
+    module.__file__ = str(path)
+    previous = sys.modules.get("genlayer")
+    sys.modules["genlayer"] = sdk
+    sys.modules[module_name] = module
+    try:
+        exec(compile(source, str(path), "exec"), module.__dict__)
+    finally:
+        if previous is None:
+            del sys.modules["genlayer"]
+        else:
+            sys.modules["genlayer"] = previous
+    return module
@@ -0,0 +1,111 @@
+"""
+The `genlayer` module surface as seen by contracts running on the local runtime
+
+`load_contract` installs this module as `genlayer` while executing contract
+source, so `from genlayer import *` resolves here.
+"""
+
+from . import runtime as _runtime
+from .types import MISSING, Address, DynArray, TreeMap, allow_storage, u8, u256
+
+__all__ = ["gl", "Address", "DynArray", "TreeMap", "allow_storage", "u8", "u256"]
+
+
+class Return:
+    """Successful leader result handed to a validator"""
+
+    def __init__(self, calldata):
+        self.calldata = calldata
+
+
+class UserError:
+    """Leader failure handed to a validator"""
+
+    def __init__(self, message: str):
+        self.message = message
+
+
+def _mark(kind: str):
+    def decorator(fn):
+        fn.__gl_public__ = kind
+        return fn
+    return decorator
+
+
+class _Write:
+    payable = staticmethod(_mark("payable"))
+
+    def __call__(self, fn):
+        return _mark("write")(fn)
+
+
+class _Public:
+    view = staticmethod(_mark("view"))
+    write = _Write()
+
+
+class _Web:
+    def render(self, url: str, mode: str = "text") -> str:
+        return _runtime.active_runtime().render(url, mode)
+
+
+class _Nondet:
+    web = _Web()
+
+    def exec_prompt(self, prompt: str, response_format: str = "text") -> str:
+        return _runtime.active_runtime().exec_prompt(prompt, response_format)
+
+
+class _VM:
+    Return = Return
+    UserError = UserError
+
+    def run_nondet(self, leader_fn, validator_fn):
+        return _runtime.active_runtime().run_nondet(leader_fn, validator_fn)
+
+
+class Contract:
+    """
+    Base class for contracts; storage maps are created by Runtime.deploy
+    Reads and writes of scalar storage fields (those listed in `_gl_fields`)
+    are counted like TreeMap and DynArray operations, and writes are journaled while a
+    call is in progress so a failed call can be rolled back.
+    """
+
+    _gl_fields = frozenset()
+    _gl_stats = None
+    _gl_journal = None
+
+    def __getattribute__(self, name):
+        if name in type(self)._gl_fields:
+            stats = object.__getattribute__(self, "_gl_stats")
+            if stats is not None:
+                stats.reads += 1
+        return object.__getattribute__(self, name)
+
+    def __setattr__(self, name, value):
+        if name in type(self)._gl_fields:
+            stats = object.__getattribute__(self, "_gl_stats")
+            if stats is not None:
+                stats.writes += 1
+            journal = object.__getattribute__(self, "_gl_journal")
+            if journal is not None and name not in journal:
+                journal[name] = self.__dict__.get(name, MISSING)
+        object.__setattr__(self, name, value)
+
+
+class _GL:
+    Contract = Contract
+    public = _Public()
+    nondet = _Nondet()
+    vm = _VM()
+
+    @property
+    def message(self) -> "_runtime.Message":
+        return _runtime.active_runtime().message
+
+    def transfer(self, to, amount) -> None:
+        _runtime.active_runtime().transfer(to, amount)
+
+
+gl = _GL()
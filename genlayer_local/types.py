@@ -0,0 +1,244 @@
+"""
+Storage and primitive types mirroring the `genlayer` SDK surface used by the contract
+"""
+
+import copy
+import typing
+from collections.abc import MutableMapping, Sequence
+
+MISSING = object()  # Journal marker for a key or field that did not exist
+
+
+def _sized_int(name: str, bits: int):
+    """Build an int constructor that enforces the unsigned range of a sized type"""
+    limit = 1 << bits
+
+    def cast(value=0) -> int:
+        value = int(value)
+        if value < 0 or value >= limit:
+            raise OverflowError(f"{value} does not fit in {name}")
+        return value
+
+    cast.__name__ = name
+    cast.__qualname__ = name
+    return cast
+
+
+u8 = _sized_int("u8", 8)
+u256 = _sized_int("u256", 256)
+
+
+def allow_storage(cls):
+    """Storage dataclasses need no special handling in-process"""
+    return cls
+
+
+class Address:
+    """20-byte account address"""
+
+    __slots__ = ("_bytes",)
+
+    def __init__(self, value):
+        if isinstance(value, Address):
+            raw = value._bytes
+        elif isinstance(value, (bytes, bytearray)):
+            raw = bytes(value)
+        elif isinstance(value, str):
+            hex_value = value[2:] if value.lower().startswith("0x") else value
+            try:
+                raw = bytes.fromhex(hex_value)
+            except ValueError:
+                raise ValueError(f"Invalid address: {value}")
+        else:
+            raise TypeError(f"Cannot build Address from {type(value).__name__}")
+        if len(raw) != 20:
+            raise ValueError(f"Address must be 20 bytes, got {len(raw)}")
+        self._bytes = raw
+
+    @property
+    def as_hex(self) -> str:
+        return "0x" + self._bytes.hex()
+
+    @property
+    def as_bytes(self) -> bytes:
+        return self._bytes
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, Address):
+            return self._bytes == other._bytes
+        if isinstance(other, str):
+            try:
+                return self._bytes == Address(other)._bytes
+            except (TypeError, ValueError):
+                return False
+        return NotImplemented
+
+    def __hash__(self) -> int:
+        return hash(self._bytes)
+
+    def __repr__(self) -> str:
+        return f"Address({self.as_hex})"
+
+
+class StorageStats:
+    """Storage operation counters shared by every TreeMap of a runtime"""
+
+    __slots__ = ("reads", "writes")
+
+    def __init__(self):
+        self.reads = 0
+        self.writes = 0
+
+
+def new_storage(annotation, stats: StorageStats):
+    """Empty storage collection for a field annotation, or None for scalar fields"""
+    origin = typing.get_origin(annotation) or annotation
+    params = typing.get_args(annotation)
+    if origin is TreeMap:
+        return TreeMap(stats, params[1] if len(params) == 2 else None)
+    if origin is DynArray:
+        return DynArray(stats)
+    return None
+
+
+class DynArray(Sequence):
+    """
+    Append-only storage array; each element read or written is one storage
+    operation and `len` reads the stored length, so appends stay O(1) and a
+    slice costs one read per element returned. While a journal is open it
+    remembers its length and overwritten slots so `rollback` can undo a call.
+    """
+
+    def __init__(self, stats: StorageStats = None):
+        self._items = []
+        self._stats = stats or StorageStats()
+        self._journal = None
+
+    def begin(self) -> None:
+        if self._journal is None:
+            self._journal = (len(self._items), {})
+
+    def commit(self) -> None:
+        self._journal = None
+
+    def rollback(self) -> None:
+        if self._journal is not None:
+            length, overwritten = self._journal
+            del self._items[length:]
+            for index, value in overwritten.items():
+                self._items[index] = value
+        self._journal = None
+
+    def __len__(self) -> int:
+        self._stats.reads += 1
+        return len(self._items)
+
+    def __getitem__(self, index):
+        items = self._items[index]
+        self._stats.reads += len(items) if isinstance(index, slice) else 1
+        return items
+
+    def __setitem__(self, index: int, value) -> None:
+        self._stats.writes += 1
+        if self._journal is not None and index < self._journal[0]:
+            self._journal[1].setdefault(index, copy.deepcopy(self._items[index]))
+        self._items[index] = value
+
+    def __iter__(self):
+        self._stats.reads += len(self._items)
+        return iter(list(self._items))
+
+    def append(self, value) -> None:
+        self._stats.writes += 1
+        self._items.append(value)
+
+
+class TreeMap(MutableMapping):
+    """
+    Key-ordered storage map; every access is counted as a storage operation
+    While a journal is open, the first touch of each key saves a copy of its
+    value (records may be mutated in place) so `rollback` can restore it;
+    DynArray values journal their own changes instead of being copied.
+    """
+
+    def __init__(self, stats: StorageStats = None, value_type=None):
+        self._data = {}
+        self._stats = stats or StorageStats()
+        self._value_type = value_type
+        self._journal = None
+
+    def begin(self) -> None:
+        self._journal = {}
+
+    def commit(self) -> None:
+        for value in (self._journal or {}).values():
+            if isinstance(value, DynArray):
+                value.commit()
+        self._journal = None
+
+    def rollback(self) -> None:
+        for key, value in (self._journal or {}).items():
+            if value is MISSING:
+                self._data.pop(key, None)
+            else:
+                if isinstance(value, DynArray):
+                    value.rollback()
+                self._data[key] = value
+        self._journal = None
+
+    def _touch(self, key) -> None:
+        if self._journal is not None and key not in self._journal:
+            value = self._data.get(key, MISSING)
+            if isinstance(value, DynArray):
+                value.begin()  # journals its own appends and overwrites
+                self._journal[key] = value
+            else:
+                self._journal[key] = value if value is MISSING else copy.deepcopy(value)
+
+    def get_or_insert_default(self, key):
+        """Value at `key`, first storing an empty value of the map's value type"""
+        self._stats.reads += 1
+        self._touch(key)
+        if key not in self._data:
+            if self._value_type is None:
+                raise TypeError("TreeMap has no value type to build a default from")
+            value = new_storage(self._value_type, self._stats)
+            self._data[key] = self._value_type() if value is None else value
+            self._stats.writes += 1
+        return self._data[key]
+
+    def get(self, key, default=None):
+        self._stats.reads += 1
+        self._touch(key)
+        return self._data.get(key, default)
+
+    def __getitem__(self, key):
+        self._stats.reads += 1
+        self._touch(key)
+        return self._data[key]
+
+    def __contains__(self, key) -> bool:
+        self._stats.reads += 1
+        return key in self._data
+
+    def __setitem__(self, key, value) -> None:
+        self._stats.writes += 1
+        self._touch(key)
+        self._data[key] = value
+
+    def __delitem__(self, key) -> None:
+        self._stats.writes += 1
+        self._touch(key)
+        del self._data[key]
+
+    def __iter__(self):
+        return iter(sorted(self._data))
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def items(self):
+        self._stats.reads += len(self._data)
+        for key in self._data:
+            self._touch(key)
+        return [(key, self._data[key]) for key in sorted(self._data)]
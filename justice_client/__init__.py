@@ -0,0 +1,19 @@
+"""
+Async Python client for JusticeOracle over GenLayer JSON-RPC
+
+    async with RpcClient("https://studio.genlayer.com/api") as rpc:
+        oracle = JusticeOracleClient(rpc, CONTRACT_ADDRESS, sender=MY_ADDRESS)
+        stats, page = await rpc.read_many(oracle.address, [("get_stats", []), ("get_disputes_paginated", [0, 20])])
+        dispute_id = await oracle.file_dispute(defendant, description, urls, stake=10)
+"""
+
+from .contract import JusticeOracleClient
+from .rpc import DEFAULT_RPC, ReceiptTimeout, RpcClient, RpcError
+
+__all__ = [
+    "DEFAULT_RPC",
+    "JusticeOracleClient",
+    "ReceiptTimeout",
+    "RpcClient",
+    "RpcError",
+]
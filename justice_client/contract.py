@@ -0,0 +1,145 @@
+"""
+Typed async wrapper around the JusticeOracle contract methods
+"""
+
+from .rpc import RpcClient
+
+
+class JusticeOracleClient:
+    """
+    JusticeOracle bound to a deployed address
+    Writes are sent from `sender`; they return the contract's return value
+    taken from the transaction receipt.
+    """
+
+    def __init__(self, rpc: RpcClient, address: str, sender: str = None, *, receipt_timeout: float = 120.0):
+        self.rpc = rpc
+        self.address = address
+        self.sender = sender
+        self.receipt_timeout = receipt_timeout
+
+    def as_sender(self, sender: str) -> "JusticeOracleClient":
+        """Same contract and connection pool, different signer"""
+        return JusticeOracleClient(self.rpc, self.address, sender, receipt_timeout=self.receipt_timeout)
+
+    async def _read(self, method: str, *args):
+        return await self.rpc.read_contract(self.address, method, list(args))
+
+    async def _write(self, method: str, *args, value: int = 0):
+        if not self.sender:
+            raise ValueError("A sender address is required for contract writes")
+        receipt = await self.rpc.transact(
+            self.address, method, list(args), sender=self.sender, value=value, timeout=self.receipt_timeout
+        )
+        return receipt.get("result")
+
+    async def write_many(self, writes: list, *, concurrency: int = 8, return_exceptions: bool = False) -> list:
+        """Submit (method, args, value) writes concurrently; returns contract results in order"""
+        receipts = await self.rpc.transact_many(
+            self.address, writes, sender=self.sender, timeout=self.receipt_timeout,
+            concurrency=concurrency, return_exceptions=return_exceptions,
+        )
+        return [r if isinstance(r, BaseException) else r.get("result") for r in receipts]
+
+    # Write methods
+
+    async def file_dispute(self, defendant_address: str, case_description: str, evidence_urls: list,
+                           stake: int) -> int:
+        return await self._write("file_dispute", defendant_address, case_description, evidence_urls, value=stake)
+
+    async def submit_evidence(self, dispute_id: int, evidence_type: str, content: str) -> int:
+        return await self._write("submit_evidence", dispute_id, evidence_type, content)
+
+    async def resolve_dispute(self, dispute_id: int) -> dict:
+        return await self._write("resolve_dispute", dispute_id)
+
+    async def finalize_verdict(self, dispute_id: int) -> None:
+        return await self._write("finalize_verdict", dispute_id)
+
+    async def appeal_verdict(self, dispute_id: int, appeal_reason: str) -> None:
+        return await self._write("appeal_verdict", dispute_id, appeal_reason)
+
+    async def update_min_stake(self, new_min_stake: int) -> None:
+        return await self._write("update_min_stake", new_min_stake)
+
+    async def update_platform_fee(self, new_fee: int) -> None:
+        return await self._write("update_platform_fee", new_fee)
+
+    async def update_treasury(self, new_treasury: str) -> None:
+        return await self._write("update_treasury", new_treasury)
+
+    async def transfer_admin(self, new_admin: str) -> None:
+        return await self._write("transfer_admin", new_admin)
+
+    async def withdraw_fees(self, amount: int) -> None:
+        return await self._write("withdraw_fees", amount)
+
+    async def update_evidence_period_blocks(self, new_blocks: int) -> None:
+        return await self._write("update_evidence_period_blocks", new_blocks)
+
+    async def update_appeal_period_blocks(self, new_blocks: int) -> None:
+        return await self._write("update_appeal_period_blocks", new_blocks)
+
+    async def update_fast_track_max_stake(self, new_max_stake: int) -> None:
+        return await self._write("update_fast_track_max_stake", new_max_stake)
+
+    async def update_fast_track_uncontested(self, enabled: bool) -> None:
+        return await self._write("update_fast_track_uncontested", enabled)
+
+    async def reset_metrics(self) -> None:
+        return await self._write("reset_metrics")
+
+    # View methods
+
+    async def get_dispute(self, dispute_id: int) -> dict:
+        return await self._read("get_dispute", dispute_id)
+
+    async def get_dispute_evidence(self, dispute_id: int) -> list:
+        return await self._read("get_dispute_evidence", dispute_id)
+
+    async def get_dispute_evidence_page(self, dispute_id: int, offset: int = 0, limit: int = 20) -> dict:
+        return await self._read("get_dispute_evidence_page", dispute_id, offset, limit)
+
+    async def get_evidence(self, evidence_id: int) -> dict:
+        return await self._read("get_evidence", evidence_id)
+
+    async def get_all_disputes(self) -> list:
+        return await self._read("get_all_disputes")
+
+    async def get_stats(self) -> dict:
+        return await self._read("get_stats")
+
+    async def get_metrics(self) -> dict:
+        return await self._read("get_metrics")
+
+    async def get_disputes_paginated(self, offset: int, limit: int) -> dict:
+        return await self._read("get_disputes_paginated", offset, limit)
+
+    async def export_state(self, dispute_cursor: int = 0, evidence_cursor: int = 0, limit: int = 100) -> dict:
+        return await self._read("export_state", dispute_cursor, evidence_cursor, limit)
+
+    async def iter_export(self, dispute_cursor: int = 0, evidence_cursor: int = 0, limit: int = 100):
+        """Yield export_state chunks until the export is complete"""
+        while True:
+            chunk = await self.export_state(dispute_cursor, evidence_cursor, limit)
+            yield chunk
+            if chunk["done"]:
+                return
+            dispute_cursor = chunk["next_dispute_cursor"]
+            evidence_cursor = chunk["next_evidence_cursor"]
+
+    async def get_disputes(self, dispute_ids: list) -> list:
+        """Fetch several disputes in one JSON-RPC batch"""
+        return await self.rpc.read_many(self.address, [("get_dispute", [i]) for i in dispute_ids])
+
+    async def get_dispute_pages(self, offsets: list, limit: int = 100) -> list:
+        """Fetch several get_disputes_paginated pages in one JSON-RPC batch"""
+        return await self.rpc.read_many(self.address, [("get_disputes_paginated", [o, limit]) for o in offsets])
+
+    async def get_evidence_items(self, evidence_ids: list) -> list:
+        """Fetch several evidence items by id in one JSON-RPC batch"""
+        return await self.rpc.read_many(self.address, [("get_evidence", [i]) for i in evidence_ids])
+
+    async def get_evidence_for(self, dispute_ids: list) -> list:
+        """Fetch evidence lists for several disputes in one JSON-RPC batch"""
+        return await self.rpc.read_many(self.address, [("get_dispute_evidence", [i]) for i in dispute_ids])
@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""
+Stream the full contract state to JSONL
+
+Pages through the contract's export_state view and writes one line per
+record: {"kind": "dispute", ...} for every dispute followed by
+{"kind": "evidence", ...} for every evidence item. Chunks are flushed as they
+arrive, so an interrupted export can be continued with --resume; the cursors
+are recovered from the last dispute and evidence ids already in the file.
+
+Usage:
+    python3 -m justice_client.export --rpc <url> --address <contract> --out backup.jsonl
+    python3 -m justice_client.export --rpc <url> --address <contract> --out backup.jsonl --resume
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import time
+
+from .contract import JusticeOracleClient
+from .rpc import DEFAULT_RPC, RpcClient
+
+CHUNK_SIZE = 100
+
+
+def resume_cursors(path: str) -> tuple:
+    """
+    Next (dispute, evidence) cursors for a partial export at `path`
+    A torn last line from an interrupted write is truncated away.
+    """
+    dispute_cursor = 0
+    evidence_cursor = 0
+    if not os.path.exists(path):
+        return dispute_cursor, evidence_cursor
+
+    with open(path, "rb+") as f:
+        good_bytes = 0
+        for line in f:
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError:
+                break
+            if not line.endswith(b"\n"):
+                break
+            good_bytes += len(line)
+            if record.get("kind") == "dispute":
+                dispute_cursor = max(dispute_cursor, record["dispute_id"] + 1)
+            elif record.get("kind") == "evidence":
+                evidence_cursor = max(evidence_cursor, record["evidence_id"] + 1)
+        f.truncate(good_bytes)
+    return dispute_cursor, evidence_cursor
+
+
+def _chunk_size(value: str) -> int:
+    size = int(value)
+    if not 1 <= size <= 100:
+        raise argparse.ArgumentTypeError("chunk size must be between 1 and 100")
+    return size
+
+
+async def export(oracle: JusticeOracleClient, out, *, dispute_cursor: int = 0, evidence_cursor: int = 0,
+                 chunk_size: int = CHUNK_SIZE, progress=None) -> dict:
+    """Write every record from the given cursors to the text stream `out`; returns counts"""
+    counts = {"disputes": 0, "evidence": 0, "chunks": 0}
+    async for chunk in oracle.iter_export(dispute_cursor, evidence_cursor, chunk_size):
+        lines = [json.dumps({"kind": "dispute", **record}) for record in chunk["disputes"]]
+        lines += [json.dumps({"kind": "evidence", **record}) for record in chunk["evidence"]]
+        if lines:
+            out.write("\n".join(lines) + "\n")
+            out.flush()
+        counts["disputes"] += len(chunk["disputes"])
+        counts["evidence"] += len(chunk["evidence"])
+        counts["chunks"] += 1
+        if progress is not None:
+            progress(counts, chunk)
+    return counts
+
+
+async def run(args) -> dict:
+    dispute_cursor, evidence_cursor = resume_cursors(args.out) if args.resume else (0, 0)
+    if args.resume:
+        print(f"↪️  Resuming at dispute {dispute_cursor}, evidence {evidence_cursor}")
+
+    def progress(counts, chunk):
+        print(f"   {counts['disputes']} disputes, {counts['evidence']} evidence "
+              f"(cursors {chunk['next_dispute_cursor']}/{chunk['next_evidence_cursor']})", end="\r")
+
+    async with RpcClient(args.rpc) as rpc:
+        oracle = JusticeOracleClient(rpc, args.address)
+        with open(args.out, "a" if args.resume else "w") as out:
+            return await export(oracle, out, dispute_cursor=dispute_cursor, evidence_cursor=evidence_cursor,
+                                chunk_size=args.chunk_size, progress=progress)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Export Justice Oracle disputes and evidence to JSONL")
+    parser.add_argument("--rpc", default=DEFAULT_RPC)
+    parser.add_argument("--address", required=True, help="deployed contract address")
+    parser.add_argument("--out", default="justice_export.jsonl")
+    parser.add_argument("--chunk-size", type=_chunk_size, default=CHUNK_SIZE, help="records per request (max 100)")
+    parser.add_argument("--resume", action="store_true", help="continue a partial export in --out")
+    args = parser.parse_args()
+
+    started = time.perf_counter()
+    counts = asyncio.run(run(args))
+    print()
+    print(f"✅ Exported {counts['disputes']} disputes and {counts['evidence']} evidence items "
+          f"in {counts['chunks']} chunks ({time.perf_counter() - started:.1f}s) → {args.out}")
+
+
+if __name__ == "__main__":
+    main()
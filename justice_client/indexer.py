@@ -0,0 +1,431 @@
+#!/usr/bin/env python3
+"""
+Off-chain SQLite indexer for disputes and evidence
+
+Follows a deployed JusticeOracle through its read views and mirrors disputes
+and evidence into SQLite with FTS5 indexes. Each poll is incremental: new
+disputes are fetched by id, open disputes are compared against the
+get_disputes_paginated summaries and re-read in full only when their
+status, verdict or resolution time moved, and only evidence ids past the
+last seen evidence counter are fetched.
+
+Usage:
+    python3 -m justice_client.indexer --rpc <url> --address <contract> --db justice_index.sqlite
+    curl "http://127.0.0.1:8600/search?q=reentrancy"
+    curl "http://127.0.0.1:8600/aggregates"
+"""
+
+import argparse
+import asyncio
+import json
+import sqlite3
+
+from aiohttp import web
+
+from .contract import JusticeOracleClient
+from .rpc import DEFAULT_RPC, RpcClient
+
+FINAL_STATUSES = ("resolved",)
+BATCH_SIZE = 50
+PAGE_SIZE = 100  # get_disputes_paginated maximum
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS disputes (
+    dispute_id INTEGER PRIMARY KEY,
+    plaintiff TEXT NOT NULL,
+    defendant TEXT NOT NULL,
+    case_description TEXT NOT NULL,
+    evidence_urls TEXT NOT NULL,
+    stake_amount INTEGER NOT NULL,
+    status TEXT NOT NULL,
+    verdict TEXT NOT NULL,
+    reasoning TEXT NOT NULL,
+    confidence INTEGER NOT NULL,
+    plaintiff_percent INTEGER NOT NULL,
+    defendant_percent INTEGER NOT NULL,
+    created_at INTEGER NOT NULL,
+    resolved_at INTEGER NOT NULL,
+    evidence_deadline INTEGER NOT NULL,
+    appeal_deadline INTEGER NOT NULL,
+    resolution_track TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS disputes_status ON disputes (status);
+CREATE INDEX IF NOT EXISTS disputes_verdict ON disputes (verdict);
+CREATE INDEX IF NOT EXISTS disputes_track ON disputes (resolution_track);
+
+CREATE TABLE IF NOT EXISTS evidence (
+    evidence_id INTEGER PRIMARY KEY,
+    dispute_id INTEGER NOT NULL,
+    submitted_by TEXT NOT NULL,
+    type TEXT NOT NULL,
+    content TEXT NOT NULL,
+    credibility INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS evidence_dispute ON evidence (dispute_id);
+
+CREATE VIRTUAL TABLE IF NOT EXISTS disputes_fts USING fts5(
+    case_description, reasoning, content='disputes', content_rowid='dispute_id'
+);
+CREATE TRIGGER IF NOT EXISTS disputes_ai AFTER INSERT ON disputes BEGIN
+    INSERT INTO disputes_fts (rowid, case_description, reasoning)
+    VALUES (new.dispute_id, new.case_description, new.reasoning);
+END;
+CREATE TRIGGER IF NOT EXISTS disputes_ad AFTER DELETE ON disputes BEGIN
+    INSERT INTO disputes_fts (disputes_fts, rowid, case_description, reasoning)
+    VALUES ('delete', old.dispute_id, old.case_description, old.reasoning);
+END;
+CREATE TRIGGER IF NOT EXISTS disputes_au AFTER UPDATE ON disputes BEGIN
+    INSERT INTO disputes_fts (disputes_fts, rowid, case_description, reasoning)
+    VALUES ('delete', old.dispute_id, old.case_description, old.reasoning);
+    INSERT INTO disputes_fts (rowid, case_description, reasoning)
+    VALUES (new.dispute_id, new.case_description, new.reasoning);
+END;
+
+CREATE VIRTUAL TABLE IF NOT EXISTS evidence_fts USING fts5(
+    type, content, content='evidence', content_rowid='evidence_id'
+);
+CREATE TRIGGER IF NOT EXISTS evidence_ai AFTER INSERT ON evidence BEGIN
+    INSERT INTO evidence_fts (rowid, type, content) VALUES (new.evidence_id, new.type, new.content);
+END;
+CREATE TRIGGER IF NOT EXISTS evidence_ad AFTER DELETE ON evidence BEGIN
+    INSERT INTO evidence_fts (evidence_fts, rowid, type, content)
+    VALUES ('delete', old.evidence_id, old.type, old.content);
+END;
+CREATE TRIGGER IF NOT EXISTS evidence_au AFTER UPDATE ON evidence BEGIN
+    INSERT INTO evidence_fts (evidence_fts, rowid, type, content)
+    VALUES ('delete', old.evidence_id, old.type, old.content);
+    INSERT INTO evidence_fts (rowid, type, content) VALUES (new.evidence_id, new.type, new.content);
+END;
+
+CREATE TABLE IF NOT EXISTS sync_state (
+    key TEXT PRIMARY KEY,
+    value INTEGER NOT NULL
+);
+"""
+
+DISPUTE_COLUMNS = (
+    "dispute_id", "plaintiff", "defendant", "case_description", "evidence_urls", "stake_amount",
+    "status", "verdict", "reasoning", "confidence", "plaintiff_percent", "defendant_percent",
+    "created_at", "resolved_at", "evidence_deadline", "appeal_deadline", "resolution_track",
+)
+
+
+class IndexStore:
+    """SQLite mirror of contract state plus the query surface"""
+
+    def __init__(self, path: str = ":memory:"):
+        self.db = sqlite3.connect(path)
+        self.db.row_factory = sqlite3.Row
+        self.db.executescript(SCHEMA)
+
+    def close(self) -> None:
+        self.db.close()
+
+    def get_state(self, key: str, default: int = 0) -> int:
+        row = self.db.execute("SELECT value FROM sync_state WHERE key = ?", (key,)).fetchone()
+        return row["value"] if row else default
+
+    def set_state(self, key: str, value: int) -> None:
+        self.db.execute(
+            "INSERT INTO sync_state (key, value) VALUES (?, ?) "
+            "ON CONFLICT (key) DO UPDATE SET value = excluded.value",
+            (key, value),
+        )
+
+    def open_dispute_ids(self) -> list:
+        placeholders = ", ".join("?" for _ in FINAL_STATUSES)
+        rows = self.db.execute(
+            f"SELECT dispute_id FROM disputes WHERE status NOT IN ({placeholders}) ORDER BY dispute_id",
+            FINAL_STATUSES,
+        )
+        return [row["dispute_id"] for row in rows]
+
+    def dispute_summaries(self, dispute_ids: list) -> dict:
+        """dispute_id -> (status, verdict, resolved_at) as last indexed"""
+        placeholders = ", ".join("?" for _ in dispute_ids)
+        rows = self.db.execute(
+            f"SELECT dispute_id, status, verdict, resolved_at FROM disputes WHERE dispute_id IN ({placeholders})",
+            dispute_ids,
+        )
+        return {row["dispute_id"]: (row["status"], row["verdict"], row["resolved_at"]) for row in rows}
+
+    def upsert_dispute(self, dispute: dict) -> bool:
+        """Insert or update a dispute; returns True when the stored row changed"""
+        values = (
+            dispute["dispute_id"], dispute["plaintiff"], dispute["defendant"], dispute["case_description"],
+            json.dumps(dispute["evidence_urls"]), dispute["stake_amount"], dispute["status"],
+            dispute["verdict"], dispute["reasoning"], dispute["confidence"],
+            dispute["distribution"]["plaintiff_percent"], dispute["distribution"]["defendant_percent"],
+            dispute["created_at"], dispute["resolved_at"], dispute["evidence_deadline"], dispute["appeal_deadline"],
+            dispute.get("resolution_track", ""),
+        )
+        current = self.db.execute("SELECT * FROM disputes WHERE dispute_id = ?", (dispute["dispute_id"],)).fetchone()
+        if current is not None and tuple(current) == values:
+            return False
+        columns = ", ".join(DISPUTE_COLUMNS)
+        placeholders = ", ".join("?" for _ in DISPUTE_COLUMNS)
+        updates = ", ".join(f"{c} = excluded.{c}" for c in DISPUTE_COLUMNS[1:])
+        self.db.execute(
+            f"INSERT INTO disputes ({columns}) VALUES ({placeholders}) "
+            f"ON CONFLICT (dispute_id) DO UPDATE SET {updates}",
+            values,
+        )
+        return True
+
+    def upsert_evidence(self, items: list) -> int:
+        """Insert evidence not seen before; returns the number of new rows"""
+        added = 0
+        for item in items:
+            if not item:
+                continue
+            cursor = self.db.execute(
+                "INSERT OR IGNORE INTO evidence (evidence_id, dispute_id, submitted_by, type, content, credibility) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (item["evidence_id"], item["dispute_id"], item["submitted_by"], item["type"], item["content"],
+                 item["credibility"]),
+            )
+            added += cursor.rowcount
+        return added
+
+    def commit(self) -> None:
+        self.db.commit()
+
+    # Queries
+
+    def search(self, query: str, limit: int = 20) -> list:
+        """Full-text search over case descriptions, reasoning and evidence; best matches first"""
+        rows = self.db.execute(
+            """
+            SELECT d.dispute_id, d.status, d.verdict, d.confidence, MIN(hits.rank) AS rank,
+                   GROUP_CONCAT(DISTINCT hits.source) AS matched_in,
+                   MAX(hits.snippet) AS snippet
+            FROM (
+                SELECT rowid AS dispute_id, rank, 'dispute' AS source,
+                       snippet(disputes_fts, -1, '[', ']', '…', 12) AS snippet
+                FROM disputes_fts WHERE disputes_fts MATCH :q
+                UNION ALL
+                SELECT e.dispute_id, evidence_fts.rank, 'evidence' AS source,
+                       snippet(evidence_fts, 1, '[', ']', '…', 12) AS snippet
+                FROM evidence_fts JOIN evidence e ON e.evidence_id = evidence_fts.rowid
+                WHERE evidence_fts MATCH :q
+            ) AS hits
+            JOIN disputes d ON d.dispute_id = hits.dispute_id
+            GROUP BY d.dispute_id
+            ORDER BY rank
+            LIMIT :limit
+            """,
+            {"q": query, "limit": limit},
+        )
+        return [dict(row) for row in rows]
+
+    def filter_disputes(self, *, status: str = None, verdict: str = None, party: str = None,
+                        min_stake: int = None, track: str = None, limit: int = 50, offset: int = 0) -> list:
+        clauses, params = [], []
+        if status:
+            clauses.append("status = ?")
+            params.append(status)
+        if verdict:
+            clauses.append("verdict = ?")
+            params.append(verdict)
+        if party:
+            clauses.append("(lower(plaintiff) = lower(?) OR lower(defendant) = lower(?))")
+            params.extend([party, party])
+        if min_stake is not None:
+            clauses.append("stake_amount >= ?")
+            params.append(min_stake)
+        if track:
+            clauses.append("resolution_track = ?")
+            params.append(track)
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+        rows = self.db.execute(
+            f"SELECT dispute_id, plaintiff, defendant, status, verdict, confidence, stake_amount, created_at, "
+            f"resolution_track "
+            f"FROM disputes {where} ORDER BY dispute_id LIMIT ? OFFSET ?",
+            (*params, limit, offset),
+        )
+        return [dict(row) for row in rows]
+
+    def aggregates(self) -> dict:
+        by_status = self.db.execute(
+            "SELECT status, COUNT(*) AS disputes, SUM(stake_amount) AS total_stake "
+            "FROM disputes GROUP BY status ORDER BY status"
+        )
+        by_verdict = self.db.execute(
+            "SELECT verdict, COUNT(*) AS disputes, AVG(confidence) AS avg_confidence, "
+            "AVG(plaintiff_percent) AS avg_plaintiff_percent "
+            "FROM disputes WHERE verdict != '' GROUP BY verdict ORDER BY verdict"
+        )
+        by_track = self.db.execute(
+            "SELECT resolution_track, COUNT(*) AS disputes, AVG(confidence) AS avg_confidence "
+            "FROM disputes WHERE resolution_track != '' GROUP BY resolution_track ORDER BY resolution_track"
+        )
+        by_evidence_type = self.db.execute(
+            "SELECT type, COUNT(*) AS items, AVG(credibility) AS avg_credibility "
+            "FROM evidence GROUP BY type ORDER BY items DESC LIMIT 50"
+        )
+        totals = self.db.execute(
+            "SELECT (SELECT COUNT(*) FROM disputes) AS disputes, (SELECT COUNT(*) FROM evidence) AS evidence, "
+            "(SELECT AVG(stake_amount) FROM disputes) AS avg_stake"
+        ).fetchone()
+        return {
+            "totals": dict(totals),
+            "by_status": [dict(row) for row in by_status],
+            "by_verdict": [dict(row) for row in by_verdict],
+            "by_track": [dict(row) for row in by_track],
+            "by_evidence_type": [dict(row) for row in by_evidence_type],
+        }
+
+
+class Indexer:
+    """Incrementally mirrors one contract into an IndexStore"""
+
+    def __init__(self, oracle: JusticeOracleClient, store: IndexStore, batch_size: int = BATCH_SIZE):
+        self.oracle = oracle
+        self.store = store
+        self.batch_size = batch_size
+
+    async def _fetch_disputes(self, dispute_ids: list) -> int:
+        changed = 0
+        for start in range(0, len(dispute_ids), self.batch_size):
+            chunk = dispute_ids[start:start + self.batch_size]
+            for dispute in await self.oracle.get_disputes(chunk):
+                if dispute and self.store.upsert_dispute(dispute):
+                    changed += 1
+        return changed
+
+    async def _changed_dispute_ids(self, open_ids: list) -> list:
+        """Open disputes whose summary differs from the indexed row, via summary pages"""
+        known = self.store.dispute_summaries(open_ids)
+        offsets = sorted({dispute_id // PAGE_SIZE * PAGE_SIZE for dispute_id in open_ids})
+        changed = []
+        for start in range(0, len(offsets), self.batch_size):
+            for page in await self.oracle.get_dispute_pages(offsets[start:start + self.batch_size], PAGE_SIZE):
+                for summary in page["disputes"]:
+                    dispute_id = summary["dispute_id"]
+                    current = (summary["status"], summary["verdict"], summary["resolved_at"])
+                    if dispute_id in known and known[dispute_id] != current:
+                        changed.append(dispute_id)
+        return changed
+
+    async def _fetch_evidence(self, evidence_ids: list) -> int:
+        added = 0
+        for start in range(0, len(evidence_ids), self.batch_size):
+            chunk = evidence_ids[start:start + self.batch_size]
+            added += self.store.upsert_evidence(await self.oracle.get_evidence_items(chunk))
+        return added
+
+    async def poll_once(self) -> dict:
+        """One incremental sync pass; returns what changed"""
+        stats = await self.oracle.get_stats()
+        known_disputes = self.store.get_state("dispute_counter")
+        known_evidence = self.store.get_state("evidence_counter")
+        total_disputes = stats["total_disputes"]
+        total_evidence = stats["total_evidence_submitted"]
+
+        new_ids = list(range(known_disputes, total_disputes))
+        open_ids = self.store.open_dispute_ids()
+        refresh_ids = await self._changed_dispute_ids(open_ids) if open_ids else []
+        changed = await self._fetch_disputes(refresh_ids + new_ids)
+        # Evidence ids are sequential, so everything new sits past the last counter
+        evidence_added = await self._fetch_evidence(list(range(known_evidence, total_evidence)))
+
+        self.store.set_state("dispute_counter", total_disputes)
+        self.store.set_state("evidence_counter", total_evidence)
+        self.store.commit()
+        return {
+            "new_disputes": len(new_ids),
+            "checked": len(open_ids),
+            "refreshed": len(refresh_ids),
+            "changed": changed,
+            "new_evidence": evidence_added,
+        }
+
+    async def run(self, interval: float) -> None:
+        while True:
+            try:
+                result = await self.poll_once()
+                if result["changed"] or result["new_evidence"]:
+                    print(f"🔄 Indexed {result['changed']} dispute changes, {result['new_evidence']} evidence items")
+            except Exception as e:
+                print(f"⚠️  Poll failed: {e}")
+            await asyncio.sleep(interval)
+
+
+def make_app(store: IndexStore, indexer: Indexer = None, interval: float = 10.0) -> web.Application:
+    app = web.Application()
+
+    async def search(request: web.Request) -> web.Response:
+        query = request.query.get("q", "").strip()
+        if not query:
+            raise web.HTTPBadRequest(text="Missing q parameter")
+        try:
+            results = store.search(query, int(request.query.get("limit", 20)))
+        except sqlite3.OperationalError as e:
+            raise web.HTTPBadRequest(text=f"Invalid search query: {e}")
+        return web.json_response({"query": query, "results": results})
+
+    async def disputes(request: web.Request) -> web.Response:
+        q = request.query
+        results = store.filter_disputes(
+            status=q.get("status"),
+            verdict=q.get("verdict"),
+            party=q.get("party"),
+            min_stake=int(q["min_stake"]) if "min_stake" in q else None,
+            track=q.get("track"),
+            limit=min(int(q.get("limit", 50)), 500),
+            offset=int(q.get("offset", 0)),
+        )
+        return web.json_response({"disputes": results})
+
+    async def aggregates(request: web.Request) -> web.Response:
+        return web.json_response(store.aggregates())
+
+    async def status(request: web.Request) -> web.Response:
+        return web.json_response({
+            "dispute_counter": store.get_state("dispute_counter"),
+            "evidence_counter": store.get_state("evidence_counter"),
+        })
+
+    app.router.add_get("/search", search)
+    app.router.add_get("/disputes", disputes)
+    app.router.add_get("/aggregates", aggregates)
+    app.router.add_get("/status", status)
+
+    if indexer is not None:
+        async def start_polling(app):
+            app["poller"] = asyncio.create_task(indexer.run(interval))
+
+        async def stop_polling(app):
+            app["poller"].cancel()
+
+        app.on_startup.append(start_polling)
+        app.on_cleanup.append(stop_polling)
+    return app
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Index Justice Oracle disputes into SQLite")
+    parser.add_argument("--rpc", default=DEFAULT_RPC)
+    parser.add_argument("--address", required=True, help="deployed contract address")
+    parser.add_argument("--db", default="justice_index.sqlite")
+    parser.add_argument("--interval", type=float, default=10.0, help="seconds between polls")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8600)
+    args = parser.parse_args()
+
+    store = IndexStore(args.db)
+    rpc = RpcClient(args.rpc)
+    indexer = Indexer(JusticeOracleClient(rpc, args.address), store)
+    app = make_app(store, indexer, args.interval)
+
+    async def close_rpc(app):
+        await rpc.close()
+        store.close()
+
+    app.on_cleanup.append(close_rpc)
+    print(f"🗂️  Indexing {args.address} into {args.db}; queries on http://{args.host}:{args.port}")
+    web.run_app(app, host=args.host, port=args.port, print=None)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,402 @@
+#!/usr/bin/env python3
+"""
+Synthetic load generator for JusticeOracle
+
+Builds a reproducible plan (fixed seed) of N disputes from parameterized
+templates, with a per-dispute evidence count and a lifecycle mix (left in
+evidence gathering, resolved, appealed, finalized), then drives it
+concurrently against a target:
+
+  • local: the genlayer_local runtime, in-process
+  • rpc:   any JSON-RPC endpoint; deploys a fresh contract unless --address
+           is given. Only the local stub node (justice_client.stub_server)
+           can move contract time, so elsewhere the resolve, appeal and
+           finalize phases are skipped and reported as such
+
+With clock control the evidence and appeal windows are widened for the run
+and restored after. Reports throughput per phase, a latency histogram per
+contract method and the lifecycle mix the calls actually reached.
+
+Usage:
+    python3 -m justice_client.loadgen --disputes 1000 --evidence 0-4 --seed 7
+    python3 -m justice_client.loadgen --target rpc --rpc http://127.0.0.1:4000/api --disputes 200
+"""
+
+import argparse
+import asyncio
+import json
+import random
+import time
+from collections import defaultdict
+from pathlib import Path
+
+from .rpc import RpcClient
+
+CONTRACT_PATH = Path(__file__).resolve().parent.parent / "contracts" / "JusticeOracle.py"
+ADMIN = "0x" + "11" * 20
+MAX_PERIOD_BLOCKS = 10_000_000
+CLOCK_PHASES = ("resolve_dispute", "appeal_verdict", "finalize_verdict")
+STUB_NETWORK = "genlayer-local"  # net_version reported by justice_client.stub_server
+HISTOGRAM_BOUNDS_MS = (1, 2, 5, 10, 20, 50, 100, 200, 500, 1000, 2000, 5000)
+
+DISPUTE_TEMPLATES = [
+    "I hired {vendor} on {date} to build {deliverable} for ${amount}, due within {days} days. "
+    "The work arrived {late} days late and {defect}. {vendor} refuses to fix it and demands full payment.",
+    "I commissioned {deliverable} from {vendor} for ${amount} on {date}. The delivered work {defect}, "
+    "which contradicts the written agreement. I am asking for a refund of the amount paid.",
+    "{vendor} was paid ${amount} on {date} to audit {deliverable}. Within {days} days of the report, "
+    "an issue the audit should have caught {defect}. I am seeking partial compensation.",
+]
+VENDORS = ["Bob's Dev Shop", "Sarah Designs", "BlockSec Auditors", "PixelForge", "Nimbus Labs", "QuillWorks"]
+DELIVERABLES = ["an e-commerce website", "a brand logo", "a DeFi lending contract", "a mobile app",
+                "a translation of our docs", "a data pipeline"]
+DEFECTS = ["was missing two of five agreed features", "matched a $5 stock template",
+           "caused a $50,000 loss through reentrancy", "crashed on every checkout",
+           "failed the acceptance tests in the contract", "had no admin panel"]
+EVIDENCE_TYPES = ["written_agreement", "technical_report", "communication_log", "invoice", "screenshot"]
+EVIDENCE_TEMPLATES = [
+    "Email from {date} confirming the agreed scope, price of ${amount} and a {days}-day deadline.",
+    "Independent review found {count} critical defects; the deliverable {defect}.",
+    "Chat log: the client requested fixes {count} times; the vendor replied once, calling it out of scope.",
+]
+
+
+class LocalTarget:
+    """genlayer_local runtime in-process; calls run inline on the event loop"""
+
+    name = "local"
+    controls_clock = True
+
+    def __init__(self, llm=None, web=None):
+        from genlayer_local import Runtime, load_contract
+
+        self.runtime = Runtime(llm=llm, web=web)
+        self.oracle = self.runtime.deploy(load_contract(CONTRACT_PATH).JusticeOracle, sender=ADMIN)
+
+    async def write(self, method: str, args: list, sender: str, value: int = 0):
+        return self.runtime.call(self.oracle, method, *args, sender=sender, value=value)
+
+    async def read(self, method: str, args: list):
+        return self.runtime.call(self.oracle, method, *args, sender=ADMIN)
+
+    async def advance_clock(self, blocks: int) -> None:
+        self.oracle.genesis_block = self.oracle.genesis_block + blocks
+
+    async def close(self) -> None:
+        pass
+
+
+class RpcTarget:
+    """Contract behind a JSON-RPC endpoint"""
+
+    name = "rpc"
+
+    def __init__(self, url: str, address: str = None, connections: int = 64):
+        self.rpc = RpcClient(url, connections=connections)
+        self.address = address
+        self.network = None
+        self.controls_clock = False
+
+    async def setup(self) -> None:
+        # Only the stub node can move contract time, which the resolve and finalize phases need
+        self.network = await self.rpc.call("net_version", [])
+        self.controls_clock = self.network == STUB_NETWORK
+        if not self.address:
+            deployed = await self.rpc.deploy_contract(CONTRACT_PATH.read_text())
+            self.address = deployed["address"]
+
+    async def write(self, method: str, args: list, sender: str, value: int = 0):
+        receipt = await self.rpc.transact(self.address, method, args, sender=sender, value=value)
+        return receipt.get("result")
+
+    async def read(self, method: str, args: list):
+        return await self.rpc.read_contract(self.address, method, args)
+
+    async def advance_clock(self, blocks: int) -> None:
+        await self.rpc.call("stub_advance_clock", [self.address, blocks])
+
+    async def close(self) -> None:
+        await self.rpc.close()
+
+
+def _address(rng: random.Random) -> str:
+    return "0x" + "".join(rng.choice("0123456789abcdef") for _ in range(40))
+
+
+def build_plan(disputes: int, evidence_range: tuple, resolve_ratio: float, appeal_ratio: float,
+               finalize_ratio: float, seed: int, max_stake: int = 100) -> list:
+    """Deterministic list of dispute specs for a given seed"""
+    rng = random.Random(seed)
+    parties = [_address(rng) for _ in range(max(4, disputes // 10))]
+    plan = []
+    for index in range(disputes):
+        plaintiff, defendant = rng.sample(parties, 2)
+        fields = {
+            "vendor": rng.choice(VENDORS),
+            "deliverable": rng.choice(DELIVERABLES),
+            "defect": rng.choice(DEFECTS),
+            "amount": rng.randrange(100, 5000, 50),
+            "date": f"2024-{rng.randint(1, 12):02d}-{rng.randint(1, 28):02d}",
+            "days": rng.randint(7, 60),
+            "late": rng.randint(1, 30),
+            "count": rng.randint(2, 15),
+        }
+        resolved = rng.random() < resolve_ratio
+        appealed = resolved and rng.random() < appeal_ratio
+        plan.append({
+            "index": index,
+            "plaintiff": plaintiff,
+            "defendant": defendant,
+            "stake": rng.randint(10, max(10, max_stake)),
+            "case_description": rng.choice(DISPUTE_TEMPLATES).format(**fields),
+            "evidence_urls": [f"https://example.com/case-{index}/doc-{n}" for n in range(rng.randint(0, 3))],
+            "evidence": [
+                {
+                    "sender": rng.choice([plaintiff, defendant]),
+                    "type": rng.choice(EVIDENCE_TYPES),
+                    "content": rng.choice(EVIDENCE_TEMPLATES).format(**fields),
+                }
+                for _ in range(rng.randint(*evidence_range))
+            ],
+            "resolve": resolved,
+            "appeal": appealed,
+            "finalize": resolved and not appealed and rng.random() < finalize_ratio,
+        })
+    return plan
+
+
+class Recorder:
+    """Latency samples per method and wall time per phase"""
+
+    def __init__(self):
+        self.latencies = defaultdict(list)
+        self.errors = defaultdict(int)
+        self.error_samples = {}
+        self.phases = []
+
+    async def timed(self, method: str, call):
+        started = time.perf_counter()
+        try:
+            return await call
+        except Exception as e:
+            self.errors[method] += 1
+            self.error_samples.setdefault(method, str(e))
+            return None
+        finally:
+            self.latencies[method].append((time.perf_counter() - started) * 1000)
+
+    def histogram(self, samples: list) -> dict:
+        buckets = {f"<{bound}ms": 0 for bound in HISTOGRAM_BOUNDS_MS}
+        buckets[f">={HISTOGRAM_BOUNDS_MS[-1]}ms"] = 0
+        for sample in samples:
+            for bound in HISTOGRAM_BOUNDS_MS:
+                if sample < bound:
+                    buckets[f"<{bound}ms"] += 1
+                    break
+            else:
+                buckets[f">={HISTOGRAM_BOUNDS_MS[-1]}ms"] += 1
+        return buckets
+
+    def report(self) -> dict:
+        methods = {}
+        for method, samples in sorted(self.latencies.items()):
+            ordered = sorted(samples)
+            methods[method] = {
+                "calls": len(samples),
+                "errors": self.errors[method],
+                "p50_ms": ordered[len(ordered) // 2],
+                "p95_ms": ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))],
+                "max_ms": ordered[-1],
+                "histogram": self.histogram(samples),
+            }
+        return {"phases": self.phases, "methods": methods, "error_samples": self.error_samples}
+
+
+async def run_phase(recorder: Recorder, name: str, jobs: list, concurrency: int) -> list:
+    """Run (method, coroutine) jobs with bounded concurrency; results keep job order"""
+    limit = asyncio.Semaphore(concurrency)
+
+    async def run(method, call):
+        async with limit:
+            return await recorder.timed(method, call)
+
+    started = time.perf_counter()
+    results = await asyncio.gather(*(run(method, call) for method, call in jobs))
+    elapsed = time.perf_counter() - started
+    recorder.phases.append({
+        "phase": name,
+        "operations": len(jobs),
+        "seconds": elapsed,
+        "ops_per_second": len(jobs) / elapsed if elapsed else 0.0,
+    })
+    return results
+
+
+async def _succeeded(call) -> bool:
+    """Await a write that returns nothing, so success can be told from a recorded failure (None)"""
+    await call
+    return True
+
+
+async def drive(target, plan: list, concurrency: int) -> dict:
+    recorder = Recorder()
+    if not target.controls_clock:
+        return await _drive_phases(target, recorder, plan, concurrency)
+    # Long windows keep every dispute open while the load is applied; the clock is then advanced explicitly
+    stats = await target.read("get_stats", [])
+    await target.write("update_evidence_period_blocks", [MAX_PERIOD_BLOCKS], ADMIN)
+    await target.write("update_appeal_period_blocks", [MAX_PERIOD_BLOCKS], ADMIN)
+    try:
+        report = await _drive_phases(target, recorder, plan, concurrency)
+    finally:
+        await target.write("update_evidence_period_blocks", [stats["evidence_period_blocks"]], ADMIN)
+        await target.write("update_appeal_period_blocks", [stats["appeal_period_blocks"]], ADMIN)
+    return report
+
+
+async def _drive_phases(target, recorder: Recorder, plan: list, concurrency: int) -> dict:
+    dispute_ids = await run_phase(recorder, "file_dispute", [
+        ("file_dispute", target.write(
+            "file_dispute", [spec["defendant"], spec["case_description"], spec["evidence_urls"]],
+            spec["plaintiff"], spec["stake"],
+        ))
+        for spec in plan
+    ], concurrency)
+    filed = [(spec, dispute_id) for spec, dispute_id in zip(plan, dispute_ids) if dispute_id is not None]
+
+    evidence_ids = await run_phase(recorder, "submit_evidence", [
+        ("submit_evidence", target.write("submit_evidence", [dispute_id, item["type"], item["content"]],
+                                         item["sender"]))
+        for spec, dispute_id in filed for item in spec["evidence"]
+    ], concurrency)
+
+    if target.controls_clock:
+        resolved, appeals, finalized = await _drive_clock_phases(target, recorder, filed, concurrency)
+    else:
+        # Evidence windows cannot be closed early here, so nothing is ready to resolve
+        resolved, appeals, finalized = [], [], []
+
+    sample = [dispute_id for _, dispute_id in filed[:concurrency * 4]]
+    await run_phase(recorder, "reads", [
+        *(("get_dispute", target.read("get_dispute", [dispute_id])) for dispute_id in sample),
+        *(("get_dispute_evidence", target.read("get_dispute_evidence", [dispute_id])) for dispute_id in sample),
+        *(("get_disputes_paginated", target.read("get_disputes_paginated", [offset, 50]))
+          for offset in range(0, len(filed), max(50, len(filed) // 20))),
+        ("get_stats", target.read("get_stats", [])),
+    ], concurrency)
+
+    # Counted from calls that succeeded, not from the plan; an appeal reopens evidence gathering
+    appealed = sum(1 for ok in appeals if ok)
+    final = sum(1 for ok in finalized if ok)
+    report = recorder.report()
+    report["skipped_phases"] = [] if target.controls_clock else list(CLOCK_PHASES)
+    report["lifecycle"] = {
+        "filed": len(filed),
+        "evidence_items": sum(1 for evidence_id in evidence_ids if evidence_id is not None),
+        "resolved_pending_appeal": len(resolved) - appealed - final,
+        "appealed": appealed,
+        "resolved": final,
+        "evidence_gathering": len(filed) - len(resolved) + appealed,
+    }
+    return report
+
+
+async def _drive_clock_phases(target, recorder: Recorder, filed: list, concurrency: int) -> tuple:
+    """Resolve, appeal and finalize, advancing the contract clock past each window"""
+    await target.advance_clock(MAX_PERIOD_BLOCKS + 1)
+    to_resolve = [(spec, dispute_id) for spec, dispute_id in filed if spec["resolve"]]
+    verdicts = await run_phase(recorder, "resolve_dispute", [
+        ("resolve_dispute", target.write("resolve_dispute", [dispute_id], spec["plaintiff"]))
+        for spec, dispute_id in to_resolve
+    ], concurrency)
+    resolved = [(spec, dispute_id) for (spec, dispute_id), verdict in zip(to_resolve, verdicts) if verdict is not None]
+
+    appeals = await run_phase(recorder, "appeal_verdict", [
+        ("appeal_verdict", _succeeded(target.write(
+            "appeal_verdict",
+            [dispute_id, "The verdict overlooked the submitted written agreement and the independent "
+                         "review of the deliverable; we request a fresh evaluation of all evidence."],
+            spec["defendant"],
+        )))
+        for spec, dispute_id in resolved if spec["appeal"]
+    ], concurrency)
+
+    await target.advance_clock(MAX_PERIOD_BLOCKS + 1)
+    finalized = await run_phase(recorder, "finalize_verdict", [
+        ("finalize_verdict", _succeeded(target.write("finalize_verdict", [dispute_id], spec["plaintiff"])))
+        for spec, dispute_id in resolved if spec["finalize"]
+    ], concurrency)
+    return resolved, appeals, finalized
+
+
+def print_report(report: dict) -> None:
+    print("\n📈 Throughput")
+    for phase in report["phases"]:
+        print(f"   {phase['phase']:<18}{phase['operations']:>8} ops {phase['seconds']:>9.2f}s "
+              f"{phase['ops_per_second']:>10.1f} ops/s")
+    print("\n⏱️  Latency")
+    print(f"   {'method':<24}{'calls':>7}{'errors':>8}{'p50 ms':>10}{'p95 ms':>10}{'max ms':>10}")
+    for method, stats in report["methods"].items():
+        print(f"   {method:<24}{stats['calls']:>7}{stats['errors']:>8}{stats['p50_ms']:>10.2f}"
+              f"{stats['p95_ms']:>10.2f}{stats['max_ms']:>10.2f}")
+        populated = {bucket: n for bucket, n in stats["histogram"].items() if n}
+        print(f"   {'':<24}" + "  ".join(f"{bucket}:{n}" for bucket, n in populated.items()))
+    print("\n🔁 Lifecycle mix")
+    for state, count in report["lifecycle"].items():
+        print(f"   {state:<26}{count:>8}")
+    if report["skipped_phases"]:
+        print(f"⏭️  Skipped without clock control: {', '.join(report['skipped_phases'])}")
+    for method, message in report["error_samples"].items():
+        print(f"⚠️  {method}: {message}")
+
+
+def _evidence_range(value: str) -> tuple:
+    low, _, high = value.partition("-")
+    return int(low), int(high or low)
+
+
+async def main_async(args) -> dict:
+    plan = build_plan(args.disputes, args.evidence, args.resolve_ratio, args.appeal_ratio,
+                      args.finalize_ratio, args.seed, args.max_stake)
+    if args.target == "local":
+        target = LocalTarget()
+    else:
+        target = RpcTarget(args.rpc, args.address)
+        await target.setup()
+        if not target.controls_clock:
+            print(f"⚠️  {args.rpc} reports network {target.network!r}; only the stub node can move contract time, "
+                  f"so {', '.join(CLOCK_PHASES)} are skipped")
+    try:
+        print(f"🚚 Driving {len(plan)} disputes against {target.name} target (seed {args.seed}, "
+              f"concurrency {args.concurrency})")
+        return await drive(target, plan, args.concurrency)
+    finally:
+        await target.close()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Generate synthetic Justice Oracle load")
+    parser.add_argument("--target", choices=("local", "rpc"), default="local")
+    parser.add_argument("--rpc", default="http://127.0.0.1:4000/api", help="endpoint for --target rpc")
+    parser.add_argument("--address", help="existing contract (rpc target; must be deployed by the admin key)")
+    parser.add_argument("--disputes", type=int, default=100)
+    parser.add_argument("--evidence", type=_evidence_range, default=(0, 3), help="evidence items per dispute, e.g. 1-5")
+    parser.add_argument("--resolve-ratio", type=float, default=0.6)
+    parser.add_argument("--appeal-ratio", type=float, default=0.15, help="share of resolved disputes appealed")
+    parser.add_argument("--finalize-ratio", type=float, default=0.5, help="share of unappealed verdicts finalized")
+    parser.add_argument("--max-stake", type=int, default=100)
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument("--out", help="write the report as JSON")
+    args = parser.parse_args()
+
+    report = asyncio.run(main_async(args))
+    print_report(report)
+    if args.out:
+        with open(args.out, "w") as f:
+            json.dump(report, f, indent=2)
+        print(f"\n✅ Report saved: {args.out}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,330 @@
+#!/usr/bin/env python3
+"""
+Caching JSON-RPC read proxy for the frontend
+
+Point NEXT_PUBLIC_GENLAYER_RPC at this service. gl_readContract responses are
+cached per (contract, method, args) with LRU and TTL eviction, identical
+in-flight reads are collapsed into one upstream request, and forwarded
+writes invalidate the views they can change (again once the transaction is
+seen final). Signed or wallet-submitted transactions do not name a contract
+method, so they drop every cached read for their target contract, or all
+contract reads when the target cannot be read from the request. Everything
+else is passed through.
+
+Usage:
+    python3 -m justice_client.proxy --upstream https://studio.genlayer.com/api --port 8545
+    curl http://127.0.0.1:8545/stats
+"""
+
+import argparse
+import asyncio
+import json
+import time
+from collections import OrderedDict
+
+import aiohttp
+from aiohttp import web
+
+from .rpc import DEFAULT_RPC, FINAL_STATUSES
+
+DEFAULT_TTL = 5.0
+# Forwarded writes are re-invalidated once seen final; clients stop polling after this long
+PENDING_WRITE_TTL = 120.0
+MAX_PENDING_WRITES = 10000
+METHOD_TTLS = {
+    "get_stats": 2.0,
+    "get_metrics": 2.0,
+    "net_version": 30.0,
+}
+
+# Views whose results depend on the whole dispute table
+LIST_VIEWS = ("get_all_disputes", "get_disputes_paginated", "export_state", "get_stats", "get_metrics")
+# write method -> (views keyed by the dispute id in args[0], views to drop entirely)
+WRITE_INVALIDATES = {
+    "file_dispute": ((), LIST_VIEWS),
+    "submit_evidence": (("get_dispute_evidence", "get_dispute_evidence_page"), ("export_state", "get_stats", "get_metrics")),
+    "resolve_dispute": (("get_dispute",), LIST_VIEWS),
+    "finalize_verdict": (("get_dispute",), LIST_VIEWS),
+    "appeal_verdict": (("get_dispute",), LIST_VIEWS),
+    "update_min_stake": ((), ("get_stats", "get_metrics")),
+    "update_platform_fee": ((), ("get_stats", "get_metrics")),
+    "update_treasury": ((), ("get_stats", "get_metrics")),
+    "update_evidence_period_blocks": ((), ("get_stats", "get_metrics")),
+    "update_appeal_period_blocks": ((), ("get_stats", "get_metrics")),
+    "update_fast_track_max_stake": ((), ("get_stats", "get_metrics")),
+    "update_fast_track_uncontested": ((), ("get_stats", "get_metrics")),
+    "transfer_admin": ((), ("get_metrics",)),
+    "withdraw_fees": ((), ("get_metrics",)),
+    "reset_metrics": ((), ("get_metrics",)),
+}
+
+# Transaction submissions that bypass gl_writeContract (e.g. genlayer-js wallet signing)
+SUBMIT_METHODS = ("eth_sendRawTransaction", "gl_sendRawTransaction", "eth_sendTransaction", "gl_sendTransaction")
+
+CORS_HEADERS = {
+    "Access-Control-Allow-Origin": "*",
+    "Access-Control-Allow-Methods": "POST, GET, OPTIONS",
+    "Access-Control-Allow-Headers": "Content-Type",
+}
+
+
+class TTLCache:
+    """LRU map whose entries also expire after a per-entry TTL"""
+
+    def __init__(self, max_entries: int = 10000, clock=time.monotonic):
+        self.max_entries = max_entries
+        self._clock = clock
+        self._entries = OrderedDict()
+        self.evictions = 0
+        self.expirations = 0
+
+    def get(self, key):
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at <= self._clock():
+            del self._entries[key]
+            self.expirations += 1
+            return None
+        self._entries.move_to_end(key)
+        return entry
+
+    def set(self, key, value, ttl: float) -> None:
+        self._entries[key] = (self._clock() + ttl, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def discard_where(self, predicate) -> int:
+        stale = [key for key in self._entries if predicate(key)]
+        for key in stale:
+            del self._entries[key]
+        return len(stale)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class ReadProxy:
+    """Forwards JSON-RPC to `upstream`, serving contract reads from a shared cache"""
+
+    def __init__(self, upstream: str = DEFAULT_RPC, *, ttl: float = DEFAULT_TTL, max_entries: int = 10000,
+                 connections: int = 32, method_ttls: dict = None, pending_ttl: float = PENDING_WRITE_TTL,
+                 max_pending: int = MAX_PENDING_WRITES, clock=time.monotonic):
+        self.upstream = upstream
+        self.ttl = ttl
+        self.method_ttls = dict(METHOD_TTLS if method_ttls is None else method_ttls)
+        self.cache = TTLCache(max_entries, clock)
+        self.pending_ttl = pending_ttl
+        self.max_pending = max_pending
+        self._clock = clock
+        self._connections = connections
+        self._session = None
+        self._inflight = {}
+        # tx hash -> (expires_at, (address, method, args)), oldest first; many clients never poll
+        # receipts through the proxy, so entries expire instead of waiting for a final status
+        self._pending_writes = OrderedDict()
+        self.pending_dropped = 0
+        self.hits = 0
+        self.misses = 0
+        self.coalesced = 0
+        self.invalidations = 0
+        self.upstream_requests = 0
+
+    async def start(self, app=None) -> None:
+        self._session = aiohttp.ClientSession(connector=aiohttp.TCPConnector(limit=self._connections))
+
+    async def close(self, app=None) -> None:
+        if self._session is not None:
+            await self._session.close()
+
+    async def _forward(self, request: dict) -> dict:
+        self.upstream_requests += 1
+        try:
+            async with self._session.post(self.upstream, json=request) as response:
+                if response.status != 200:
+                    return {"jsonrpc": "2.0", "id": request.get("id"),
+                            "error": {"code": -32603, "message": f"Upstream HTTP {response.status}"}}
+                return await response.json(content_type=None)
+        except aiohttp.ClientError as e:
+            return {"jsonrpc": "2.0", "id": request.get("id"),
+                    "error": {"code": -32603, "message": f"Upstream unavailable: {e}"}}
+
+    @staticmethod
+    def _cache_key(request: dict):
+        method = request.get("method")
+        if method == "net_version":
+            return ("net_version",)
+        if method != "gl_readContract":
+            return None
+        call = (request.get("params") or [{}])[0]
+        return (
+            str(call.get("address", "")).lower(),
+            call.get("method"),
+            json.dumps(call.get("args", []), sort_keys=True),
+        )
+
+    async def _read(self, key, request: dict) -> dict:
+        cached = self.cache.get(key)
+        if cached is not None:
+            self.hits += 1
+            return cached[1]
+
+        inflight = self._inflight.get(key)
+        if inflight is not None:
+            self.coalesced += 1
+            return await asyncio.shield(inflight)
+
+        self.misses += 1
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        try:
+            reply = await self._forward(request)
+            if "error" not in reply:
+                view = key[1] if len(key) > 1 else key[0]
+                self.cache.set(key, reply, self.method_ttls.get(view, self.ttl))
+            future.set_result(reply)
+            return reply
+        except Exception as e:
+            # Hand waiters an error reply rather than a cancelled future
+            reply = {"jsonrpc": "2.0", "id": request.get("id"),
+                     "error": {"code": -32603, "message": f"Upstream error: {e}"}}
+            future.set_result(reply)
+            return reply
+        finally:
+            del self._inflight[key]
+            if not future.done():
+                future.cancel()
+
+    def invalidate(self, address, method: str, args: list) -> int:
+        scoped, views = WRITE_INVALIDATES.get(method, (None, None))
+        if address is None:
+            # Target unknown (signed raw transaction): drop every contract read
+            dropped = self.cache.discard_where(lambda key: len(key) == 3)
+            self.invalidations += dropped
+            return dropped
+        address = str(address).lower()
+        if scoped is None:
+            # Unknown write: drop everything cached for the contract
+            dropped = self.cache.discard_where(lambda key: key[0] == address)
+        else:
+            dispute_id = args[0] if args else None
+
+            def affected(key) -> bool:
+                if key[0] != address:
+                    return False
+                if key[1] in views:
+                    return True
+                return key[1] in scoped and json.loads(key[2])[:1] == [dispute_id]
+
+            dropped = self.cache.discard_where(affected)
+        self.invalidations += dropped
+        return dropped
+
+    def _remember_write(self, tx_hash: str, write: tuple) -> None:
+        now = self._clock()
+        while self._pending_writes:
+            expires_at, _ = next(iter(self._pending_writes.values()))
+            if expires_at > now and len(self._pending_writes) < self.max_pending:
+                break
+            self._pending_writes.popitem(last=False)
+            self.pending_dropped += 1
+        self._pending_writes[tx_hash] = (now + self.pending_ttl, write)
+        self._pending_writes.move_to_end(tx_hash)
+
+    async def dispatch(self, request: dict) -> dict:
+        key = self._cache_key(request)
+        if key is not None:
+            reply = await self._read(key, request)
+            return {**reply, "id": request.get("id")}
+
+        method = request.get("method")
+        if method == "proxy_stats":
+            return {"jsonrpc": "2.0", "id": request.get("id"), "result": self.stats()}
+
+        reply = await self._forward(request)
+        if method == "gl_writeContract" and "error" not in reply:
+            call = (request.get("params") or [{}])[0]
+            write = (call.get("address", ""), call.get("method"), call.get("args", []))
+            self.invalidate(*write)
+            if isinstance(reply.get("result"), str):
+                self._remember_write(reply["result"], write)
+        elif method in SUBMIT_METHODS and "error" not in reply:
+            transaction = (request.get("params") or [None])[0]
+            address = transaction.get("to") if isinstance(transaction, dict) else None
+            write = (address, None, [])
+            self.invalidate(*write)
+            if isinstance(reply.get("result"), str):
+                self._remember_write(reply["result"], write)
+        elif method == "eth_getTransactionByHash":
+            transaction = reply.get("result") or {}
+            if transaction.get("status") in FINAL_STATUSES:
+                pending = self._pending_writes.pop((request.get("params") or [None])[0], None)
+                if pending is not None:
+                    self.invalidate(*pending[1])
+        return reply
+
+    def stats(self) -> dict:
+        lookups = self.hits + self.misses + self.coalesced
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "coalesced": self.coalesced,
+            "hit_rate": (self.hits + self.coalesced) / lookups if lookups else 0.0,
+            "entries": len(self.cache),
+            "evictions": self.cache.evictions,
+            "expirations": self.cache.expirations,
+            "invalidations": self.invalidations,
+            "upstream_requests": self.upstream_requests,
+            "pending_writes": len(self._pending_writes),
+            "pending_dropped": self.pending_dropped,
+        }
+
+    async def handle(self, request: web.Request) -> web.Response:
+        try:
+            payload = await request.json()
+        except json.JSONDecodeError:
+            return web.json_response({"jsonrpc": "2.0", "id": None,
+                                      "error": {"code": -32700, "message": "Parse error"}}, headers=CORS_HEADERS)
+        if isinstance(payload, list):
+            replies = await asyncio.gather(*(self.dispatch(item) for item in payload))
+            return web.json_response(list(replies), headers=CORS_HEADERS)
+        return web.json_response(await self.dispatch(payload), headers=CORS_HEADERS)
+
+    async def handle_stats(self, request: web.Request) -> web.Response:
+        return web.json_response(self.stats(), headers=CORS_HEADERS)
+
+    async def handle_preflight(self, request: web.Request) -> web.Response:
+        return web.Response(headers=CORS_HEADERS)
+
+
+def make_app(proxy: ReadProxy) -> web.Application:
+    app = web.Application()
+    app.on_startup.append(proxy.start)
+    app.on_cleanup.append(proxy.close)
+    app.router.add_post("/", proxy.handle)
+    app.router.add_post("/api", proxy.handle)
+    app.router.add_get("/stats", proxy.handle_stats)
+    app.router.add_route("OPTIONS", "/{tail:.*}", proxy.handle_preflight)
+    return app
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Caching JSON-RPC read proxy for Justice Oracle")
+    parser.add_argument("--upstream", default=DEFAULT_RPC, help="GenLayer RPC endpoint to forward to")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8545)
+    parser.add_argument("--ttl", type=float, default=DEFAULT_TTL, help="default cache TTL in seconds")
+    parser.add_argument("--max-entries", type=int, default=10000, help="LRU capacity")
+    args = parser.parse_args()
+
+    proxy = ReadProxy(args.upstream, ttl=args.ttl, max_entries=args.max_entries)
+    print(f"🛡️  Read proxy on http://{args.host}:{args.port} → {args.upstream}")
+    print(f"   Set NEXT_PUBLIC_GENLAYER_RPC=http://{args.host}:{args.port}")
+    web.run_app(make_app(proxy), host=args.host, port=args.port, print=None)
+
+
+if __name__ == "__main__":
+    main()
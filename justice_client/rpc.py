@@ -0,0 +1,185 @@
+"""
+Asyncio JSON-RPC transport for GenLayer nodes
+
+One pooled aiohttp session per client; reads can be sent as JSON-RPC batches
+and many writes can be submitted and polled for receipts concurrently.
+"""
+
+import asyncio
+import itertools
+
+import aiohttp
+
+DEFAULT_RPC = "https://studio.genlayer.com/api"
+FINAL_STATUSES = ("ACCEPTED", "FINALIZED")
+FAILED_STATUSES = ("CANCELED", "UNDETERMINED", "LEADER_TIMEOUT", "VALIDATORS_TIMEOUT")
+
+
+class RpcError(Exception):
+    """JSON-RPC error object returned by the node"""
+
+    def __init__(self, message: str, code: int = None, data=None):
+        super().__init__(message)
+        self.code = code
+        self.data = data
+
+
+class ReceiptTimeout(Exception):
+    """Transaction did not reach a final status before the polling deadline"""
+
+
+class RpcClient:
+    """
+    Pooled JSON-RPC client
+    Use as an async context manager, or call close() when done.
+    """
+
+    def __init__(self, url: str = DEFAULT_RPC, *, connections: int = 16, timeout: float = 60.0,
+                 session: aiohttp.ClientSession = None):
+        self.url = url
+        self._connections = connections
+        self._timeout = aiohttp.ClientTimeout(total=timeout)
+        self._session = session
+        self._owns_session = session is None
+        self._ids = itertools.count(1)
+
+    async def __aenter__(self) -> "RpcClient":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.close()
+
+    @property
+    def session(self) -> aiohttp.ClientSession:
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=self._connections),
+                timeout=self._timeout,
+            )
+            self._owns_session = True
+        return self._session
+
+    async def close(self) -> None:
+        if self._owns_session and self._session is not None and not self._session.closed:
+            await self._session.close()
+
+    def _request(self, method: str, params) -> dict:
+        return {"jsonrpc": "2.0", "method": method, "params": params, "id": next(self._ids)}
+
+    async def _post(self, payload):
+        async with self.session.post(self.url, json=payload) as response:
+            if response.status != 200:
+                raise RpcError(f"RPC error: HTTP {response.status} {response.reason}")
+            return await response.json(content_type=None)
+
+    @staticmethod
+    def _unwrap(reply: dict):
+        if reply.get("error"):
+            error = reply["error"]
+            raise RpcError(error.get("message", "RPC call failed"), error.get("code"), error.get("data"))
+        return reply.get("result")
+
+    async def call(self, method: str, params=None):
+        """Send a single JSON-RPC request and return its result"""
+        return self._unwrap(await self._post(self._request(method, params if params is not None else [])))
+
+    async def batch(self, calls: list, return_exceptions: bool = False) -> list:
+        """
+        Send (method, params) pairs as one JSON-RPC batch
+        Results come back in request order; errors raise unless return_exceptions is set
+        """
+        if not calls:
+            return []
+        requests = [self._request(method, params) for method, params in calls]
+        replies = await self._post(requests)
+        if isinstance(replies, dict):
+            # Nodes without batch support answer with a single error object
+            self._unwrap(replies)
+            raise RpcError("Batch request not supported by node")
+        by_id = {reply.get("id"): reply for reply in replies}
+        results = []
+        for request in requests:
+            reply = by_id.get(request["id"], {"error": {"message": "Missing batch response"}})
+            try:
+                results.append(self._unwrap(reply))
+            except RpcError as e:
+                if not return_exceptions:
+                    raise
+                results.append(e)
+        return results
+
+    # GenLayer methods
+
+    async def read_contract(self, address: str, method: str, args: list = None):
+        return await self.call("gl_readContract", [{"address": address, "method": method, "args": args or []}])
+
+    async def read_many(self, address: str, calls: list, return_exceptions: bool = False) -> list:
+        """Batch several (method, args) view calls into one round trip"""
+        return await self.batch(
+            [("gl_readContract", [{"address": address, "method": method, "args": args}]) for method, args in calls],
+            return_exceptions=return_exceptions,
+        )
+
+    async def write_contract(self, address: str, method: str, args: list = None, *, sender: str, value: int = 0):
+        """Submit a write transaction; returns the node's reply (usually a transaction hash)"""
+        return await self.call("gl_writeContract", [{
+            "from": sender,
+            "address": address,
+            "method": method,
+            "args": args or [],
+            "value": value,
+        }])
+
+    async def get_transaction(self, tx_hash: str) -> dict:
+        return await self.call("eth_getTransactionByHash", [tx_hash])
+
+    async def wait_for_receipt(self, tx_hash: str, *, timeout: float = 120.0, initial_delay: float = 0.25,
+                               max_delay: float = 5.0) -> dict:
+        """Poll a transaction with exponential backoff until it reaches a final status"""
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout
+        delay = initial_delay
+        while True:
+            transaction = await self.get_transaction(tx_hash)
+            status = (transaction or {}).get("status")
+            if status in FINAL_STATUSES:
+                return transaction
+            if status in FAILED_STATUSES:
+                raise RpcError(f"Transaction {tx_hash} ended with status {status}", data=transaction)
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                raise ReceiptTimeout(f"Transaction {tx_hash} not final after {timeout:.0f}s (status: {status})")
+            await asyncio.sleep(min(delay, remaining))
+            delay = min(delay * 2, max_delay)
+
+    async def transact(self, address: str, method: str, args: list = None, *, sender: str, value: int = 0,
+                       timeout: float = 120.0) -> dict:
+        """Submit a write and wait for its receipt"""
+        submitted = await self.write_contract(address, method, args, sender=sender, value=value)
+        if isinstance(submitted, dict) and submitted.get("status"):
+            return submitted
+        tx_hash = submitted["hash"] if isinstance(submitted, dict) else submitted
+        return await self.wait_for_receipt(tx_hash, timeout=timeout)
+
+    async def transact_many(self, address: str, writes: list, *, sender: str, timeout: float = 120.0,
+                            concurrency: int = 8, return_exceptions: bool = False) -> list:
+        """
+        Submit (method, args, value) writes and poll their receipts concurrently
+        At most `concurrency` transactions are in flight at once; results keep input order
+        """
+        limit = asyncio.Semaphore(concurrency)
+
+        async def run(method, args, value):
+            async with limit:
+                return await self.transact(address, method, args, sender=sender, value=value, timeout=timeout)
+
+        return await asyncio.gather(
+            *(run(method, args, value) for method, args, value in writes),
+            return_exceptions=return_exceptions,
+        )
+
+    async def deploy_contract(self, code: str, *, network: str = "testnet", args: list = None):
+        params = {"code": code, "network": network}
+        if args:
+            params["args"] = args
+        return await self.call("deploy_contract", params)
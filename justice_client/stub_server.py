@@ -0,0 +1,173 @@
+#!/usr/bin/env python3
+"""
+Local stub GenLayer RPC server backed by the genlayer_local runtime
+
+Speaks the JSON-RPC subset the client and frontend use (single and batch
+requests): deploy_contract, gl_readContract, gl_writeContract,
+eth_getTransactionByHash and net_version. Writes execute in-process; a
+write whose contract call raises is answered with a JSON-RPC error.
+
+Usage:
+    python3 -m justice_client.stub_server --port 4000 [--fixtures fixtures/seed_demo_data.json]
+"""
+
+import argparse
+import asyncio
+import hashlib
+import itertools
+import json
+from collections import Counter
+
+from aiohttp import web
+
+from genlayer_local import Cassette, Runtime, ScriptedLLM, StaticWeb, load_contract
+
+DEFAULT_DEPLOYER = "0x" + "11" * 20
+RPC_METHODS = (
+    "deploy_contract",
+    "gl_readContract",
+    "gl_writeContract",
+    "eth_getTransactionByHash",
+    "net_version",
+    "stub_stats",
+    "stub_advance_clock",
+)
+
+
+class StubNode:
+    """In-process node: deployed contracts, transactions and request counters"""
+
+    def __init__(self, runtime: Runtime = None, *, receipt_delay: float = 0.0, loop_time=None):
+        self.runtime = runtime or Runtime(llm=ScriptedLLM(), web=StaticWeb())
+        self.receipt_delay = receipt_delay
+        self.contracts = {}
+        self.transactions = {}
+        self.requests = Counter()
+        self._nonce = itertools.count()
+        self._time = loop_time or (lambda: asyncio.get_running_loop().time())
+
+    def _tx_hash(self, payload: dict) -> str:
+        digest = hashlib.sha256(f"{next(self._nonce)}:{json.dumps(payload, sort_keys=True)}".encode())
+        return "0x" + digest.hexdigest()
+
+    def _contract(self, address: str):
+        contract = self.contracts.get(address.lower())
+        if contract is None:
+            raise LookupError(f"No contract deployed at {address}")
+        return contract
+
+    def deploy_contract(self, params: dict) -> dict:
+        module = load_contract(source=params["code"])
+        contract = self.runtime.deploy(
+            module.JusticeOracle, *params.get("args", []), sender=params.get("from", DEFAULT_DEPLOYER)
+        )
+        address = contract._gl_address.as_hex
+        self.contracts[address] = contract
+        return {"address": address}
+
+    def gl_readContract(self, params: list):
+        call = params[0]
+        return self.runtime.call(
+            self._contract(call["address"]), call["method"], *call.get("args", []),
+            sender=call.get("from", DEFAULT_DEPLOYER),
+        )
+
+    def gl_writeContract(self, params: list) -> str:
+        call = params[0]
+        result = self.runtime.call(
+            self._contract(call["address"]), call["method"], *call.get("args", []),
+            sender=call["from"], value=call.get("value", 0),
+        )
+        tx_hash = self._tx_hash(call)
+        self.transactions[tx_hash] = {
+            "hash": tx_hash,
+            "from": call["from"],
+            "to": call["address"],
+            "method": call["method"],
+            "result": result,
+            "final_at": self._time() + self.receipt_delay,
+        }
+        return tx_hash
+
+    def eth_getTransactionByHash(self, params: list):
+        transaction = self.transactions.get(params[0])
+        if transaction is None:
+            return None
+        status = "FINALIZED" if self._time() >= transaction["final_at"] else "PENDING"
+        return {k: v for k, v in transaction.items() if k != "final_at"} | {"status": status}
+
+    def net_version(self, params) -> str:
+        return "genlayer-local"
+
+    def stub_stats(self, params) -> dict:
+        return {"requests": dict(self.requests), "runtime": self.runtime.stats.as_dict()}
+
+    def stub_advance_clock(self, params: list) -> int:
+        """Move a contract's block-time counter forward (test-only; used by the load generator)"""
+        address, blocks = params
+        contract = self._contract(address)
+        contract.genesis_block = contract.genesis_block + int(blocks)
+        return contract.genesis_block
+
+    def dispatch(self, request: dict) -> dict:
+        method = request.get("method")
+        self.requests[method] += 1
+        reply = {"jsonrpc": "2.0", "id": request.get("id")}
+        if method not in RPC_METHODS:
+            reply["error"] = {"code": -32601, "message": f"Method not found: {method}"}
+            return reply
+        try:
+            reply["result"] = getattr(self, method)(request.get("params"))
+        except Exception as e:
+            reply["error"] = {"code": -32000, "message": str(e)}
+        return reply
+
+    async def handle(self, request: web.Request) -> web.Response:
+        try:
+            payload = await request.json()
+        except json.JSONDecodeError:
+            return web.json_response({"jsonrpc": "2.0", "id": None,
+                                      "error": {"code": -32700, "message": "Parse error"}})
+        if isinstance(payload, list):
+            return web.json_response([self.dispatch(item) for item in payload])
+        return web.json_response(self.dispatch(payload))
+
+
+def make_app(node: StubNode = None) -> web.Application:
+    node = node or StubNode()
+    app = web.Application()
+    app["node"] = node
+    app.router.add_post("/", node.handle)
+    app.router.add_post("/api", node.handle)
+    return app
+
+
+async def start_stub_server(node: StubNode = None, host: str = "127.0.0.1", port: int = 0):
+    """Start the stub in the running loop; returns (runner, url)"""
+    runner = web.AppRunner(make_app(node))
+    await runner.setup()
+    site = web.TCPSite(runner, host, port)
+    await site.start()
+    bound_port = runner.addresses[0][1]
+    return runner, f"http://{host}:{bound_port}/api"
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Stub GenLayer RPC server on the local runtime")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=4000)
+    parser.add_argument("--fixtures", help="replay LLM/web responses from a fixture file (auto mode)")
+    parser.add_argument("--receipt-delay", type=float, default=0.0, help="seconds before a write is final")
+    args = parser.parse_args()
+
+    runtime = None
+    if args.fixtures:
+        cassette = Cassette(args.fixtures, mode="auto")
+        runtime = Runtime(llm=cassette.llm(ScriptedLLM()), web=cassette.web(StaticWeb()))
+    node = StubNode(runtime, receipt_delay=args.receipt_delay)
+    print(f"🧪 Stub GenLayer RPC listening on http://{args.host}:{args.port}/api")
+    web.run_app(make_app(node), host=args.host, port=args.port, print=None)
+
+
+if __name__ == "__main__":
+    main()
@@ -97,6 +97,24 @@ export async function updateAppealPeriodBlocks(newBlocks: number) {
   }
 }
 
+export async function updateFastTrackMaxStake(newMaxStake: number) {
+  try {
+    await adminWriteContract('update_fast_track_max_stake', [newMaxStake])
+    return { success: true }
+  } catch (error: any) {
+    return { success: false, error: error.message }
+  }
+}
+
+export async function updateFastTrackUncontested(enabled: boolean) {
+  try {
+    await adminWriteContract('update_fast_track_uncontested', [enabled])
+    return { success: true }
+  } catch (error: any) {
+    return { success: false, error: error.message }
+  }
+}
+
 export async function withdrawFees(amount: number) {
   try {
     await adminWriteContract('withdraw_fees', [amount])
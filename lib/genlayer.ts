@@ -287,6 +287,41 @@ export async function getDisputeEvidence(disputeId: number) {
   }
 }
 
+export async function getDisputeEvidencePage(disputeId: number, offset: number, limit: number) {
+  try {
+    const result = await readContract('get_dispute_evidence_page', [disputeId, offset, limit])
+    
+    return {
+      success: true,
+      evidence: result?.evidence || [],
+      total: result?.total || 0,
+    }
+  } catch (error: any) {
+    return {
+      success: false,
+      error: error.message || 'Failed to get evidence',
+      evidence: [],
+      total: 0,
+    }
+  }
+}
+
+export async function getEvidence(evidenceId: number) {
+  try {
+    const result = await readContract('get_evidence', [evidenceId])
+    
+    return {
+      success: true,
+      evidence: result,
+    }
+  } catch (error: any) {
+    return {
+      success: false,
+      error: error.message || 'Failed to get evidence',
+    }
+  }
+}
+
 export async function getStats() {
   try {
     const result = await readContract('get_stats', [])
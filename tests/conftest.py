@@ -0,0 +1,64 @@
+import asyncio
+import sys
+import threading
+from pathlib import Path
+
+import pytest
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(REPO_ROOT))
+
+from justice_client.stub_server import StubNode, start_stub_server  # noqa: E402
+
+ADMIN = "0x" + "11" * 20
+PLAINTIFF = "0x" + "aa" * 20
+DEFENDANT = "0x" + "bb" * 20
+CASE = "The contractor was paid in full but delivered none of the agreed milestones on time."
+
+
+class StubServer:
+    """Stub node served from a background thread so tests and subprocesses can reach it"""
+
+    def __init__(self, node: StubNode):
+        self.node = node
+        self.url = None
+        self._loop = asyncio.new_event_loop()
+        self._ready = threading.Event()
+        self._thread = threading.Thread(target=self._serve, daemon=True)
+
+    def _serve(self) -> None:
+        asyncio.set_event_loop(self._loop)
+        runner, self.url = self._loop.run_until_complete(start_stub_server(self.node))
+        self._ready.set()
+        self._loop.run_forever()
+        self._loop.run_until_complete(runner.cleanup())
+
+    def start(self) -> "StubServer":
+        self._thread.start()
+        if not self._ready.wait(10):
+            raise RuntimeError("Stub server did not start")
+        return self
+
+    def stop(self) -> None:
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join(10)
+        self._loop.close()
+
+
+@pytest.fixture
+def stub_server():
+    """Factory: stub_server(node=None) -> running StubServer, stopped after the test"""
+    servers = []
+
+    def start(node: StubNode = None) -> StubServer:
+        server = StubServer(node or StubNode()).start()
+        servers.append(server)
+        return server
+
+    yield start
+    for server in servers:
+        server.stop()
+
+
+def contract_source() -> str:
+    return (REPO_ROOT / "contracts" / "JusticeOracle.py").read_text()
@@ -0,0 +1,73 @@
+import json
+import os
+import subprocess
+import sys
+
+from conftest import REPO_ROOT
+
+
+def run_deploy(workdir, rpc_url: str, *args) -> subprocess.CompletedProcess:
+    env = dict(os.environ, GENLAYER_RPC=rpc_url, PYTHONPATH=str(REPO_ROOT))
+    return subprocess.run(
+        [sys.executable, str(REPO_ROOT / "deploy_local.py"), *args],
+        cwd=workdir, env=env, capture_output=True, text=True, timeout=60,
+    )
+
+
+def make_workdir(tmp_path):
+    (tmp_path / "contracts").mkdir()
+    (tmp_path / "contracts" / "JusticeOracle.py").write_text((REPO_ROOT / "contracts" / "JusticeOracle.py").read_text())
+    return tmp_path
+
+
+def test_deploy_then_reuse_unchanged_contract(stub_server, tmp_path):
+    server = stub_server()
+    workdir = make_workdir(tmp_path)
+
+    first = run_deploy(workdir, server.url)
+    assert first.returncode == 0, first.stdout + first.stderr
+    info = json.loads((workdir / "deployment_info.json").read_text())
+    env_file = workdir / ".env.local"
+    assert f"NEXT_PUBLIC_CONTRACT_ADDRESS={info['contract_address']}" in env_file.read_text()
+    env_written = env_file.stat().st_mtime_ns
+
+    second = run_deploy(workdir, server.url)
+    assert second.returncode == 0, second.stdout + second.stderr
+    assert "reusing it" in second.stdout
+    assert json.loads((workdir / "deployment_info.json").read_text()) == info
+    assert env_file.stat().st_mtime_ns == env_written
+    assert server.node.requests["deploy_contract"] == 1
+    assert server.node.requests["gl_readContract"] == 1  # the reused address was checked
+
+
+def test_changed_source_or_force_redeploys(stub_server, tmp_path):
+    server = stub_server()
+    workdir = make_workdir(tmp_path)
+
+    assert run_deploy(workdir, server.url).returncode == 0
+    first = json.loads((workdir / "deployment_info.json").read_text())
+
+    contract = workdir / "contracts" / "JusticeOracle.py"
+    contract.write_text(contract.read_text() + "\n# changed\n")
+    assert run_deploy(workdir, server.url).returncode == 0
+    second = json.loads((workdir / "deployment_info.json").read_text())
+    assert second["contract_address"] != first["contract_address"]
+    assert second["deployment_key"] != first["deployment_key"]
+
+    assert run_deploy(workdir, server.url, "--force").returncode == 0
+    assert server.node.requests["deploy_contract"] == 3
+
+
+def test_recorded_address_missing_after_node_reset_redeploys(stub_server, tmp_path):
+    server = stub_server()
+    workdir = make_workdir(tmp_path)
+
+    assert run_deploy(workdir, server.url).returncode == 0
+    server.node.contracts.clear()
+
+    result = run_deploy(workdir, server.url)
+    assert result.returncode == 0, result.stdout + result.stderr
+    assert "deploying again" in result.stdout
+    info = json.loads((workdir / "deployment_info.json").read_text())
+    assert info["contract_address"] in server.node.contracts
+    assert f"NEXT_PUBLIC_CONTRACT_ADDRESS={info['contract_address']}" in (workdir / ".env.local").read_text()
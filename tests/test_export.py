@@ -0,0 +1,72 @@
+import asyncio
+import io
+import json
+
+import pytest
+
+from conftest import CASE, DEFENDANT, PLAINTIFF, contract_source
+from justice_client import JusticeOracleClient, RpcClient
+from justice_client.export import export, resume_cursors
+from justice_client.rpc import RpcError
+
+
+def seeded_export(stub_server, scenario):
+    """Run scenario(oracle) against a contract holding 5 disputes with 2 evidence items each"""
+    server = stub_server()
+
+    async def run():
+        async with RpcClient(server.url) as rpc:
+            address = (await rpc.deploy_contract(contract_source()))["address"]
+            plaintiff = JusticeOracleClient(rpc, address, PLAINTIFF)
+            ids = await plaintiff.write_many([("file_dispute", [DEFENDANT, CASE, []], 10)] * 5)
+            await plaintiff.write_many([("submit_evidence", [i, "document", f"Invoice {n} for {i}"], 0)
+                                        for i in ids for n in range(2)])
+            return await scenario(JusticeOracleClient(rpc, address))
+
+    return asyncio.run(run())
+
+
+def test_export_chunks_cover_every_record_once(stub_server):
+    async def scenario(oracle):
+        return [chunk async for chunk in oracle.iter_export(0, 0, 4)]
+
+    chunks = seeded_export(stub_server, scenario)
+    disputes = [record["dispute_id"] for chunk in chunks for record in chunk["disputes"]]
+    evidence = [record["evidence_id"] for chunk in chunks for record in chunk["evidence"]]
+    assert disputes == list(range(5))
+    assert evidence == list(range(10))
+
+    assert [len(chunk["disputes"]) + len(chunk["evidence"]) for chunk in chunks] == [4, 4, 4, 3]
+    assert [(chunk["next_dispute_cursor"], chunk["next_evidence_cursor"]) for chunk in chunks] == [
+        (4, 0), (5, 3), (5, 7), (5, 10)]
+    assert [chunk["done"] for chunk in chunks] == [False, False, False, True]
+
+
+def test_export_rejects_a_zero_limit(stub_server):
+    async def scenario(oracle):
+        with pytest.raises(RpcError, match="at least 1"):
+            await oracle.export_state(0, 0, 0)
+
+    seeded_export(stub_server, scenario)
+
+
+def test_resume_truncates_a_torn_line_without_duplicates(stub_server, tmp_path):
+    path = tmp_path / "backup.jsonl"
+
+    async def scenario(oracle):
+        full = io.StringIO()
+        await export(oracle, full, chunk_size=3)
+        lines = full.getvalue().splitlines(keepends=True)
+        # Interrupted after seven whole records, halfway through the eighth
+        path.write_text("".join(lines[:7]) + lines[7][:len(lines[7]) // 2])
+
+        dispute_cursor, evidence_cursor = resume_cursors(str(path))
+        assert (dispute_cursor, evidence_cursor) == (5, 2)
+        with open(path, "a") as out:
+            await export(oracle, out, dispute_cursor=dispute_cursor, evidence_cursor=evidence_cursor, chunk_size=3)
+        return full.getvalue()
+
+    expected = seeded_export(stub_server, scenario)
+    assert path.read_text() == expected
+    records = [json.loads(line) for line in path.read_text().splitlines()]
+    assert len({(record["kind"], record.get("evidence_id", record["dispute_id"])) for record in records}) == 15
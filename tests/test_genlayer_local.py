@@ -0,0 +1,94 @@
+import pytest
+
+from conftest import ADMIN
+from genlayer_local import Runtime, load_contract
+
+BOX_SOURCE = '''
+from genlayer import *
+
+class Box(gl.Contract):
+    items: TreeMap[str, u256]
+    total: u256
+
+    def __init__(self):
+        self.total = u256(0)
+
+    @gl.public.write
+    def put(self, key: str, fail: bool) -> None:
+        self.items[key] = u256(self.items.get(key, u256(0)) + 1)
+        self.total = self.total + u256(1)
+        if fail:
+            raise Exception("boom")
+'''
+
+
+def deploy_box():
+    runtime = Runtime()
+    return runtime, runtime.deploy(load_contract(source=BOX_SOURCE).Box, sender=ADMIN)
+
+
+def test_failed_write_rolls_back_new_and_existing_keys():
+    runtime, box = deploy_box()
+    runtime.call(box, "put", "a", False, sender=ADMIN)
+
+    with pytest.raises(Exception, match="boom"):
+        runtime.call(box, "put", "b", True, sender=ADMIN)
+    with pytest.raises(Exception, match="boom"):
+        runtime.call(box, "put", "a", True, sender=ADMIN)
+
+    assert dict(box.items.items()) == {"a": 1}
+    assert "b" not in box.items
+    assert box.total == 1
+
+
+LEDGER_SOURCE = '''
+from genlayer import *
+
+class Ledger(gl.Contract):
+    entries: TreeMap[u256, DynArray[u256]]
+
+    def __init__(self):
+        pass
+
+    @gl.public.write
+    def add(self, key: u256, value: u256, fail: bool) -> None:
+        self.entries.get_or_insert_default(key).append(value)
+        if fail:
+            raise Exception("boom")
+
+    @gl.public.view
+    def page(self, key: u256, offset: u256, limit: u256) -> list:
+        return list(self.entries.get(key)[offset:offset + limit])
+'''
+
+
+def test_dyn_array_appends_and_pages_cost_constant_storage_operations():
+    runtime = Runtime()
+    ledger = runtime.deploy(load_contract(source=LEDGER_SOURCE).Ledger, sender=ADMIN)
+    storage = runtime.stats.storage
+    costs = []
+    appended = 0
+    for size in (10, 100, 1000):
+        while appended < size:
+            runtime.call(ledger, "add", 0, appended, False, sender=ADMIN)
+            appended += 1
+        before = (storage.reads, storage.writes)
+        runtime.call(ledger, "add", 0, appended, False, sender=ADMIN)
+        appended += 1
+        assert runtime.call(ledger, "page", 0, appended - 5, 5, sender=ADMIN) == list(range(appended - 5, appended))
+        costs.append((storage.reads - before[0], storage.writes - before[1]))
+    assert costs[0] == costs[1] == costs[2]
+
+
+def test_dyn_array_rolls_back_appends_from_failed_call():
+    runtime = Runtime()
+    ledger = runtime.deploy(load_contract(source=LEDGER_SOURCE).Ledger, sender=ADMIN)
+    runtime.call(ledger, "add", 0, 1, False, sender=ADMIN)
+
+    with pytest.raises(Exception, match="boom"):
+        runtime.call(ledger, "add", 0, 2, True, sender=ADMIN)
+    with pytest.raises(Exception, match="boom"):
+        runtime.call(ledger, "add", 5, 3, True, sender=ADMIN)
+
+    assert runtime.call(ledger, "page", 0, 0, 10, sender=ADMIN) == [1]
+    assert 5 not in ledger.entries
@@ -0,0 +1,81 @@
+import asyncio
+from collections import Counter
+
+from conftest import CASE, DEFENDANT, PLAINTIFF, contract_source
+from justice_client import JusticeOracleClient, RpcClient
+from justice_client.indexer import Indexer, IndexStore
+from justice_client.stub_server import StubNode
+
+
+class ViewCountingNode(StubNode):
+    """StubNode that also counts which contract views were read"""
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.views = Counter()
+
+    def gl_readContract(self, params: list):
+        self.views[params[0]["method"]] += 1
+        return super().gl_readContract(params)
+
+
+def test_poll_fetches_only_new_evidence_ids(stub_server):
+    node = ViewCountingNode()
+    server = stub_server(node)
+    store = IndexStore()
+
+    async def scenario():
+        async with RpcClient(server.url) as rpc:
+            address = (await rpc.deploy_contract(contract_source()))["address"]
+            plaintiff = JusticeOracleClient(rpc, address, PLAINTIFF)
+            defendant = plaintiff.as_sender(DEFENDANT)
+            indexer = Indexer(JusticeOracleClient(rpc, address), store)
+
+            ids = await plaintiff.write_many([("file_dispute", [DEFENDANT, CASE, []], 10)] * 2)
+            await plaintiff.write_many([("submit_evidence", [i, "document", f"Invoice {n}"], 0)
+                                        for i in ids for n in range(3)])
+            first = await indexer.poll_once()
+            node.views.clear()
+
+            await defendant.submit_evidence(ids[0], "testimony", "Milestones were delayed by the client")
+            second = await indexer.poll_once()
+            third = await indexer.poll_once()
+            return first, second, third
+
+    first, second, third = asyncio.run(scenario())
+    assert first["new_disputes"] == 2 and first["new_evidence"] == 6
+    assert second["new_evidence"] == 1 and third["new_evidence"] == 0
+    assert node.views["get_evidence"] == 1
+    assert node.views["get_dispute_evidence"] == 0
+    assert [row["dispute_id"] for row in store.search("delayed")] == [0]
+
+
+def test_poll_rereads_only_open_disputes_whose_summary_changed(stub_server):
+    node = ViewCountingNode()
+    server = stub_server(node)
+    store = IndexStore()
+
+    async def scenario():
+        async with RpcClient(server.url) as rpc:
+            address = (await rpc.deploy_contract(contract_source()))["address"]
+            plaintiff = JusticeOracleClient(rpc, address, PLAINTIFF)
+            indexer = Indexer(JusticeOracleClient(rpc, address), store)
+
+            ids = await plaintiff.write_many([("file_dispute", [DEFENDANT, CASE, []], 10)] * 3)
+            await indexer.poll_once()
+            node.views.clear()
+            unchanged = await indexer.poll_once()
+            reads = dict(node.views)
+
+            node.views.clear()
+            await rpc.call("stub_advance_clock", [address, 50401])
+            await plaintiff.resolve_dispute(ids[1])
+            changed = await indexer.poll_once()
+            return unchanged, reads, changed, dict(node.views)
+
+    unchanged, reads, changed, changed_reads = asyncio.run(scenario())
+    assert unchanged["checked"] == 3 and unchanged["refreshed"] == 0
+    assert reads.get("get_dispute", 0) == 0 and reads["get_disputes_paginated"] == 1
+    assert changed["refreshed"] == 1 and changed["changed"] == 1
+    assert changed_reads["get_dispute"] == 1
+    assert [row["dispute_id"] for row in store.filter_disputes(status="resolved_pending_appeal")] == [1]
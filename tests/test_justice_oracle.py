@@ -0,0 +1,172 @@
+import json
+
+import pytest
+
+from conftest import ADMIN, CASE, DEFENDANT, PLAINTIFF
+from genlayer_local import Runtime, ScriptedLLM, StaticWeb, default_verdict, load_contract
+from genlayer_local.types import StorageStats
+
+EVIDENCE_PREVIEW_CHARS = load_contract().EVIDENCE_PREVIEW_CHARS
+
+
+def deploy(llm: ScriptedLLM = None):
+    runtime = Runtime(llm=llm or ScriptedLLM(), web=StaticWeb())
+    oracle = runtime.deploy(load_contract().JusticeOracle, sender=ADMIN)
+    return runtime, oracle
+
+
+def file_and_close(runtime, oracle, stake: int = 10) -> int:
+    dispute_id = runtime.call(oracle, "file_dispute", DEFENDANT, CASE, [], sender=PLAINTIFF, value=stake)
+    oracle.genesis_block = oracle.genesis_block + int(oracle.evidence_period_blocks) + 1
+    return dispute_id
+
+
+def test_repair_prompts_count_towards_llm_prompt_chars():
+    broken = default_verdict()
+    broken["confidence"] = 300
+    llm = ScriptedLLM([
+        ("failed validation", json.dumps({"confidence": 80})),
+        ("CRITICAL REQUIREMENTS", json.dumps(broken)),
+    ])
+    runtime, oracle = deploy(llm)
+    dispute_id = file_and_close(runtime, oracle)
+
+    runtime.stats.reset()
+    runtime.call(oracle, "resolve_dispute", dispute_id, sender=PLAINTIFF)
+    sent = runtime.stats.as_dict()
+    metrics = runtime.call(oracle, "get_metrics", sender=ADMIN)
+
+    assert metrics["resolve_dispute.leader_repairs"] == 1
+    assert metrics["resolve_dispute.leader_repairs.confidence"] == 1
+    assert metrics["resolve_dispute.llm_prompts"] == sent["prompts"] == 2
+    assert metrics["resolve_dispute.llm_prompt_chars"] == sent["prompt_chars"]
+    assert sent["consensus_rounds"] == 1 and sent["consensus_rejections"] == 0
+
+
+def test_resolve_and_finalize_read_and_write_the_dispute_once():
+    runtime, oracle = deploy()
+    dispute_id = file_and_close(runtime, oracle)
+    disputes = oracle.disputes._stats = StorageStats()  # counts the disputes map alone
+
+    runtime.call(oracle, "resolve_dispute", dispute_id, sender=PLAINTIFF)
+    assert (disputes.reads, disputes.writes) == (1, 1)
+
+    oracle.genesis_block = oracle.genesis_block + int(oracle.appeal_period_blocks) + 1
+    disputes.reads = disputes.writes = 0
+    runtime.call(oracle, "finalize_verdict", dispute_id, sender=PLAINTIFF)
+    assert (disputes.reads, disputes.writes) == (1, 1)
+    assert runtime.call(oracle, "get_dispute", dispute_id, sender=ADMIN)["status"] == "resolved"
+
+
+def test_fast_track_max_stake_is_bounded():
+    runtime, oracle = deploy()
+    with pytest.raises(Exception, match="between 0 and 1000"):
+        runtime.call(oracle, "update_fast_track_max_stake", 1001, sender=ADMIN)
+    runtime.call(oracle, "update_fast_track_max_stake", 1000, sender=ADMIN)
+    runtime.call(oracle, "update_fast_track_max_stake", 0, sender=ADMIN)
+
+    metrics = runtime.call(oracle, "get_metrics", sender=ADMIN)
+    assert metrics["update_fast_track_max_stake.calls"] == 2
+    assert runtime.call(oracle, "get_stats", sender=ADMIN)["fast_track_max_stake"] == 0
+
+
+def test_fast_track_repair_asks_for_the_fast_track_key_factor_count():
+    fast = default_verdict()
+    fast["reasoning"] = " ".join(["The delivered work missed the agreed milestones."] * 15)
+    fast["key_factors"] = ["late delivery"]
+    repair_prompts = []
+
+    def repair(prompt):
+        repair_prompts.append(prompt)
+        return json.dumps({"key_factors": ["late delivery", "missing features"]})
+
+    llm = ScriptedLLM([("failed validation", repair), ("concise 80-150 word explanation", json.dumps(fast))])
+    runtime, oracle = deploy(llm)
+    runtime.call(oracle, "update_fast_track_max_stake", 50, sender=ADMIN)
+    dispute_id = file_and_close(runtime, oracle, stake=10)
+
+    runtime.call(oracle, "resolve_dispute", dispute_id, sender=PLAINTIFF)
+
+    assert runtime.call(oracle, "get_dispute", dispute_id, sender=ADMIN)["resolution_track"] == "fast"
+    assert len(repair_prompts) == 1
+    assert "key_factors: a list of at least 2 key factors" in repair_prompts[0]
+
+
+def test_fast_track_accepts_opinions_longer_than_requested():
+    runtime, oracle = deploy()  # the stock verdict runs to about 300 words
+    runtime.call(oracle, "update_fast_track_uncontested", True, sender=ADMIN)
+    dispute_id = file_and_close(runtime, oracle)
+
+    runtime.stats.reset()
+    runtime.call(oracle, "resolve_dispute", dispute_id, sender=PLAINTIFF)
+
+    assert runtime.call(oracle, "get_dispute", dispute_id, sender=ADMIN)["resolution_track"] == "fast"
+    assert runtime.stats.consensus_rejections == 0
+    assert runtime.stats.prompts == 1
+
+
+def test_uncontested_disputes_take_the_fast_track_until_the_defendant_answers():
+    runtime, oracle = deploy()
+    runtime.call(oracle, "update_fast_track_uncontested", True, sender=ADMIN)
+    urls = ["https://example.com/contract"]
+    uncontested = runtime.call(oracle, "file_dispute", DEFENDANT, CASE, urls, sender=PLAINTIFF, value=10)
+    contested = runtime.call(oracle, "file_dispute", DEFENDANT, CASE, urls, sender=PLAINTIFF, value=10)
+    for dispute_id in (uncontested, contested):
+        runtime.call(oracle, "submit_evidence", dispute_id, "invoice", "Paid in full on 2024-03-01", sender=PLAINTIFF)
+    runtime.call(oracle, "submit_evidence", contested, "testimony", "The client kept changing scope", sender=DEFENDANT)
+    oracle.genesis_block = oracle.genesis_block + int(oracle.evidence_period_blocks) + 1
+
+    runtime.stats.reset()
+    runtime.call(oracle, "resolve_dispute", uncontested, sender=PLAINTIFF)
+    assert runtime.stats.renders == 0
+    runtime.call(oracle, "resolve_dispute", contested, sender=PLAINTIFF)
+    assert runtime.stats.renders == 1
+
+    tracks = [runtime.call(oracle, "get_dispute", i, sender=ADMIN)["resolution_track"] for i in (uncontested, contested)]
+    assert tracks == ["fast", "full"]
+
+
+def test_appeal_clears_the_track_and_forces_the_full_review():
+    runtime, oracle = deploy()
+    runtime.call(oracle, "update_fast_track_uncontested", True, sender=ADMIN)
+    dispute_id = file_and_close(runtime, oracle)
+    runtime.call(oracle, "resolve_dispute", dispute_id, sender=PLAINTIFF)
+
+    runtime.call(oracle, "appeal_verdict", dispute_id, "The verdict ignored the written agreement. " * 4, sender=DEFENDANT)
+    appealed = runtime.call(oracle, "get_dispute", dispute_id, sender=ADMIN)
+    assert (appealed["status"], appealed["resolution_track"], appealed["appealed"]) == ("evidence_gathering", "", True)
+
+    oracle.genesis_block = oracle.genesis_block + int(oracle.evidence_period_blocks) + 1
+    runtime.call(oracle, "resolve_dispute", dispute_id, sender=PLAINTIFF)
+    assert runtime.call(oracle, "get_dispute", dispute_id, sender=ADMIN)["resolution_track"] == "full"
+
+
+def test_evidence_pages_carry_previews_and_read_constant_storage():
+    runtime, oracle = deploy()
+    dispute_id = runtime.call(oracle, "file_dispute", DEFENDANT, CASE, [], sender=PLAINTIFF, value=10)
+    storage = runtime.stats.storage
+    reads = []
+    submitted = 0
+    for size in (10, 120):
+        while submitted < size:
+            content = f"Invoice {submitted}: " + "line item " * (submitted % 3 * 40)
+            runtime.call(oracle, "submit_evidence", dispute_id, "document", content, sender=PLAINTIFF)
+            submitted += 1
+        before = storage.reads
+        runtime.call(oracle, "get_dispute_evidence_page", dispute_id, size - 5, 5, sender=ADMIN)
+        reads.append(storage.reads - before)
+    assert reads[0] == reads[1]
+
+    page = runtime.call(oracle, "get_dispute_evidence_page", dispute_id, 0, 3, sender=ADMIN)
+    assert page["total"] == 120 and [item["evidence_id"] for item in page["evidence"]] == [0, 1, 2]
+    for item in page["evidence"]:
+        full = runtime.call(oracle, "get_evidence", item["evidence_id"], sender=ADMIN)
+        assert item["preview"] == full["content"][:EVIDENCE_PREVIEW_CHARS]
+        assert item["content_length"] == full["content_length"] == len(full["content"])
+        assert item["content_digest"] == full["content_digest"]
+    assert len(page["evidence"][2]["preview"]) == EVIDENCE_PREVIEW_CHARS < page["evidence"][2]["content_length"]
+
+    clamped = runtime.call(oracle, "get_dispute_evidence_page", dispute_id, 10, 500, sender=ADMIN)
+    assert clamped["limit"] == 100 and [item["evidence_id"] for item in clamped["evidence"]] == list(range(10, 110))
+    past_end = runtime.call(oracle, "get_dispute_evidence_page", dispute_id, 200, 10, sender=ADMIN)
+    assert past_end["evidence"] == [] and past_end["total"] == 120
@@ -0,0 +1,63 @@
+import asyncio
+from collections import Counter
+
+from conftest import contract_source
+from justice_client import JusticeOracleClient, RpcClient
+from justice_client.loadgen import RpcTarget, build_plan, drive
+from justice_client.stub_server import StubNode
+
+
+class RemoteNode(StubNode):
+    def net_version(self, params) -> str:
+        return "studio"
+
+
+def test_rpc_target_restores_windows_and_reports_actual_lifecycle(stub_server):
+    server = stub_server()
+    plan = build_plan(24, (0, 2), 0.7, 0.3, 0.5, seed=3)
+
+    async def scenario():
+        async with RpcClient(server.url) as rpc:
+            address = (await rpc.deploy_contract(contract_source()))["address"]
+            target = RpcTarget(server.url, address)
+            await target.setup()
+            try:
+                report = await drive(target, plan, concurrency=8)
+            finally:
+                await target.close()
+            oracle = JusticeOracleClient(rpc, address)
+            return report, await oracle.get_disputes(list(range(len(plan)))), await oracle.get_stats()
+
+    report, disputes, stats = asyncio.run(scenario())
+    assert stats["evidence_period_blocks"] == 50400
+    assert stats["appeal_period_blocks"] == 21600
+
+    lifecycle = report["lifecycle"]
+    statuses = Counter(dispute["status"] for dispute in disputes)
+    assert lifecycle["filed"] == len(disputes)
+    assert lifecycle["evidence_items"] == stats["total_evidence_submitted"]
+    for state in ("evidence_gathering", "resolved_pending_appeal", "resolved"):
+        assert lifecycle[state] == statuses[state]
+    appeals = report["methods"]["appeal_verdict"]
+    assert lifecycle["appealed"] == appeals["calls"] - appeals["errors"] > 0
+
+
+def test_rpc_target_without_clock_control_skips_resolution_phases(stub_server):
+    server = stub_server(RemoteNode())
+    plan = build_plan(12, (1, 2), 0.7, 0.3, 0.5, seed=3)
+
+    async def scenario():
+        target = RpcTarget(server.url)
+        await target.setup()
+        try:
+            return target.controls_clock, await drive(target, plan, concurrency=4)
+        finally:
+            await target.close()
+
+    controls_clock, report = asyncio.run(scenario())
+    assert not controls_clock
+    assert report["skipped_phases"] == ["resolve_dispute", "appeal_verdict", "finalize_verdict"]
+    assert [phase["phase"] for phase in report["phases"]] == ["file_dispute", "submit_evidence", "reads"]
+    assert report["lifecycle"]["filed"] == report["lifecycle"]["evidence_gathering"] == len(plan)
+    assert report["lifecycle"]["evidence_items"] == sum(len(spec["evidence"]) for spec in plan)
+    assert server.node.requests["stub_advance_clock"] == 0
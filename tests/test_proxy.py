@@ -0,0 +1,109 @@
+import asyncio
+import json
+
+from justice_client.proxy import ReadProxy
+
+CONTRACT = "0x" + "cc" * 20
+OTHER = "0x" + "dd" * 20
+
+
+class ScriptedProxy(ReadProxy):
+    """ReadProxy whose upstream is a function of the request"""
+
+    def __init__(self, upstream_fn, **kwargs):
+        super().__init__("http://upstream.invalid", **kwargs)
+        self.upstream_fn = upstream_fn
+
+    async def _forward(self, request: dict) -> dict:
+        self.upstream_requests += 1
+        return await self.upstream_fn(request)
+
+
+def read(address: str, method: str, args=(), request_id=1) -> dict:
+    return {"jsonrpc": "2.0", "id": request_id, "method": "gl_readContract",
+            "params": [{"address": address, "method": method, "args": list(args)}]}
+
+
+async def echo_upstream(request: dict) -> dict:
+    if request["method"] == "gl_readContract":
+        call = request["params"][0]
+        return {"jsonrpc": "2.0", "id": request["id"], "result": [call["address"], call["method"]]}
+    return {"jsonrpc": "2.0", "id": request["id"], "result": "0x" + "ab" * 32}
+
+
+def test_signed_transaction_invalidates_contract_reads():
+    proxy = ScriptedProxy(echo_upstream)
+
+    async def scenario():
+        await proxy.dispatch(read(CONTRACT, "get_dispute", [0]))
+        await proxy.dispatch(read(OTHER, "get_stats"))
+        await proxy.dispatch({"jsonrpc": "2.0", "id": 2, "method": "net_version", "params": []})
+
+        await proxy.dispatch({"jsonrpc": "2.0", "id": 3, "method": "eth_sendTransaction",
+                              "params": [{"to": CONTRACT, "data": "0x00"}]})
+        assert proxy.cache.get((CONTRACT, "get_dispute", json.dumps([0]))) is None
+        assert proxy.cache.get((OTHER, "get_stats", json.dumps([]))) is not None
+
+        await proxy.dispatch({"jsonrpc": "2.0", "id": 4, "method": "eth_sendRawTransaction", "params": ["0xf86c"]})
+        assert proxy.cache.get((OTHER, "get_stats", json.dumps([]))) is None
+        assert proxy.cache.get(("net_version",)) is not None
+
+    asyncio.run(scenario())
+    assert proxy.stats()["pending_writes"] == 1  # both submissions return the same hash
+
+
+def test_unexpected_upstream_failure_reaches_coalesced_readers():
+    release = None
+
+    async def broken_upstream(request: dict) -> dict:
+        await release.wait()
+        raise json.JSONDecodeError("Expecting value", "<html>", 0)
+
+    proxy = ScriptedProxy(broken_upstream)
+
+    async def scenario():
+        nonlocal release
+        release = asyncio.Event()
+        readers = [asyncio.ensure_future(proxy.dispatch(read(CONTRACT, "get_stats", request_id=i))) for i in range(3)]
+        await asyncio.sleep(0)
+        release.set()
+        return await asyncio.gather(*readers)
+
+    replies = asyncio.run(scenario())
+    assert [reply["id"] for reply in replies] == [0, 1, 2]
+    assert all("Expecting value" in reply["error"]["message"] for reply in replies)
+    assert proxy.coalesced == 2 and proxy.upstream_requests == 1
+    assert len(proxy.cache) == 0
+
+
+def test_pending_writes_expire_and_are_capped():
+    now = [0.0]
+    hashes = iter(f"0x{n:064x}" for n in range(1000))
+
+    async def upstream(request: dict) -> dict:
+        if request["method"] == "eth_getTransactionByHash":
+            return {"jsonrpc": "2.0", "id": request["id"], "result": {"status": "FINALIZED"}}
+        return {"jsonrpc": "2.0", "id": request["id"], "result": next(hashes)}
+
+    proxy = ScriptedProxy(upstream, pending_ttl=60.0, max_pending=3, clock=lambda: now[0])
+
+    def write(i: int) -> dict:
+        return {"jsonrpc": "2.0", "id": i, "method": "gl_writeContract",
+                "params": [{"address": CONTRACT, "method": "submit_evidence", "args": [i, "document", "x"]}]}
+
+    async def scenario():
+        for i in range(5):
+            await proxy.dispatch(write(i))
+        assert proxy.stats()["pending_writes"] == 3
+        assert proxy.stats()["pending_dropped"] == 2
+
+        now[0] = 61.0
+        await proxy.dispatch(write(5))
+        assert proxy.stats()["pending_writes"] == 1
+        assert proxy.stats()["pending_dropped"] == 5
+
+        last = next(iter(proxy._pending_writes))
+        await proxy.dispatch({"jsonrpc": "2.0", "id": 9, "method": "eth_getTransactionByHash", "params": [last]})
+        assert proxy.stats()["pending_writes"] == 0
+
+    asyncio.run(scenario())
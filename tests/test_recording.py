@@ -0,0 +1,72 @@
+import json
+
+import pytest
+
+from conftest import ADMIN, CASE, DEFENDANT, PLAINTIFF
+from genlayer_local import Cassette, FixtureMiss, RecordedError, Runtime, ScriptedLLM, StaticWeb, load_contract
+
+URLS = ["https://example.com/contract", "https://example.com/missing"]
+
+
+def resolve_with(cassette: Cassette, llm=None, web=None) -> tuple:
+    """File, close and resolve one dispute through `cassette`; returns (dispute record, runtime)"""
+    runtime = Runtime(llm=cassette.llm(llm), web=cassette.web(web))
+    oracle = runtime.deploy(load_contract().JusticeOracle, sender=ADMIN)
+    dispute_id = runtime.call(oracle, "file_dispute", DEFENDANT, CASE, URLS, sender=PLAINTIFF, value=10)
+    oracle.genesis_block = oracle.genesis_block + int(oracle.evidence_period_blocks) + 1
+    runtime.call(oracle, "resolve_dispute", dispute_id, sender=PLAINTIFF)
+    return runtime.call(oracle, "get_dispute", dispute_id, sender=ADMIN), runtime
+
+
+def test_record_then_replay_returns_identical_responses(tmp_path):
+    path = tmp_path / "fixtures.json"
+    web = StaticWeb({URLS[0]: "Signed agreement: three milestones due by March."}, default=None)
+    recorder = Cassette(path, mode="record")
+    recorded, _ = resolve_with(recorder, ScriptedLLM(), web)
+    recorder.save()
+    assert (recorder.hits, recorder.misses, recorder.recorded) == (0, 0, 3)
+
+    saved = json.loads(path.read_text())
+    assert [entry["error"] for entry in saved["web"].values() if "error" in entry] == [f"No page stubbed for {URLS[1]}"]
+
+    player = Cassette(path, mode="replay")
+    replayed, runtime = resolve_with(player)
+    assert replayed == recorded
+    assert (player.hits, player.misses, player.recorded) == (3, 0, 0)
+    assert runtime.stats.consensus_rejections == 0
+
+
+def test_recorded_error_replays_as_recorded_error(tmp_path):
+    path = tmp_path / "fixtures.json"
+    recorder = Cassette(path, mode="record")
+    with pytest.raises(Exception, match="No page stubbed"):
+        recorder.web(StaticWeb(default=None))(URLS[1])
+    recorder.save()
+
+    player = Cassette(path, mode="replay")
+    with pytest.raises(RecordedError, match="No page stubbed"):
+        player.web()(URLS[1])
+    assert player.summary()["hits"] == 1
+
+
+def test_replay_miss_escapes_consensus_without_a_rejection(tmp_path):
+    player = Cassette(tmp_path / "empty.json", mode="replay")
+    runtime = Runtime(llm=player.llm(), web=player.web())
+    oracle = runtime.deploy(load_contract().JusticeOracle, sender=ADMIN)
+    dispute_id = runtime.call(oracle, "file_dispute", DEFENDANT, CASE, [], sender=PLAINTIFF, value=10)
+    oracle.genesis_block = oracle.genesis_block + int(oracle.evidence_period_blocks) + 1
+
+    runtime.stats.reset()
+    with pytest.raises(FixtureMiss):
+        runtime.call(oracle, "resolve_dispute", dispute_id, sender=PLAINTIFF)
+    assert runtime.stats.consensus_rounds == 1
+    assert runtime.stats.consensus_rejections == 0
+    assert player.misses == 1
+    assert runtime.call(oracle, "get_dispute", dispute_id, sender=ADMIN)["status"] == "evidence_gathering"
+
+
+def test_seed_demo_data_replays_without_misses(capsys):
+    import seed_demo_data
+
+    seed_demo_data.run_local(record=False)
+    assert "16 hits, 0 misses, 0 recorded" in capsys.readouterr().out
@@ -0,0 +1,103 @@
+import asyncio
+
+import pytest
+
+from conftest import ADMIN, CASE, DEFENDANT, PLAINTIFF, contract_source
+from justice_client import JusticeOracleClient, RpcClient, RpcError
+from justice_client.stub_server import StubNode
+
+import seed_demo_data
+
+
+async def deploy(rpc: RpcClient) -> str:
+    return (await rpc.deploy_contract(contract_source()))["address"]
+
+
+def test_batch_and_read_many_keep_request_order(stub_server):
+    server = stub_server()
+
+    async def scenario():
+        async with RpcClient(server.url) as rpc:
+            address = await deploy(rpc)
+            oracle = JusticeOracleClient(rpc, address, PLAINTIFF)
+            ids = await oracle.write_many([("file_dispute", [DEFENDANT, f"{CASE} #{i}", []], 10) for i in range(3)])
+
+            disputes = await rpc.read_many(address, [("get_dispute", [i]) for i in reversed(ids)])
+            assert [d["dispute_id"] for d in disputes] == list(reversed(ids))
+
+            results = await rpc.batch(
+                [("gl_readContract", [{"address": address, "method": "get_stats", "args": []}]),
+                 ("no_such_method", [])],
+                return_exceptions=True,
+            )
+            assert results[0]["total_disputes"] == 3
+            assert isinstance(results[1], RpcError)
+            with pytest.raises(RpcError):
+                await rpc.batch([("no_such_method", [])])
+
+    asyncio.run(scenario())
+    assert server.node.requests["gl_readContract"] == 4  # three get_dispute + get_stats, in two HTTP requests
+
+
+def test_transact_many_polls_until_receipts_are_final(stub_server):
+    server = stub_server(StubNode(receipt_delay=0.3))
+
+    async def scenario():
+        async with RpcClient(server.url) as rpc:
+            address = await deploy(rpc)
+            writes = [("file_dispute", [DEFENDANT, CASE, []], 10)] * 4
+            receipts = await rpc.transact_many(address, writes, sender=PLAINTIFF, timeout=10)
+            return receipts
+
+    receipts = asyncio.run(scenario())
+    assert all(receipt["status"] == "FINALIZED" for receipt in receipts)
+    assert sorted(receipt["result"] for receipt in receipts) == [0, 1, 2, 3]
+    # Each receipt was PENDING at least once before it finalized
+    assert server.node.requests["eth_getTransactionByHash"] > len(receipts)
+
+
+def test_failed_write_is_an_error_and_leaves_no_state(stub_server):
+    server = stub_server()
+
+    async def scenario():
+        async with RpcClient(server.url) as rpc:
+            oracle = JusticeOracleClient(rpc, await deploy(rpc), PLAINTIFF)
+            with pytest.raises(RpcError, match="Invalid address"):
+                await oracle.file_dispute("0xbad", CASE, [], stake=10)
+            return await oracle.get_stats()
+
+    assert asyncio.run(scenario())["total_disputes"] == 0
+
+
+def test_seed_rpc_without_admin_leaves_disputes_open(stub_server):
+    server = stub_server()
+
+    async def scenario():
+        async with RpcClient(server.url) as rpc:
+            address = await deploy(rpc)
+        ids = await seed_demo_data.seed_rpc(server.url, address, PLAINTIFF, 10)
+        async with RpcClient(server.url) as rpc:
+            return await JusticeOracleClient(rpc, address).get_disputes(ids)
+
+    disputes = asyncio.run(scenario())
+    assert len(disputes) == len(seed_demo_data.SCENARIOS)
+    assert {d["status"] for d in disputes} == {"evidence_gathering"}
+
+
+def test_seed_rpc_with_admin_resolves_and_restores_window(stub_server):
+    server = stub_server()
+
+    async def scenario():
+        async with RpcClient(server.url) as rpc:
+            address = await deploy(rpc)
+        ids = await seed_demo_data.seed_rpc(server.url, address, PLAINTIFF, 10, admin=ADMIN)
+        async with RpcClient(server.url) as rpc:
+            oracle = JusticeOracleClient(rpc, address)
+            return await oracle.get_disputes(ids), await oracle.get_evidence_for(ids), await oracle.get_stats()
+
+    disputes, evidence, stats = asyncio.run(scenario())
+    for dispute, items, scenario_spec in zip(disputes, evidence, seed_demo_data.SCENARIOS):
+        expected = "resolved_pending_appeal" if scenario_spec["resolve"] else "evidence_gathering"
+        assert dispute["status"] == expected
+        assert len(items) == len(scenario_spec["evidence"])
+    assert stats["evidence_period_blocks"] == 50400